@@ -0,0 +1,115 @@
+"""In-memory character name and owner index for Fable."""
+import asyncio
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import discord
+from redbot.core import Config
+
+
+class _GuildCharacters:
+    """A guild's character names, with each one's owner and the names each owner has."""
+
+    __slots__ = ("owners", "by_owner")
+
+    def __init__(self, characters: Dict[str, Dict]):
+        self.owners: Dict[str, Optional[str]] = {}
+        self.by_owner: Dict[str, Set[str]] = {}
+        for name, data in characters.items():
+            self.add(name, (data or {}).get("owner_id"))
+
+    def add(self, name: str, owner_id: Optional[str]) -> None:
+        self.discard(name)
+        self.owners[name] = owner_id
+        if owner_id is not None:
+            self.by_owner.setdefault(owner_id, set()).add(name)
+
+    def discard(self, name: str) -> None:
+        owner_id = self.owners.pop(name, None)
+        owned = self.by_owner.get(owner_id) if owner_id is not None else None
+        if owned is not None:
+            owned.discard(name)
+            if not owned:
+                del self.by_owner[owner_id]
+
+
+class CharacterIndex:
+    """
+    Caches each guild's character names and who owns them.
+
+    A guild's characters are read from Config the first time they're needed
+    and then kept up to date by the commands that create and delete
+    characters, so checking which names exist or listing a user's characters
+    needs no Config reads.
+
+    Parameters
+    ----------
+    config: Config
+        The cog's Config, with a ``characters`` guild value
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self._guilds: Dict[int, _GuildCharacters] = {}
+        self._loading: Dict[int, asyncio.Lock] = {}
+        # Creates and deletes seen while a guild's first load is reading Config
+        self._queued: Dict[int, List[Tuple[str, Optional[str], bool]]] = {}
+
+    async def _get(self, guild: discord.Guild) -> _GuildCharacters:
+        """Get a guild's index, loading it on first use."""
+        index = self._guilds.get(guild.id)
+        if index is not None:
+            return index
+        lock = self._loading.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            index = self._guilds.get(guild.id)
+            if index is None:
+                queued = self._queued[guild.id] = []
+                try:
+                    characters = await self.config.guild(guild).characters()
+                finally:
+                    current = self._queued.pop(guild.id, None)
+                index = _GuildCharacters(characters or {})
+                # Replay changes made during the read; they may or may not be in it
+                for name, owner_id, created in queued:
+                    if created:
+                        index.add(name, owner_id)
+                    else:
+                        index.discard(name)
+                if current is queued:
+                    # Not invalidated mid-read, so it's safe to keep
+                    self._guilds[guild.id] = index
+        return index
+
+    async def names(self, guild: discord.Guild) -> Set[str]:
+        """Get the names of a guild's characters."""
+        return set((await self._get(guild)).owners)
+
+    async def owned_by(self, guild: discord.Guild, owner_id: str) -> Set[str]:
+        """Get the names of the characters a user owns."""
+        return set((await self._get(guild)).by_owner.get(owner_id, ()))
+
+    async def missing(self, guild: discord.Guild, names: Iterable[str]) -> List[str]:
+        """Return the given names that aren't characters in the guild, in order."""
+        known = (await self._get(guild)).owners
+        return [name for name in names if name not in known]
+
+    def add(self, guild_id: int, name: str, owner_id: Optional[str]) -> None:
+        """Record a newly created character."""
+        index = self._guilds.get(guild_id)
+        if index is not None:
+            index.add(name, owner_id)
+        elif guild_id in self._queued:
+            self._queued[guild_id].append((name, owner_id, True))
+
+    def discard(self, guild_id: int, name: str) -> None:
+        """Record a deleted character."""
+        index = self._guilds.get(guild_id)
+        if index is not None:
+            index.discard(name)
+        elif guild_id in self._queued:
+            self._queued[guild_id].append((name, None, False))
+
+    def invalidate(self, guild_id: int) -> None:
+        """Forget a guild's index so it's reloaded, e.g. after a migration or import."""
+        self._guilds.pop(guild_id, None)
+        self._queued.pop(guild_id, None)
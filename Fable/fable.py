@@ -1,10 +1,17 @@
 from redbot.core import commands, Config
 import discord
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 import aiohttp
 from Fable.google_sync_utils import (
-    export_to_sheet, import_to_sheet, export_to_doc, import_from_doc
+    export_to_sheet, import_from_sheet, export_to_doc, import_from_doc
 )
+from .visit_log import VisitLog
+from .character_index import CharacterIndex
+from .style_utils import PaginationView
+from .timeline_utils import (
+    TimelineIndex, event_entry, milestone_entry, relationship_entry, visit_entry
+)
+import asyncio
 import importlib.util
 import subprocess
 import sys
@@ -35,6 +42,12 @@ class Fable(commands.Cog):
             "story_arcs": {},  # New story arcs system
             "milestones": {},  # Character development milestones
             "relationship_history": {},  # Enhanced relationship tracking
+            "visit_log": {"next_id": 1, "first_id": 1, "segments": {}},  # Append-only location visits
+            "visit_index": {"character": {}, "location": {}},  # Visit IDs per character/location
+            "visit_retention_days": 0,  # 0 keeps visits forever
+            "timeline": {},  # Per-character timeline entries, sorted by date
+            "events": {},  # Logged events keyed by ID
+            "next_event_id": 0,  # 0 until seeded from existing events
             "mail": {},
             "sync": {},
             "settings": {
@@ -57,9 +70,32 @@ class Fable(commands.Cog):
             "mail_expiry_days": 30,
         }
         self.config.register_guild(**default_guild)
+        self.visits = VisitLog(self.config)
+        self.timeline = TimelineIndex(self.config, self.visits)
+        # Visits dropped by retention come off the character timelines too
+        self.visits.on_compact = self.timeline.remove_visits
+        self.character_index = CharacterIndex(self.config)
+        self._event_id_locks: Dict[int, asyncio.Lock] = {}
         
     async def cog_load(self):
         await ensure_google_apis()
+
+    async def _allocate_event_id(self, guild: discord.Guild) -> int:
+        """
+        Reserve the next event ID for a guild.
+
+        IDs come from a stored counter, seeded once from the highest existing
+        event ID, and are handed out under a per-guild lock so concurrent
+        ``event log`` commands never share an ID.
+        """
+        lock = self._event_id_locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            event_id = await self.config.guild(guild).next_event_id()
+            if not event_id:
+                events = await self.config.guild(guild).events() or {}
+                event_id = max([int(eid) for eid in events] or [0]) + 1
+            await self.config.guild(guild).next_event_id.set(event_id + 1)
+        return event_id
         
     @commands.hybrid_group(name="fable", description="A living world tracker for character-driven RP groups.")
     async def fable(self, ctx: commands.Context):
@@ -277,6 +313,7 @@ class Fable(commands.Cog):
         }
         
         await self.config.guild(guild).characters.set_raw(name, value=character_data)
+        self.character_index.add(guild.id, name, user_id)
         
         # Create embed with sections
         embed = discord.Embed(
@@ -615,21 +652,15 @@ class Fable(commands.Cog):
         [p]fable character list @User
         """
         guild = ctx.guild
-        all_names = await self.config.guild(guild).characters.get_attr("").get_raw()
-        filtered = []
         if user:
-            user_id = str(user.id)
-            for name in all_names:
-                char = await self.config.guild(guild).characters.get_raw(name, default=None)
-                if char and char.get("owner_id") == user_id:
-                    filtered.append(char)
+            names = await self.character_index.owned_by(guild, str(user.id))
             title = f"Characters for {user.display_name}"
         else:
-            for name in all_names:
-                char = await self.config.guild(guild).characters.get_raw(name, default=None)
-                if char:
-                    filtered.append(char)
+            names = await self.character_index.names(guild)
             title = f"All Characters in {guild.name}"
+        # One read for every character; pages are built from it as they're shown
+        characters = await self.config.guild(guild).characters() if names else {}
+        filtered = [characters[name] for name in sorted(names, key=str.lower) if characters.get(name)]
         if not filtered:
             embed = discord.Embed(
                 title="No Characters Found",
@@ -638,13 +669,15 @@ class Fable(commands.Cog):
             )
             await ctx.send(embed=embed)
             return
-        pages = [filtered[i:i+10] for i in range(0, len(filtered), 10)]
-        for idx, page in enumerate(pages, 1):
+        per_page = 10
+        page_count = (len(filtered) + per_page - 1) // per_page
+
+        def render_page(idx: int) -> discord.Embed:
             embed = discord.Embed(
-                title=title + (f" (Page {idx}/{len(pages)})" if len(pages) > 1 else ""),
+                title=title + (f" (Page {idx + 1}/{page_count})" if page_count > 1 else ""),
                 color=0x7289DA
             )
-            for char in page:
+            for char in filtered[idx * per_page:(idx + 1) * per_page]:
                 owner = guild.get_member(int(char["owner_id"]))
                 owner_name = owner.display_name if owner else f"<@{char['owner_id']}>"
                 desc = char["description"]
@@ -654,7 +687,13 @@ class Fable(commands.Cog):
                     inline=False
                 )
             embed.set_footer(text="Fable RP Tracker • Character List", icon_url="https://cdn-icons-png.flaticon.com/512/3336/3336643.png")
-            await ctx.send(embed=embed)
+            return embed
+
+        if page_count == 1:
+            await ctx.send(embed=render_page(0))
+            return
+        view = PaginationView(ctx, render_page, page_count=page_count)
+        await ctx.send(embed=view.get_page(0), view=view)
 
     @character.command(name="delete", description="Delete a character profile.")
     @commands.guild_only()
@@ -687,6 +726,8 @@ class Fable(commands.Cog):
             await ctx.send(embed=embed)
             return
         await self.config.guild(guild).characters.clear_raw(name)
+        self.character_index.discard(guild.id, name)
+        await self.timeline.forget(guild, name)
         embed = discord.Embed(
             title="🗑️ Character Deleted",
             description=f"The character **{name}** has been deleted.",
@@ -712,8 +753,134 @@ class Fable(commands.Cog):
             await self.config.guild(guild).characters.set_raw(name, value=data)
             migrated += 1
         await self.config.guild(guild).characters.set({})
+        self.character_index.invalidate(guild.id)
         await ctx.send(f"✅ Migrated {migrated} characters to per-object storage.")
 
+    @fable.command(name="migrate", description="Migrate relationship, location and milestone data to per-object storage (admin only)")
+    @commands.guild_only()
+    @commands.has_permissions(administrator=True)
+    async def world_migrate(self, ctx: commands.Context):
+        """
+        Migrate relationship history, locations and milestones to per-object storage.
+        These are now read and written one entry at a time, so each entry must be
+        keyed by name and have the lists the commands update. Visits stored inside
+        locations are moved to the visit log. Safe to run more than once.
+        """
+        guild = ctx.guild
+        group = self.config.guild(guild)
+        migrated = {"locations": 0, "milestones": 0, "relationship histories": 0}
+
+        skipped = []
+        migrated["locations"], migrated["visits"] = await self._migrate_locations(guild, skipped)
+
+        for attr, label in (("milestones", "milestones"), ("relationship_history", "relationship histories")):
+            value = group.get_attr(attr)
+            entries = await value()
+            if isinstance(entries, list):
+                # Imported data may be a flat list; it can only be keyed if every entry says whose it is
+                keyed = {}
+                for entry in entries:
+                    key = self._legacy_entry_key(attr, entry)
+                    if key is None:
+                        keyed = None
+                        break
+                    keyed.setdefault(key, []).append(entry)
+                if keyed is None:
+                    skipped.append(label)
+                    continue
+                await value.set(keyed)
+                migrated[label] += len(keyed)
+                continue
+            if not isinstance(entries, dict):
+                skipped.append(label)
+                continue
+            for key, entry in entries.items():
+                if isinstance(entry, dict):
+                    await value.set_raw(key, value=[entry])
+                    migrated[label] += 1
+                elif not isinstance(entry, list):
+                    skipped.append(f"{label} for {key}")
+
+        summary = ", ".join(f"{count} {label}" for label, count in migrated.items())
+        entries = await self.timeline.rebuild(guild)
+        message = f"✅ Migrated {summary} to per-object storage and rebuilt {entries} timeline entries."
+        if skipped:
+            message += (
+                f"\n⚠️ Left {' and '.join(skipped)} unchanged: the stored data isn't in a format "
+                "that can be migrated. Nothing was deleted."
+            )
+        await ctx.send(message)
+
+    async def _migrate_locations(self, guild: discord.Guild, skipped: List[str]) -> Tuple[int, int]:
+        """
+        Key locations by name, give them the lists the commands update, and move
+        visits stored inside them to the visit log.
+
+        Data that can't be migrated is left as is and described in ``skipped``.
+
+        Returns
+        -------
+        Tuple[int, int]
+            Number of locations rewritten and visits moved to the log
+        """
+        group = self.config.guild(guild)
+        locations = await group.locations()
+        if isinstance(locations, list):
+            # Imported data may be a list of locations rather than a name-keyed mapping
+            if all(isinstance(loc, dict) and loc.get("name") for loc in locations):
+                locations = {loc["name"]: loc for loc in locations}
+                await group.locations.set(locations)
+                changed = set(locations)
+            else:
+                skipped.append("locations")
+                locations, changed = {}, set()
+        elif isinstance(locations, dict):
+            changed = set()
+        else:
+            skipped.append("locations")
+            locations, changed = {}, set()
+        legacy_visits = []
+        for name, data in locations.items():
+            if not isinstance(data, dict):
+                skipped.append(f"location {name}")
+                continue
+            for key in ("events", "connected_to"):
+                if not isinstance(data.get(key), list):
+                    data[key] = []
+                    changed.add(name)
+            # Visits used to be stored inside each location; move them to the visit log
+            if "visits" in data:
+                for visit in data["visits"] or []:
+                    if isinstance(visit, dict) and visit.get("character"):
+                        legacy_visits.append((name, visit))
+                changed.add(name)
+        # Log the visits before stripping them from their locations, so an
+        # interrupted run never loses any
+        legacy_visits.sort(key=lambda item: item[1].get("timestamp") or "")
+        for name, visit in legacy_visits:
+            await self.visits.append(
+                guild, visit["character"], name, visit.get("note"),
+                visit.get("recorded_by", ""), timestamp=visit.get("timestamp")
+            )
+        for name in changed:
+            locations[name].pop("visits", None)
+            await group.locations.set_raw(name, value=locations[name])
+        return len(changed), len(legacy_visits)
+
+    def _legacy_entry_key(self, attr: str, entry) -> Optional[str]:
+        """Get the character name or ``"A|B"`` key a listed milestone or relationship history entry belongs to."""
+        if not isinstance(entry, dict):
+            return None
+        if attr == "milestones":
+            return entry.get("character") or None
+        rel_key = entry.get("relationship") or entry.get("key")
+        if isinstance(rel_key, str) and "|" in rel_key:
+            return rel_key
+        characters = entry.get("characters")
+        if isinstance(characters, list) and len(characters) == 2 and all(characters):
+            return f"{characters[0]}|{characters[1]}"
+        return None
+
     @fable.command(name="relations", description="Show all relationships for a character.")
     @commands.guild_only()
     @commands.cooldown(1, 5, commands.BucketType.user)
@@ -796,9 +963,8 @@ class Fable(commands.Cog):
         """
         guild = ctx.guild
         user = ctx.author
-        characters = await self.config.guild(guild).characters()
-        char1 = characters.get(character1)
-        char2 = characters.get(character2)
+        char1 = await self.config.guild(guild).characters.get_raw(character1, default=None)
+        char2 = await self.config.guild(guild).characters.get_raw(character2, default=None)
         
         if not char1 or not char2:
             await ctx.send("❌ Both characters must exist to set a relationship.")
@@ -824,31 +990,28 @@ class Fable(commands.Cog):
             "updated_by": str(user.id)
         }
 
-        # Update relationship history
-        history = await self.config.guild(guild).relationship_history()
-        rel_key = f"{character1}|{character2}"
-        if rel_key not in history:
-            history[rel_key] = []
-        
         # Add to history before updating current relationship
-        if rel_key in characters.get(character1, {}).get("relationships", {}):
-            old_rel = characters[character1]["relationships"][rel_key]
-            history[rel_key].append({
+        rel_key = f"{character1}|{character2}"
+        old_rel = char1.get("relationships", {}).get(rel_key)
+        if old_rel:
+            history = await self.config.guild(guild).relationship_history.get_raw(rel_key, default=[])
+            history.append({
                 "type": old_rel.get("type", "unknown"),
                 "intensity": old_rel.get("intensity", 1),
                 "description": old_rel.get("description", ""),
                 "start_date": old_rel.get("updated_at", ""),
                 "end_date": discord.utils.utcnow().isoformat()
             })
+            await self.config.guild(guild).relationship_history.set_raw(rel_key, value=history)
 
-        # Update current relationships
-        if "relationships" not in char1:
-            char1["relationships"] = {}
-        char1["relationships"][rel_key] = relationship_data
-        characters[character1] = char1
-        
-        await self.config.guild(guild).characters.set(characters)
-        await self.config.guild(guild).relationship_history.set(history)
+        # Update only this pair's entry on the first character
+        await self.config.guild(guild).characters.set_raw(
+            character1, "relationships", rel_key, value=relationship_data
+        )
+        await self.timeline.add(
+            guild, {character1, character2},
+            relationship_entry(rel_key, relationship_data, relationship_data["updated_at"])
+        )
 
         embed = discord.Embed(
             title="👥 Relationship Updated",
@@ -885,8 +1048,7 @@ class Fable(commands.Cog):
             Second character's name
         """
         guild = ctx.guild
-        characters = await self.config.guild(guild).characters()
-        char1 = characters.get(character1)
+        char1 = await self.config.guild(guild).characters.get_raw(character1, default=None)
         
         if not char1:
             await ctx.send(f"❌ Character '{character1}' not found.")
@@ -914,10 +1076,10 @@ class Fable(commands.Cog):
         )
 
         # Relationship history
-        history = await self.config.guild(guild).relationship_history()
-        if rel_key in history and history[rel_key]:
+        history = await self.config.guild(guild).relationship_history.get_raw(rel_key, default=[])
+        if history:
             history_text = ""
-            for past_rel in reversed(history[rel_key][-3:]):  # Show last 3 changes
+            for past_rel in reversed(history[-3:]):  # Show last 3 changes
                 start_date = discord.utils.parse_time(past_rel['start_date'])
                 end_date = discord.utils.parse_time(past_rel['end_date'])
                 history_text += f"**{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}**\n"
@@ -972,16 +1134,9 @@ class Fable(commands.Cog):
         """
         guild = ctx.guild
         user = ctx.author
-        all_characters = await self.config.guild(guild).characters.get_attr("").get_raw()
-        char_names = [c.strip() for c in characters.split(",") if c.strip()]
-        involved = []
-        missing = []
-        for cname in char_names:
-            char = await self.config.guild(guild).characters.get_raw(cname, default=None)
-            if char:
-                involved.append(cname)
-            else:
-                missing.append(cname)
+        char_names = list(dict.fromkeys(c.strip() for c in characters.split(",") if c.strip()))
+        missing = await self.character_index.missing(guild, char_names)
+        involved = [cname for cname in char_names if cname not in set(missing)]
         if not involved:
             embed = discord.Embed(
                 title="❌ No Valid Characters",
@@ -997,8 +1152,7 @@ class Fable(commands.Cog):
                 color=0xFAA61A
             )
             await ctx.send(embed=embed)
-        all_events = await self.config.guild(guild).events.get_attr("").get_raw()
-        event_id = (max([int(eid) for eid in all_events] or [0]) + 1)
+        event_id = await self._allocate_event_id(guild)
         event_data = {
             "id": event_id,
             "description": description,
@@ -1008,6 +1162,7 @@ class Fable(commands.Cog):
             "characters": involved
         }
         await self.config.guild(guild).events.set_raw(str(event_id), value=event_data)
+        await self.timeline.add(guild, involved, event_entry(event_data))
         embed = discord.Embed(
             title="Event Logged",
             description=description,
@@ -1037,6 +1192,8 @@ class Fable(commands.Cog):
             await self.config.guild(guild).events.set_raw(eid, value=event)
             migrated += 1
         await self.config.guild(guild).logs.set([])
+        # Reseed the ID counter so new events start after the migrated ones
+        await self.config.guild(guild).next_event_id.clear()
         await ctx.send(f"✅ Migrated {migrated} events to per-object storage.")
 
     @event.command(name="edit", description="Edit an event's description.")
@@ -1071,6 +1228,9 @@ class Fable(commands.Cog):
             return
         event["description"] = new_description
         await self.config.guild(guild).events.set_raw(str(event_id), value=event)
+        await self.timeline.update(
+            guild, event.get("characters", []), f"event:{event_id}", description=new_description
+        )
         embed = discord.Embed(
             title="Event Updated",
             description=f"Event {event_id} description updated.",
@@ -1111,6 +1271,7 @@ class Fable(commands.Cog):
             await ctx.send(embed=embed)
             return
         await self.config.guild(guild).events.clear_raw(str(event_id))
+        await self.timeline.remove(guild, event.get("characters", []), f"event:{event_id}")
         embed = discord.Embed(
             title="🗑️ Event Deleted",
             description=f"Event {event_id} has been deleted.",
@@ -1252,7 +1413,8 @@ class Fable(commands.Cog):
         character: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        event_type: Optional[str] = None
+        event_type: Optional[str] = None,
+        page: int = 1
     ):
         """
         View a character's timeline with optional filters.
@@ -1266,68 +1428,38 @@ class Fable(commands.Cog):
         end_date: Optional[str]
             Filter events before this date (YYYY-MM-DD)
         event_type: Optional[str]
-            Filter by event type (milestone/relationship/story/etc)
+            Filter by event type (milestone/relationship/story/location/event)
+        page: int
+            Page of the timeline to show
         """
         from .visualization_utils import create_timeline_embed
 
         guild = ctx.guild
-        events = []
-
-        # Collect milestone events
-        milestones = await self.config.guild(guild).milestones()
-        char_milestones = milestones.get(character, [])
-        for milestone in char_milestones:
-            events.append({
-                "type": "Milestone",
-                "title": milestone["title"],
-                "description": milestone["description"],
-                "date": milestone["date"]
-            })
-
-        # Collect relationship events
-        history = await self.config.guild(guild).relationship_history()
-        for rel_key, rel_history in history.items():
-            if character in rel_key:
-                for rel in rel_history:
-                    events.append({
-                        "type": "Relationship",
-                        "title": f"Relationship Change ({rel['type']})",
-                        "description": rel.get('description', ''),
-                        "date": rel["start_date"]
-                    })
-
-        # Collect story arc events
-        story_arcs = await self.config.guild(guild).story_arcs()
-        char_arcs = story_arcs.get(character, [])
-        for arc in char_arcs:
-            events.append({
-                "type": "Story",
-                "title": arc["title"],
-                "description": arc["description"],
-                "date": arc["created_at"]
-            })
-
-        # Collect location visits
-        locations = await self.config.guild(guild).locations()
-        for loc_name, loc_data in locations.items():
-            for visit in loc_data.get("visits", []):
-                if visit["character"] == character:
-                    events.append({
-                        "type": "Location",
-                        "title": f"Visited {loc_name}",
-                        "description": visit.get("note", ""),
-                        "date": visit["timestamp"]
-                    })
-
-        embed = create_timeline_embed(
-            events=events,
-            char_name=character,
-            start_date=start_date,
-            end_date=end_date,
-            event_type=event_type
+        per_page = 15
+        page = max(page, 1)
+        events, total = await self.timeline.query(
+            guild, character, start_date, end_date, event_type, page=page, per_page=per_page
         )
+
+        # Entries are already filtered and in date order
+        embed = create_timeline_embed(events=events, char_name=character)
+        if total > per_page:
+            pages = (total + per_page - 1) // per_page
+            embed.set_footer(text=f"Page {page}/{pages} • {total} entries • Fable RP Tracker")
         await ctx.send(embed=embed)
 
+    @character_timeline.command(name="rebuild", description="Rebuild every character's timeline (admin only).")
+    @commands.guild_only()
+    @commands.has_permissions(administrator=True)
+    async def timeline_rebuild(self, ctx: commands.Context):
+        """
+        Rebuild every character's timeline from stored milestones, relationships,
+        story arcs, visits and events. Run once after upgrading, or if timelines look wrong.
+        """
+        async with ctx.typing():
+            entries = await self.timeline.rebuild(ctx.guild)
+        await ctx.send(f"✅ Rebuilt timelines with {entries} entries.")
+
     @fable.command(name="sysetup", description="Set up Google sync (Sheet or Doc).")
     async def sysetup(self, ctx: commands.Context, source_type: str, url_or_id: str, api_key: str):
         """
@@ -1406,9 +1538,26 @@ class Fable(commands.Cog):
                 raise Exception("No data found or invalid format.")
             if data_type and data_type != "all":
                 await self.config.guild(ctx.guild).set_raw(data_type, value=imported)
+                if data_type == "events":
+                    await self.config.guild(ctx.guild).next_event_id.clear()
             else:
                 await self.config.guild(ctx.guild).set(imported)
+            self.character_index.invalidate(ctx.guild.id)
             msg = f"Imported data from Google {sync['type'].capitalize()}: `{sync['id']}`."
+            if data_type in (None, "all", "locations"):
+                # Imported locations may still carry their visits; move them to the visit log
+                skipped = []
+                _, moved = await self._migrate_locations(ctx.guild, skipped)
+                if moved:
+                    msg += f" Moved {moved} location visits to the visit log."
+                if skipped:
+                    msg += f" Left {', '.join(skipped)} unchanged because the data couldn't be read."
+            # Imported milestones, relationships, visits and events replace what the timelines were built from
+            try:
+                entries = await self.timeline.rebuild(ctx.guild)
+                msg += f" Rebuilt {entries} timeline entries."
+            except Exception as e:
+                msg += f" Timelines could not be rebuilt from the imported data: {e}"
             color = 0x43B581
         except Exception as e:
             msg = f"❌ Import failed: {e}"
@@ -1631,6 +1780,7 @@ class Fable(commands.Cog):
             return
         
         await self.config.guild(ctx.guild).characters.set_raw(name, value=character_data)
+        self.character_index.add(ctx.guild.id, name, character_data["owner_id"])
         
         embed = discord.Embed(
             title=f"✨ Quick Character Created: {name}",
@@ -1707,9 +1857,7 @@ class Fable(commands.Cog):
             await ctx.send(f"❌ Invalid category. Please use one of:\n{categories_str}")
             return
 
-        milestones = await self.config.guild(guild).milestones()
-        if character not in milestones:
-            milestones[character] = []
+        char_milestones = await self.config.guild(guild).milestones.get_raw(character, default=[])
 
         milestone_data = {
             "category": category.title(),
@@ -1719,8 +1867,9 @@ class Fable(commands.Cog):
             "added_by": str(ctx.author.id)
         }
         
-        milestones[character].append(milestone_data)
-        await self.config.guild(guild).milestones.set(milestones)
+        char_milestones.append(milestone_data)
+        await self.config.guild(guild).milestones.set_raw(character, value=char_milestones)
+        await self.timeline.add(guild, [character], milestone_entry(milestone_data))
 
         embed = discord.Embed(
             title=f"🎯 Milestone Added: {title}",
@@ -1753,8 +1902,7 @@ class Fable(commands.Cog):
             Filter by milestone category
         """
         guild = ctx.guild
-        milestones = await self.config.guild(guild).milestones()
-        char_milestones = milestones.get(character, [])
+        char_milestones = await self.config.guild(guild).milestones.get_raw(character, default=[])
 
         if not char_milestones:
             await ctx.send(f"No milestones recorded for {character}.")
@@ -1828,7 +1976,6 @@ class Fable(commands.Cog):
             else:
                 await ctx.send("That category already exists.")
 
-        elif action```python
         elif action == "remove" and category:
             if category.title() in categories:
                 categories.remove(category.title())
@@ -1862,9 +2009,9 @@ class Fable(commands.Cog):
             Description of the location
         """
         guild = ctx.guild
-        locations = await self.config.guild(guild).locations()
+        existing = await self.config.guild(guild).locations.get_raw(name, default=None)
         
-        if name in locations:
+        if existing:
             await ctx.send("❌ A location with that name already exists.")
             return
 
@@ -1874,13 +2021,11 @@ class Fable(commands.Cog):
             "description": description,
             "created_by": str(ctx.author.id),
             "created_at": discord.utils.utcnow().isoformat(),
-            "visits": [],  # Track character visits
             "events": [],  # Track events that occurred here
             "connected_to": []  # Track connected locations
         }
         
-        locations[name] = location_data
-        await self.config.guild(guild).locations.set(locations)
+        await self.config.guild(guild).locations.set_raw(name, value=location_data)
 
         embed = discord.Embed(
             title=f"🏰 Location Created: {name}",
@@ -1916,26 +2061,16 @@ class Fable(commands.Cog):
             Optional note about the visit
         """
         guild = ctx.guild
-        locations = await self.config.guild(guild).locations()
-        characters = await self.config.guild(guild).characters()
-        
-        if location not in locations:
+        if not await self.config.guild(guild).locations.get_raw(location, default=None):
             await ctx.send("❌ Location not found.")
             return
             
-        if character not in characters:
+        if not await self.config.guild(guild).characters.get_raw(character, default=None):
             await ctx.send("❌ Character not found.")
             return
             
-        visit_data = {
-            "character": character,
-            "timestamp": discord.utils.utcnow().isoformat(),
-            "note": note,
-            "recorded_by": str(ctx.author.id)
-        }
-        
-        locations[location]["visits"].append(visit_data)
-        await self.config.guild(guild).locations.set(locations)
+        visit = await self.visits.append(guild, character, location, note, str(ctx.author.id))
+        await self.timeline.add(guild, [character], visit_entry(visit))
 
         embed = discord.Embed(
             title="📍 Location Visit Recorded",
@@ -1971,9 +2106,10 @@ class Fable(commands.Cog):
             Description of how they're connected
         """
         guild = ctx.guild
-        locations = await self.config.guild(guild).locations()
+        connected1 = await self.config.guild(guild).locations.get_raw(location1, "connected_to", default=None)
+        connected2 = await self.config.guild(guild).locations.get_raw(location2, "connected_to", default=None)
         
-        if location1 not in locations or location2 not in locations:
+        if connected1 is None or connected2 is None:
             await ctx.send("❌ One or both locations not found.")
             return
             
@@ -1984,8 +2120,8 @@ class Fable(commands.Cog):
             "connected_by": str(ctx.author.id)
         }
         
-        if connection not in locations[location1]["connected_to"]:
-            locations[location1]["connected_to"].append(connection)
+        if connection not in connected1:
+            connected1.append(connection)
             # Add reverse connection
             reverse_connection = {
                 "location": location1,
@@ -1993,9 +2129,9 @@ class Fable(commands.Cog):
                 "connected_at": discord.utils.utcnow().isoformat(),
                 "connected_by": str(ctx.author.id)
             }
-            locations[location2]["connected_to"].append(reverse_connection)
-            
-        await self.config.guild(guild).locations.set(locations)
+            connected2.append(reverse_connection)
+            await self.config.guild(guild).locations.set_raw(location1, "connected_to", value=connected1)
+            await self.config.guild(guild).locations.set_raw(location2, "connected_to", value=connected2)
 
         embed = discord.Embed(
             title="🔗 Locations Connected",
@@ -2024,13 +2160,11 @@ class Fable(commands.Cog):
             Name of the location
         """
         guild = ctx.guild
-        locations = await self.config.guild(guild).locations()
+        location = await self.config.guild(guild).locations.get_raw(name, default=None)
         
-        if name not in locations:
+        if not location:
             await ctx.send("❌ Location not found.")
             return
-            
-        location = locations[name]
         
         embed = discord.Embed(
             title=f"🏰 {name}",
@@ -2041,12 +2175,14 @@ class Fable(commands.Cog):
         embed.add_field(name="Category", value=location["category"], inline=True)
         
         # Recent visits
-        if location["visits"]:
-            recent_visits = sorted(location["visits"], key=lambda v: v["timestamp"], reverse=True)[:5]
+        recent_visits, total_visits = await self.visits.page(guild, "location", name, per_page=5)
+        if recent_visits:
             visits_text = ""
             for visit in recent_visits:
                 timestamp = discord.utils.parse_time(visit["timestamp"])
                 visits_text += f"• {visit['character']} ({timestamp.strftime('%Y-%m-%d')})\n"
+            if total_visits > len(recent_visits):
+                visits_text += f"*…and {total_visits - len(recent_visits)} more (`location visits`)*"
             embed.add_field(name="Recent Visits", value=visits_text or "No visits recorded", inline=False)
         
         # Connected locations
@@ -2070,6 +2206,87 @@ class Fable(commands.Cog):
         embed.set_footer(text="Fable RP Tracker • Location Info")
         await ctx.send(embed=embed)
 
+    async def _send_visits_page(self, ctx: commands.Context, kind: str, name: str, page: int):
+        """Send one page of the visit log for a character or location."""
+        per_page = 10
+        visits, total = await self.visits.page(ctx.guild, kind, name, page=max(page, 1), per_page=per_page)
+        if not visits:
+            await ctx.send(f"No visits recorded for {name}." if total == 0 else "That page is empty.")
+            return
+        pages = (total + per_page - 1) // per_page
+        lines = []
+        for visit in visits:
+            timestamp = discord.utils.parse_time(visit["timestamp"])
+            where = visit["location"] if kind == "character" else visit["character"]
+            line = f"• **{where}** ({timestamp.strftime('%Y-%m-%d')})"
+            if visit.get("note"):
+                line += f" - {visit['note']}"
+            lines.append(line)
+        embed = discord.Embed(
+            title=f"📍 Visits: {name}",
+            description="\n".join(lines),
+            color=0x7289DA
+        )
+        embed.set_footer(text=f"Page {max(page, 1)}/{pages} • {total} visits • Fable RP Tracker")
+        await ctx.send(embed=embed)
+
+    @location.command(name="visits", description="List the visits recorded at a location.")
+    @commands.guild_only()
+    @commands.cooldown(1, 5, commands.BucketType.user)
+    async def location_visits(self, ctx: commands.Context, name: str, page: int = 1):
+        """
+        List the visits recorded at a location, newest first.
+
+        Parameters
+        ----------
+        name: str
+            Name of the location
+        page: int
+            Page of visits to show
+        """
+        await self._send_visits_page(ctx, "location", name, page)
+
+    @character.command(name="visits", description="List the locations a character has visited.")
+    @commands.guild_only()
+    @commands.cooldown(1, 5, commands.BucketType.user)
+    async def character_visits(self, ctx: commands.Context, name: str, page: int = 1):
+        """
+        List a character's recorded location visits, newest first.
+
+        Parameters
+        ----------
+        name: str
+            The character's name
+        page: int
+            Page of visits to show
+        """
+        await self._send_visits_page(ctx, "character", name, page)
+
+    @location.command(name="retention", description="Set how long location visits are kept (admin only).")
+    @commands.guild_only()
+    @commands.admin_or_permissions(administrator=True)
+    async def location_retention(self, ctx: commands.Context, days: Optional[int] = None):
+        """
+        View or set how many days of location visits to keep, then compact the log.
+
+        Parameters
+        ----------
+        days: Optional[int]
+            Days of visits to keep, or 0 to keep them forever
+        """
+        if days is None:
+            days = await self.config.guild(ctx.guild).visit_retention_days()
+            await ctx.send(f"Location visits are kept for {days} days." if days else "Location visits are kept forever.")
+            return
+        if days < 0:
+            await ctx.send("❌ Days must be 0 or more.")
+            return
+        await self.config.guild(ctx.guild).visit_retention_days.set(days)
+        if not days:
+            await ctx.send("✅ Location visits will be kept forever.")
+            return
+        removed = await self.visits.compact(ctx.guild, days)
+        await ctx.send(f"✅ Location visits will be kept for {days} days. Removed {removed} older visits.")
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(Fable(bot))
-```
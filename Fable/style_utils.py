@@ -1,5 +1,5 @@
 """Utility module for managing visual styles and embeds in Fable."""
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, List, Optional, Union, Any
 import discord
 from redbot.core import commands
 
@@ -246,18 +246,35 @@ class ConfirmView(FableView):
         self.stop()
 
 class PaginationView(FableView):
-    """View for paginated content navigation."""
+    """
+    View for paginated content navigation.
+
+    ``pages`` is either a list of embeds or a function that builds the embed
+    for a page index; with a function, pass ``page_count`` and each page is
+    only built the first time it is shown.
+    """
 
     def __init__(
         self,
         ctx: commands.Context,
-        pages: List[discord.Embed],
-        timeout: int = 180
+        pages: Union[List[discord.Embed], Callable[[int], discord.Embed]],
+        timeout: int = 180,
+        page_count: Optional[int] = None
     ):
         super().__init__(timeout=timeout)
         self.ctx = ctx
         self.pages = pages
+        self.page_count = len(pages) if page_count is None else page_count
         self.current_page = 0
+        self._rendered: Dict[int, discord.Embed] = {}
+
+    def get_page(self, index: int) -> discord.Embed:
+        """Return the embed for a page, building it if needed."""
+        if not callable(self.pages):
+            return self.pages[index]
+        if index not in self._rendered:
+            self._rendered[index] = self.pages(index)
+        return self._rendered[index]
 
     @discord.ui.button(label="◀️", style=discord.ButtonStyle.blurple)
     async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -266,8 +283,8 @@ class PaginationView(FableView):
             await interaction.response.send_message("This button isn't for you!", ephemeral=True)
             return
 
-        self.current_page = (self.current_page - 1) % len(self.pages)
-        await interaction.response.edit_message(embed=self.pages[self.current_page])
+        self.current_page = (self.current_page - 1) % self.page_count
+        await interaction.response.edit_message(embed=self.get_page(self.current_page))
 
     @discord.ui.button(label="▶️", style=discord.ButtonStyle.blurple)
     async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -276,5 +293,5 @@ class PaginationView(FableView):
             await interaction.response.send_message("This button isn't for you!", ephemeral=True)
             return
 
-        self.current_page = (self.current_page + 1) % len(self.pages)
-        await interaction.response.edit_message(embed=self.pages[self.current_page])
+        self.current_page = (self.current_page + 1) % self.page_count
+        await interaction.response.edit_message(embed=self.get_page(self.current_page))
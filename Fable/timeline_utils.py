@@ -0,0 +1,279 @@
+"""Per-character timeline index for Fable."""
+import asyncio
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import discord
+from redbot.core import Config
+
+from .visit_log import VisitLog
+
+
+def normalize_date(value: str) -> str:
+    """
+    Convert an ISO date or timestamp to a UTC timestamp string that sorts correctly.
+
+    Dates without a time zone are taken as UTC. Values that aren't ISO dates
+    are returned unchanged.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def split_relationship_key(rel_key: str) -> List[str]:
+    """Return the two character names in a ``"A|B"`` relationship key."""
+    return rel_key.split("|", 1)
+
+
+def milestone_entry(milestone: Dict) -> Dict:
+    """Build the timeline entry for a milestone."""
+    return {
+        "type": "Milestone",
+        "title": milestone["title"],
+        "description": milestone.get("description", ""),
+        "date": normalize_date(milestone["date"]),
+        "ref": f"milestone:{milestone['date']}"
+    }
+
+
+def relationship_entry(rel_key: str, relationship: Dict, date: str) -> Dict:
+    """Build the timeline entry for a relationship taking effect on ``date``."""
+    return {
+        "type": "Relationship",
+        "title": f"Relationship Change ({relationship.get('type', 'unknown')})",
+        "description": relationship.get("description") or "",
+        "date": normalize_date(date),
+        "ref": f"relationship:{rel_key}:{date}"
+    }
+
+
+def arc_entry(arc: Dict) -> Dict:
+    """Build the timeline entry for a story arc."""
+    return {
+        "type": "Story",
+        "title": arc["title"],
+        "description": arc.get("description", ""),
+        "date": normalize_date(arc["created_at"]),
+        "ref": f"arc:{arc['title']}"
+    }
+
+
+def visit_entry(visit: Dict) -> Dict:
+    """Build the timeline entry for a location visit."""
+    return {
+        "type": "Location",
+        "title": f"Visited {visit['location']}",
+        "description": visit.get("note") or "",
+        "date": normalize_date(visit["timestamp"]),
+        "ref": f"visit:{visit['id']}"
+    }
+
+
+def event_entry(event: Dict) -> Dict:
+    """Build the timeline entry for a logged event, placed at the time it was logged."""
+    return {
+        "type": "Event",
+        "title": f"Event #{event['id']} (IC: {event.get('ic_date', 'Unspecified')})",
+        "description": event.get("description", ""),
+        "date": normalize_date(event["created_at"]),
+        "ref": f"event:{event['id']}"
+    }
+
+
+def _insert_sorted(entries: List[Dict], entry: Dict) -> None:
+    """Insert an entry after any others with the same date, keeping the list sorted."""
+    if not entries or entries[-1]["date"] <= entry["date"]:
+        entries.append(entry)  # New entries are almost always the latest
+        return
+    dates = [e["date"] for e in entries]
+    entries.insert(bisect_right(dates, entry["date"]), entry)
+
+
+class TimelineIndex:
+    """
+    Keeps each character's timeline stored sorted by date.
+
+    Every milestone, relationship change, visit and event adds its entry to
+    the affected characters' lists under ``timeline -> <character>`` as it is
+    written, so viewing a timeline is a bisect over one list rather than a
+    scan of every milestone, relationship, arc and visit in the server.
+
+    Parameters
+    ----------
+    config: Config
+        The cog's Config, with a ``timeline`` guild value
+    visits: VisitLog
+        The guild visit log, read when rebuilding
+    """
+
+    def __init__(self, config: Config, visits: VisitLog):
+        self.config = config
+        self.visits = visits
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    def _lock(self, guild_id: int) -> asyncio.Lock:
+        """Get the lock that serialises timeline updates for a guild."""
+        lock = self._locks.get(guild_id)
+        if lock is None:
+            lock = self._locks[guild_id] = asyncio.Lock()
+        return lock
+
+    async def add(self, guild: discord.Guild, characters: Iterable[str], entry: Dict) -> None:
+        """Add an entry to each of the given characters' timelines."""
+        group = self.config.guild(guild)
+        async with self._lock(guild.id):
+            for character in characters:
+                entries = await group.timeline.get_raw(character, default=[])
+                _insert_sorted(entries, entry)
+                await group.timeline.set_raw(character, value=entries)
+
+    async def update(self, guild: discord.Guild, characters: Iterable[str], ref: str, **changes) -> None:
+        """Change the fields of an entry (other than its date) on each character's timeline."""
+        group = self.config.guild(guild)
+        async with self._lock(guild.id):
+            for character in characters:
+                entries = await group.timeline.get_raw(character, default=[])
+                for entry in entries:
+                    if entry.get("ref") == ref:
+                        entry.update(changes)
+                await group.timeline.set_raw(character, value=entries)
+
+    async def remove(self, guild: discord.Guild, characters: Iterable[str], ref: str) -> None:
+        """Remove an entry from each of the given characters' timelines."""
+        group = self.config.guild(guild)
+        async with self._lock(guild.id):
+            for character in characters:
+                entries = await group.timeline.get_raw(character, default=[])
+                kept = [e for e in entries if e.get("ref") != ref]
+                if len(kept) != len(entries):
+                    await group.timeline.set_raw(character, value=kept)
+
+    async def remove_visits(self, guild: discord.Guild, visits: Iterable[Dict]) -> None:
+        """Remove visits dropped from the visit log from their characters' timelines."""
+        refs: Dict[str, set] = {}
+        for visit in visits:
+            refs.setdefault(visit["character"], set()).add(visit_entry(visit)["ref"])
+        group = self.config.guild(guild)
+        async with self._lock(guild.id):
+            for character, dropped in refs.items():
+                entries = await group.timeline.get_raw(character, default=[])
+                kept = [e for e in entries if e.get("ref") not in dropped]
+                if len(kept) != len(entries):
+                    await group.timeline.set_raw(character, value=kept)
+
+    async def forget(self, guild: discord.Guild, character: str) -> None:
+        """Drop a character's timeline."""
+        async with self._lock(guild.id):
+            await self.config.guild(guild).timeline.clear_raw(character)
+
+    async def query(
+        self,
+        guild: discord.Guild,
+        character: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        event_type: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 15
+    ) -> Tuple[List[Dict], int]:
+        """
+        Get one page of a character's timeline, oldest first.
+
+        Parameters
+        ----------
+        guild: discord.Guild
+            The guild to read from
+        character: str
+            The character's name
+        start_date: Optional[str]
+            Only include entries on or after this date (YYYY-MM-DD)
+        end_date: Optional[str]
+            Only include entries on or before this date (YYYY-MM-DD)
+        event_type: Optional[str]
+            Only include entries of this type (milestone/relationship/story/location/event)
+        page: int
+            1-based page number
+        per_page: int
+            Entries per page
+
+        Returns
+        -------
+        Tuple[List[Dict], int]
+            The page's entries and the number of entries matching the filters
+        """
+        entries = await self.config.guild(guild).timeline.get_raw(character, default=[])
+        dates = [e["date"] for e in entries]
+        lo = bisect_left(dates, normalize_date(start_date)) if start_date else 0
+        if end_date:
+            end = normalize_date(end_date)
+            if len(end_date) <= 10:
+                # A bare end date includes that whole day
+                end = end[:10] + "T23:59:59.999999+00:00"
+            hi = bisect_right(dates, end)
+        else:
+            hi = len(entries)
+        matching = entries[lo:hi]
+        if event_type:
+            matching = [e for e in matching if e["type"].lower() == event_type.lower()]
+        start = (page - 1) * per_page
+        return matching[start:start + per_page], len(matching)
+
+    async def rebuild(self, guild: discord.Guild) -> int:
+        """
+        Rebuild every character's timeline from the stored milestones, relationships,
+        story arcs, visits and events.
+
+        Returns
+        -------
+        int
+            Number of timeline entries written
+        """
+        group = self.config.guild(guild)
+        timelines: Dict[str, List[Dict]] = {}
+
+        def add(character: str, entry: Dict) -> None:
+            timelines.setdefault(character, []).append(entry)
+
+        # Data a migration couldn't key by name is left as is and skipped here
+        milestones_by_character = await group.milestones()
+        if isinstance(milestones_by_character, dict):
+            for character, milestones in milestones_by_character.items():
+                for milestone in milestones:
+                    add(character, milestone_entry(milestone))
+
+        relationship_history = await group.relationship_history()
+        for rel_key, history in (relationship_history if isinstance(relationship_history, dict) else {}).items():
+            for past in history:
+                for character in split_relationship_key(rel_key):
+                    add(character, relationship_entry(rel_key, past, past.get("start_date", "")))
+
+        for character, data in (await group.characters()).items():
+            for rel_key, current in (data.get("relationships") or {}).items():
+                # Relationship records are dicts keyed by "A|B"; the rest are name lists
+                if isinstance(current, dict) and "|" in rel_key:
+                    for name in split_relationship_key(rel_key):
+                        add(name, relationship_entry(rel_key, current, current.get("updated_at", "")))
+
+        for character, arcs in (await group.story_arcs()).items():
+            for arc in arcs:
+                add(character, arc_entry(arc))
+
+        for character in (await group.visit_index()).get("character", {}):
+            for visit in await self.visits.all_for(guild, "character", character):
+                add(character, visit_entry(visit))
+
+        for event in (await group.events() or {}).values():
+            for character in event.get("characters", []):
+                add(character, event_entry(event))
+
+        for entries in timelines.values():
+            entries.sort(key=lambda e: e["date"])
+        async with self._lock(guild.id):
+            await group.timeline.set(timelines)
+        return sum(len(entries) for entries in timelines.values())
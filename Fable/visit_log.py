@@ -0,0 +1,213 @@
+"""Append-only location visit log for Fable."""
+import asyncio
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import discord
+from redbot.core import Config
+
+# Visits stored per segment; retention drops whole segments at once
+SEGMENT_SIZE = 256
+
+# Index kinds a visit is filed under
+VISIT_INDEXES = ("character", "location")
+
+CompactHook = Callable[[discord.Guild, List[Dict]], Awaitable[None]]
+
+
+class VisitLog:
+    """
+    Per-guild append-only log of location visits.
+
+    Each visit gets the next ID from a counter and is written on its own
+    under ``visit_log -> segments -> <ID // SEGMENT_SIZE> -> <ID>``, so
+    recording a visit never rewrites older ones. ``visit_index`` keeps the
+    ascending visit IDs per character and per location, which makes "visits
+    for X" a slice of one list followed by reads of just that page.
+
+    Parameters
+    ----------
+    config: Config
+        The cog's Config, with ``visit_log``, ``visit_index`` and
+        ``visit_retention_days`` guild values
+    on_compact: Optional[CompactHook]
+        Called with the visits retention removed, so anything built from them
+        (such as character timelines) can drop them too
+    """
+
+    def __init__(self, config: Config, on_compact: Optional[CompactHook] = None):
+        self.config = config
+        self.on_compact = on_compact
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    def _lock(self, guild_id: int) -> asyncio.Lock:
+        """Get the lock that serialises ID allocation for a guild."""
+        lock = self._locks.get(guild_id)
+        if lock is None:
+            lock = self._locks[guild_id] = asyncio.Lock()
+        return lock
+
+    async def append(
+        self,
+        guild: discord.Guild,
+        character: str,
+        location: str,
+        note: Optional[str],
+        recorded_by: str,
+        timestamp: Optional[str] = None
+    ) -> Dict:
+        """
+        Record a visit and file it under its character and location.
+
+        Parameters
+        ----------
+        guild: discord.Guild
+            The guild the visit belongs to
+        character: str
+            Name of the visiting character
+        location: str
+            Name of the location visited
+        note: Optional[str]
+            Optional note about the visit
+        recorded_by: str
+            ID of the user recording the visit
+        timestamp: Optional[str]
+            ISO time of the visit, defaulting to now
+
+        Returns
+        -------
+        Dict
+            The stored visit, including its ID
+        """
+        group = self.config.guild(guild)
+        async with self._lock(guild.id):
+            visit_id = await group.visit_log.get_raw("next_id", default=1)
+            visit = {
+                "id": visit_id,
+                "character": character,
+                "location": location,
+                "timestamp": timestamp or discord.utils.utcnow().isoformat(),
+                "note": note,
+                "recorded_by": recorded_by
+            }
+            await group.visit_log.set_raw("segments", str(visit_id // SEGMENT_SIZE), str(visit_id), value=visit)
+            await group.visit_log.set_raw("next_id", value=visit_id + 1)
+            for kind, name in (("character", character), ("location", location)):
+                ids = await group.visit_index.get_raw(kind, name, default=[])
+                ids.append(visit_id)
+                await group.visit_index.set_raw(kind, name, value=ids)
+
+            if visit_id % SEGMENT_SIZE == 0:
+                # A segment just filled up; see if older ones have expired
+                retention_days = await group.visit_retention_days()
+                if retention_days:
+                    await self._compact(guild, retention_days)
+        return visit
+
+    async def _get_visit(self, guild: discord.Guild, visit_id: int) -> Optional[Dict]:
+        """Read one visit by ID."""
+        return await self.config.guild(guild).visit_log.get_raw(
+            "segments", str(visit_id // SEGMENT_SIZE), str(visit_id), default=None
+        )
+
+    async def count(self, guild: discord.Guild, kind: str, name: str) -> int:
+        """Return how many visits are filed under a character or location."""
+        return len(await self.config.guild(guild).visit_index.get_raw(kind, name, default=[]))
+
+    async def page(
+        self,
+        guild: discord.Guild,
+        kind: str,
+        name: str,
+        page: int = 1,
+        per_page: int = 10
+    ) -> Tuple[List[Dict], int]:
+        """
+        Get one page of visits for a character or location, newest first.
+
+        Parameters
+        ----------
+        guild: discord.Guild
+            The guild to read from
+        kind: str
+            ``"character"`` or ``"location"``
+        name: str
+            The character or location name
+        page: int
+            1-based page number
+        per_page: int
+            Visits per page
+
+        Returns
+        -------
+        Tuple[List[Dict], int]
+            The page's visits and the total number of visits
+        """
+        ids = await self.config.guild(guild).visit_index.get_raw(kind, name, default=[])
+        end = len(ids) - (page - 1) * per_page
+        page_ids = ids[max(end - per_page, 0):max(end, 0)]
+        visits = []
+        for visit_id in reversed(page_ids):
+            visit = await self._get_visit(guild, visit_id)
+            if visit:
+                visits.append(visit)
+        return visits, len(ids)
+
+    async def all_for(self, guild: discord.Guild, kind: str, name: str) -> List[Dict]:
+        """Get every visit for a character or location, oldest first."""
+        ids = await self.config.guild(guild).visit_index.get_raw(kind, name, default=[])
+        visits = []
+        for visit_id in ids:
+            visit = await self._get_visit(guild, visit_id)
+            if visit:
+                visits.append(visit)
+        return visits
+
+    async def compact(self, guild: discord.Guild, retention_days: int) -> int:
+        """
+        Drop segments whose visits are all older than ``retention_days``.
+
+        Returns
+        -------
+        int
+            Number of visits removed
+        """
+        async with self._lock(guild.id):
+            return await self._compact(guild, retention_days)
+
+    async def _compact(self, guild: discord.Guild, retention_days: int) -> int:
+        """Drop expired segments and prune the indexes. The caller holds the guild's lock."""
+        group = self.config.guild(guild)
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)).isoformat()
+        first_id = await group.visit_log.get_raw("first_id", default=1)
+        next_id = await group.visit_log.get_raw("next_id", default=1)
+        active_segment = next_id // SEGMENT_SIZE
+
+        dropped: List[Dict] = []
+        kept_from = first_id
+        # Visits are appended in time order, so stop at the first segment still in use
+        for segment in range(first_id // SEGMENT_SIZE, active_segment):
+            entries = await group.visit_log.get_raw("segments", str(segment), default={})
+            if entries and max(v["timestamp"] for v in entries.values()) >= cutoff:
+                break
+            await group.visit_log.clear_raw("segments", str(segment))
+            dropped.extend(entries.values())
+            kept_from = (segment + 1) * SEGMENT_SIZE
+        if kept_from == first_id:
+            return 0
+
+        await group.visit_log.set_raw("first_id", value=kept_from)
+        async with group.visit_index() as index:
+            for kind in VISIT_INDEXES:
+                names = index.setdefault(kind, {})
+                for name in list(names):
+                    ids = names[name]
+                    ids = ids[bisect_right(ids, kept_from - 1):]
+                    if ids:
+                        names[name] = ids
+                    else:
+                        del names[name]
+        if self.on_compact and dropped:
+            await self.on_compact(guild, dropped)
+        return len(dropped)
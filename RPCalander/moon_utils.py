@@ -1,6 +1,7 @@
 """Moon phase calculation and display utilities for the RPCalendar cog."""
-from datetime import datetime
-import random
+from datetime import MAXYEAR, date as date_type, datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, List, Tuple
 import math
 import discord
 
@@ -24,6 +25,103 @@ BLOOD_MOON = {
     "description": "A rare Blood Moon has appeared in the night sky! Such events are often associated with mystical occurrences and heightened magical energies."
 }
 
+# Offset from a proleptic Gregorian ordinal (date.toordinal()) to the Julian day number
+JULIAN_DAY_OFFSET = 1721425
+
+# Moon's orbital period is ~29.53 days
+LUNAR_CYCLE = 29.53
+
+FULL_MOON = 4
+
+# Lunar tables cover this many in-world years each and are built on first use
+LUNAR_TABLE_YEARS = 100
+
+# Chance for each full moon day to be a blood moon (about 3-4 per year)
+BLOOD_MOON_CHANCE = 0.25
+
+_MASK64 = (1 << 64) - 1
+
+def get_julian_day(date: datetime) -> int:
+    """Get the Julian day number for a date."""
+    return date.toordinal() + JULIAN_DAY_OFFSET
+
+def _phase_from_julian_day(jd: int) -> int:
+    """Compute the moon phase index (0-7) for a Julian day number."""
+    # Calculate days since new moon on Jan 1, 2000
+    days_since = jd - 2451550.1
+    
+    # Calculate current position in lunar cycle (0-1)
+    position = (days_since % LUNAR_CYCLE) / LUNAR_CYCLE
+    
+    # Convert position to phase index (0-7)
+    return round(position * 8) % 8
+
+def _splitmix64(x: int) -> int:
+    """Mix a 64-bit integer into a well-distributed 64-bit hash (SplitMix64 finalizer)."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+def blood_moon_roll(guild_id: int, jd: int) -> float:
+    """
+    Get a guild's blood moon roll in [0, 1) for a Julian day.
+    
+    A pure function of its arguments: nothing is seeded, so it is safe to call
+    concurrently and leaves the global ``random`` state alone.
+    """
+    return _splitmix64(_splitmix64(guild_id & _MASK64) ^ jd) / 2**64
+
+def is_blood_moon_day(guild_id: int, jd: int, phase_index: int) -> bool:
+    """Check whether a full moon day is a blood moon for a guild."""
+    return phase_index == FULL_MOON and blood_moon_roll(guild_id, jd) < BLOOD_MOON_CHANCE
+
+class LunarTable:
+    """
+    Precomputed moon phases for a span of in-world years.
+
+    Each day is one byte holding its phase index, so a century of days fits
+    in about 36 KB.
+
+    Parameters
+    ----------
+    start_year : int
+        First year covered by the table
+    years : int
+        Number of years covered
+    """
+
+    __slots__ = ("start_ordinal", "end_ordinal", "days")
+
+    def __init__(self, start_year: int, years: int = LUNAR_TABLE_YEARS) -> None:
+        self.start_ordinal = date_type(start_year, 1, 1).toordinal()
+        self.end_ordinal = date_type(min(start_year + years, MAXYEAR + 1) - 1, 12, 31).toordinal() + 1
+        entries = bytearray(self.end_ordinal - self.start_ordinal)
+        jd = self.start_ordinal + JULIAN_DAY_OFFSET
+        for offset in range(len(entries)):
+            entries[offset] = _phase_from_julian_day(jd + offset)
+        self.days = bytes(entries)
+
+    def __contains__(self, ordinal: int) -> bool:
+        return self.start_ordinal <= ordinal < self.end_ordinal
+
+    def get(self, ordinal: int) -> int:
+        """Get the phase index for a date ordinal."""
+        return self.days[ordinal - self.start_ordinal]
+
+@lru_cache(maxsize=8)
+def _get_lunar_table(start_year: int) -> LunarTable:
+    """Build (once) and return the table starting at ``start_year``."""
+    return LunarTable(start_year)
+
+def get_lunar_table(year: int) -> LunarTable:
+    """Get the shared table covering a year (tables start at year 1, 101, 201, ...)."""
+    return _get_lunar_table((year - 1) // LUNAR_TABLE_YEARS * LUNAR_TABLE_YEARS + 1)
+
+def get_lunar_phase(date: datetime) -> int:
+    """Get the phase index for a date from the shared tables."""
+    return get_lunar_table(date.year).get(date.toordinal())
+
 def calculate_moon_phase(date: datetime) -> int:
     """
     Calculate the moon phase for a given date.
@@ -39,6 +137,8 @@ def calculate_moon_phase(date: datetime) -> int:
     6: Last Quarter
     7: Waning Crescent
     
+    Phases are read from a precomputed table shared by every guild.
+    
     Parameters
     ----------
     date : datetime
@@ -49,34 +149,9 @@ def calculate_moon_phase(date: datetime) -> int:
     int
         Moon phase index (0-7)
     """
-    # Normalize the year for the calculation
-    year = date.year
-    month = date.month
-    day = date.day
-    
-    # Adjust months - Jan and Feb are counted as months 13 and 14 of the previous year
-    if month == 1 or month == 2:
-        month += 12
-        year -= 1
-        
-    # Calculate Julian date
-    jd = day + ((153 * (month - 3) + 2) // 5) + (365 * year) + (year // 4) - (year // 100) + (year // 400) + 1721119
-    
-    # Calculate days since new moon on Jan 1, 2000
-    days_since = jd - 2451550.1
-    
-    # Moon's orbital period is ~29.53 days
-    lunar_cycle = 29.53
-    
-    # Calculate current position in lunar cycle (0-1)
-    position = (days_since % lunar_cycle) / lunar_cycle
-    
-    # Convert position to phase index (0-7)
-    phase_index = round(position * 8) % 8
-    
-    return phase_index
+    return get_lunar_phase(date)
 
-def should_trigger_blood_moon(date: datetime, blood_moon_enabled: bool) -> bool:
+def should_trigger_blood_moon(date: datetime, blood_moon_enabled: bool, guild_id: int = 0) -> bool:
     """
     Determine if a blood moon should occur on the given date.
     
@@ -91,6 +166,8 @@ def should_trigger_blood_moon(date: datetime, blood_moon_enabled: bool) -> bool:
         The current date
     blood_moon_enabled : bool
         Whether blood moon mode is enabled
+    guild_id : int
+        The guild to roll for, so each guild gets its own blood moons
         
     Returns
     -------
@@ -99,19 +176,53 @@ def should_trigger_blood_moon(date: datetime, blood_moon_enabled: bool) -> bool:
     """
     if not blood_moon_enabled:
         return False
+    return is_blood_moon_day(guild_id, get_julian_day(date), get_lunar_phase(date))
+
+def iter_moon_phases(start: datetime, days: int) -> Iterator[Tuple[date_type, int]]:
+    """
+    Iterate over the moon phases for a run of consecutive days.
     
-    # Must be a full moon
-    phase = calculate_moon_phase(date)
-    if phase != 4:  # Full moon
-        return False
-    
-    # Blood moons should be rare (about 3-4 per year, so ~25% chance of any full moon being a blood moon)
-    # This equates to roughly a 1/28 chance on any given day
-    random_seed = date.year * 10000 + date.month * 100 + date.day  # Deterministic seed based on date
-    random.seed(random_seed)
-    return random.random() < 0.25  # ~25% chance for a full moon to be a blood moon
+    Parameters
+    ----------
+    start : datetime
+        The first date
+    days : int
+        Number of days to cover
+        
+    Yields
+    ------
+    Tuple[date, int]
+        Each date and its phase index
+    """
+    ordinal = start.toordinal()
+    table = None
+    for current in range(ordinal, ordinal + days):
+        if table is None or current not in table:
+            table = get_lunar_table(date_type.fromordinal(current).year)
+        yield date_type.fromordinal(current), table.get(current)
+
+def get_next_full_moon(date: datetime, include_today: bool = False) -> date_type:
+    """Get the date of the next full moon after (or on, with ``include_today``) the given date."""
+    start = date if include_today else date + timedelta(days=1)
+    # A lunar cycle is under 30 days, so a full moon always turns up within two
+    for day, entry in iter_moon_phases(start, 60):
+        if entry == FULL_MOON:
+            return day
+    raise ValueError("No full moon found within 60 days")
+
+def get_full_moons(start: datetime, end: datetime) -> List[date_type]:
+    """Get every full moon date from ``start`` up to and including ``end``."""
+    days = end.toordinal() - start.toordinal() + 1
+    return [day for day, entry in iter_moon_phases(start, days) if entry == FULL_MOON]
+
+def get_blood_moons(start: datetime, end: datetime, guild_id: int = 0) -> List[date_type]:
+    """Get a guild's blood moon dates from ``start`` up to and including ``end``, as if blood moons were enabled."""
+    return [
+        day for day in get_full_moons(start, end)
+        if blood_moon_roll(guild_id, day.toordinal() + JULIAN_DAY_OFFSET) < BLOOD_MOON_CHANCE
+    ]
 
-def get_moon_data(date: datetime, blood_moon_enabled: bool) -> dict:
+def get_moon_data(date: datetime, blood_moon_enabled: bool, guild_id: int = 0) -> dict:
     """
     Get all moon data for the given date, including phase and whether it's a blood moon.
     
@@ -121,14 +232,16 @@ def get_moon_data(date: datetime, blood_moon_enabled: bool) -> dict:
         The date for which to get moon data
     blood_moon_enabled : bool
         Whether blood moon mode is enabled
+    guild_id : int
+        The guild the moon is shown for
         
     Returns
     -------
     dict
         Dictionary containing moon phase data
     """
-    phase_index = calculate_moon_phase(date)
-    is_blood_moon = phase_index == 4 and should_trigger_blood_moon(date, blood_moon_enabled)
+    phase_index = get_lunar_phase(date)
+    is_blood_moon = blood_moon_enabled and is_blood_moon_day(guild_id, get_julian_day(date), phase_index)
     
     if is_blood_moon:
         return {
@@ -1,5 +1,5 @@
 import discord  # Import from the actual discord.py package
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Union
 
 # Optional Red-Dashboard integration
 try:
@@ -15,12 +15,18 @@ except ImportError:
         return decorator
 
 from redbot.core import commands, Config, app_commands
-from datetime import datetime, timedelta
-import pytz
-from discord.ext import tasks
+from datetime import datetime, timedelta, tzinfo
 from .timing_utils import get_next_post_time, has_already_posted_today
 from .file_utils import read_last_posted, write_last_posted
+from .schedule_utils import MidnightScheduler
+from .tz_utils import VALID_TIMEZONES, get_timezone
+import asyncio
 import logging
+import time
+
+# Rollover posts sent at once, and how long one guild's posts may take before giving up
+MAX_CONCURRENT_POSTS = 10
+POST_TIMEOUT = 60
 
 class RPCAGroup(app_commands.Group):
     """Slash command group for RP Calendar management."""
@@ -44,7 +50,7 @@ class RPCAGroup(app_commands.Group):
         channel = f"<#{channel_id}>" if channel_id else "Not set"
         time_zone = guild_settings["time_zone"] or "America/Chicago"
         embed_title = guild_settings["embed_title"] or "📅 RP Calendar Update"
-        tz = pytz.timezone(time_zone)
+        tz = get_timezone(time_zone)
         now = datetime.now(tz)
         try:
             tomorrow_obj = now + timedelta(days=1)
@@ -74,6 +80,8 @@ class RPCAGroup(app_commands.Group):
         if not time_components:
             time_until_next_post_str = "Not scheduled"
         embed.add_field(name="Time Until Next Post", value=time_until_next_post_str, inline=False)
+        if interaction.guild.id in self.cog.post_latency:
+            embed.add_field(name="Last Post Latency", value=f"{self.cog.post_latency[interaction.guild.id]:.2f}s", inline=False)
         embed.add_field(name="Update Channel", value=channel, inline=False)
         embed.add_field(name="Time Zone", value=time_zone, inline=False)
         embed.add_field(name="Embed Color", value=str(embed_color), inline=False)
@@ -101,7 +109,7 @@ class RPCAGroup(app_commands.Group):
             try:
                 from .moon_utils import get_moon_data
                 current_date_obj = datetime.strptime(current_date, "%m-%d-%Y")
-                moon_data = get_moon_data(current_date_obj, blood_moon_enabled)
+                moon_data = get_moon_data(current_date_obj, blood_moon_enabled, interaction.guild.id)
                 embed.add_field(
                     name="🌙 Current Moon Phase",
                     value=f"{moon_data['emoji']} {moon_data['name']}",
@@ -164,10 +172,11 @@ class RPCAGroup(app_commands.Group):
         if not timezone:
             await interaction.followup.send("Timezone is required.", ephemeral=True)
             return
-        if timezone not in pytz.all_timezones:
+        if timezone not in VALID_TIMEZONES:
             await interaction.followup.send("Invalid timezone. See: https://en.wikipedia.org/wiki/List_of_tz_database_time_zones", ephemeral=True)
             return
         await self.cog._config.guild(interaction.guild).time_zone.set(timezone)
+        self.cog.scheduler.add(interaction.guild.id, timezone)
         await interaction.followup.send(f"Timezone set to: {timezone}", ephemeral=True)
 
     @app_commands.command(name="setchannel", description="Set the channel for daily calendar updates.")
@@ -180,6 +189,7 @@ class RPCAGroup(app_commands.Group):
             await interaction.followup.send("Channel is required.", ephemeral=True)
             return
         await self.cog._config.guild(interaction.guild).channel_id.set(channel.id)
+        await self.cog._track_guild(interaction.guild)
         await interaction.followup.send(f"Calendar updates will now be sent to: {channel.mention}", ephemeral=True)
 
     @app_commands.command(name="togglefooter", description="Toggle the footer on/off for calendar embeds.")
@@ -220,7 +230,7 @@ class RPCAGroup(app_commands.Group):
             
             # Get moon data and create embed
             from .moon_utils import get_moon_data, create_moon_embed
-            moon_data = get_moon_data(current_date, guild_settings.get("blood_moon_enabled", False))
+            moon_data = get_moon_data(current_date, guild_settings.get("blood_moon_enabled", False), interaction.guild.id)
             embed = create_moon_embed(moon_data, guild_settings)
             
             await interaction.followup.send(embed=embed, ephemeral=False)
@@ -353,7 +363,7 @@ class RPCAGroup(app_commands.Group):
         if not date:
             # Use today's date if none provided
             time_zone = await self.cog._config.guild(interaction.guild).time_zone()
-            tz = pytz.timezone(time_zone or "America/Chicago")
+            tz = get_timezone(time_zone or "America/Chicago")
             today = datetime.now(tz)
             date = today.strftime("%m-%d-%Y")
         else:
@@ -369,6 +379,7 @@ class RPCAGroup(app_commands.Group):
             await self.cog._config.guild(interaction.guild).start_date.set(date)
         
         await self.cog._config.guild(interaction.guild).current_date.set(date)
+        await self.cog._track_guild(interaction.guild)
         
         # Format for display
         display_date = datetime.strptime(date, "%m-%d-%Y").strftime("%A %m-%d-%Y")
@@ -401,7 +412,10 @@ class RPCalander(commands.Cog, DashboardIntegration):
         }
         self._config.register_guild(**self._default_guild)
         self.rpca_group = RPCAGroup(self)
-        # No need to initialize _daily_update_loop here as it's already decorated with @tasks.loop
+        self.scheduler = MidnightScheduler()
+        self._post_semaphore = asyncio.Semaphore(MAX_CONCURRENT_POSTS)
+        self.post_latency: Dict[int, float] = {}  # Seconds the last rollover post took, per guild
+        self._task: Optional[asyncio.Task] = None
         
     @commands.group(name="rpca", invoke_without_command=True)
     async def rpca_group_command(self, ctx: commands.Context):
@@ -411,27 +425,13 @@ class RPCalander(commands.Cog, DashboardIntegration):
     async def cog_unload(self) -> None:
         if hasattr(self, 'bot'):
             self.bot.tree.remove_command(self.rpca_group.name)
-        if hasattr(self, '_daily_update_loop') and self._daily_update_loop.is_running():
-            self._daily_update_loop.cancel()
+        if self._task:
+            self._task.cancel()
+        self.scheduler.clear()
 
     async def cog_load(self):
-        """Start the daily update loop without triggering an immediate post."""
+        """Start the midnight rollover task without triggering an immediate post."""
         logging.debug("Starting cog_load method.")
-        last_posted = read_last_posted()  # Read the last posted timestamp from the file
-
-        # Skip starting the loop if already posted today
-        if last_posted:
-            tz = pytz.timezone("America/Chicago")  # Default timezone
-            last_posted_dt = datetime.fromisoformat(last_posted).astimezone(tz)
-            today = datetime.now(tz).replace(hour=0, minute=0, second=0)  # Start of today
-
-            if last_posted_dt >= today:
-                logging.debug("Already posted today. Skipping loop start.")
-                return
-
-        if not self._daily_update_loop.is_running():
-            logging.debug("Starting daily update loop.")
-            self._daily_update_loop.start()
 
         # Check for missed dates without sending an embed
         all_guilds = await self._config.all_guilds()
@@ -446,7 +446,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
             # Update the current date if necessary
             current_date = guild_settings["current_date"]
             if current_date:
-                tz = pytz.timezone(time_zone)
+                tz = get_timezone(time_zone)
                 current_date_obj = datetime.strptime(current_date, "%m-%d-%Y").astimezone(tz)
                 today_date_obj = datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
 
@@ -455,11 +455,15 @@ class RPCalander(commands.Cog, DashboardIntegration):
                     new_date_obj = current_date_obj + timedelta(days=days_missed)
                     await self._config.guild_from_id(guild_id).current_date.set(new_date_obj.strftime("%m-%d-%Y"))
 
+        if self._task is None or self._task.done():
+            logging.debug("Starting midnight rollover task.")
+            self._task = asyncio.create_task(self._rollover_loop())
+
     def _format_date(self, date_obj: datetime) -> str:
         """Format a datetime object into our standard format."""
         return date_obj.strftime("%A %m-%d-%Y")
 
-    def _parse_date(self, date_str: str, tz: pytz.tzinfo.DstTzInfo) -> datetime:
+    def _parse_date(self, date_str: str, tz: tzinfo) -> datetime:
         """Parse a date string into a datetime object."""
         return datetime.strptime(date_str, "%m-%d-%Y").replace(tzinfo=tz)
 
@@ -467,71 +471,152 @@ class RPCalander(commands.Cog, DashboardIntegration):
         """Check if two dates have the same month and day."""
         return date1.month == date2.month and date1.day == date2.day
 
-    @tasks.loop(minutes=1)
-    async def _daily_update_loop(self) -> None:
-        """Task loop to post daily calendar updates at the correct time for each guild."""
-        all_guilds = await self._config.all_guilds()
+    async def _track_guild(self, guild: discord.Guild) -> None:
+        """Put a guild in the rollover bucket for its configured time zone."""
+        time_zone = await self._config.guild(guild).time_zone()
+        self.scheduler.add(guild.id, time_zone or "America/Chicago")
+
+    async def _rollover_loop(self) -> None:
+        """Sleep until the next local midnight among the tracked zones, then roll those guilds over."""
+        await self.bot.wait_until_ready()
+        try:
+            all_guilds = await self._config.all_guilds()
+        except Exception as e:
+            logging.error(f"Error loading calendar schedule: {e}")
+            all_guilds = {}
+        missed = []
         for guild_id, guild_settings in all_guilds.items():
-            channel_id = guild_settings.get("channel_id")
-            current_date = guild_settings.get("current_date")
-            time_zone = guild_settings.get("time_zone") or "America/Chicago"
-            embed_color = guild_settings.get("embed_color") or 0x0000FF
-            embed_title = guild_settings.get("embed_title") or "📅 RP Calendar Update"
-            show_footer = guild_settings.get("show_footer", True)
-            last_posted = guild_settings.get("last_posted")
-            if not channel_id or not current_date:
-                continue
-            tz = pytz.timezone(time_zone)
-            now = datetime.now(tz)
-            # Calculate the next post time (00:00 in the configured timezone)
-            if last_posted:
+            # One guild with a bad stored zone mustn't stop the rest being scheduled
+            try:
+                time_zone = guild_settings.get("time_zone") or "America/Chicago"
+                self.scheduler.add(guild_id, time_zone)
+                if not has_already_posted_today(guild_settings.get("last_posted"), time_zone):
+                    missed.append(guild_id)
+            except Exception as e:
+                logging.error(f"Error scheduling calendar rollover for guild {guild_id}: {e}")
+        # Catch up guilds whose midnight passed while the cog was not running
+        if missed:
+            try:
+                await self._roll_over_guilds(missed)
+            except Exception as e:
+                logging.error(f"Error catching up missed calendar rollovers: {e}")
+
+        while True:
+            await self.scheduler.wait()
+            for time_zone, guild_ids in self.scheduler.pop_due(time.time()):
                 try:
-                    last_posted_dt = datetime.fromisoformat(last_posted).astimezone(tz)
-                except Exception:
-                    last_posted_dt = now - timedelta(days=1)
-            else:
+                    await self._roll_over_guilds(guild_ids)
+                except Exception as e:
+                    logging.error(f"Error in daily update for time zone {time_zone}: {e}")
+
+    async def _roll_over_guilds(self, guild_ids) -> None:
+        """Advance and post the calendar for a batch of guilds that just reached midnight."""
+        guild_ids = list(guild_ids)
+        # Only read the guilds in this batch, not every guild's settings
+        loaded = await asyncio.gather(
+            *(self._config.guild_from_id(guild_id).all() for guild_id in guild_ids),
+            return_exceptions=True
+        )
+        rollovers = []
+        for guild_id, guild_settings in zip(guild_ids, loaded):
+            if isinstance(guild_settings, Exception):
+                logging.error(f"Failed to load calendar settings for guild {guild_id}: {guild_settings}")
+                continue
+            update = self._get_rollover_update(guild_settings)
+            if update:
+                rollovers.append((guild_id, guild_settings, update))
+        if not rollovers:
+            return
+
+        # One write per guild for both fields, issued together for the whole batch
+        results = await asyncio.gather(
+            *(self._save_guild_fields(guild_id, update) for guild_id, _, update in rollovers),
+            return_exceptions=True
+        )
+        posts = []
+        for (guild_id, guild_settings, update), result in zip(rollovers, results):
+            if isinstance(result, Exception):
+                logging.error(f"Failed to save calendar rollover for guild {guild_id}: {result}")
+                continue
+            posts.append(self._post_rollover(guild_id, {**guild_settings, **update}, time.monotonic()))
+        # Each guild posts in its own task, so a slow or rate-limited channel only holds its own slot
+        await asyncio.gather(*posts)
+
+    async def _post_rollover(self, guild_id: int, guild_settings: dict, started: float) -> None:
+        """Post one guild's rollover within the shared concurrency limit and record how long it took."""
+        async with self._post_semaphore:
+            try:
+                await asyncio.wait_for(self._post_calendar_update(guild_id, guild_settings), timeout=POST_TIMEOUT)
+            except asyncio.TimeoutError:
+                logging.error(f"Daily calendar update for guild {guild_id} timed out after {POST_TIMEOUT}s")
+            except Exception as e:
+                logging.error(f"Failed to post daily calendar update for guild {guild_id}: {e}")
+        latency = time.monotonic() - started
+        self.post_latency[guild_id] = latency
+        logging.debug(f"Daily calendar update for guild {guild_id} finished in {latency:.2f}s")
+
+    async def _save_guild_fields(self, guild_id: int, fields: dict) -> None:
+        """Write several guild settings in a single Config write."""
+        async with self._config.guild_from_id(guild_id).all() as guild_settings:
+            guild_settings.update(fields)
+
+    def _get_rollover_update(self, guild_settings: dict) -> Optional[dict]:
+        """Get the new current_date and last_posted for a guild, or None if it should not roll over yet."""
+        channel_id = guild_settings.get("channel_id")
+        current_date = guild_settings.get("current_date")
+        time_zone = guild_settings.get("time_zone") or "America/Chicago"
+        last_posted = guild_settings.get("last_posted")
+        if not channel_id or not current_date:
+            return None
+        tz = get_timezone(time_zone)
+        now = datetime.now(tz)
+        # Calculate the next post time (00:00 in the configured timezone)
+        if last_posted:
+            try:
+                last_posted_dt = datetime.fromisoformat(last_posted).astimezone(tz)
+            except Exception:
                 last_posted_dt = now - timedelta(days=1)
-            next_post_time = last_posted_dt.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            if now >= next_post_time:
-                try:
-                    current_date_obj = datetime.strptime(current_date, "%m-%d-%Y")
-                except Exception:
-                    current_date_obj = now
-                # Always increment the date by 1 day for the new post
-                new_date_obj = current_date_obj + timedelta(days=1)
-                new_date_str = new_date_obj.strftime("%A %m-%d-%Y")
-                await self._config.guild_from_id(guild_id).current_date.set(new_date_obj.strftime("%m-%d-%Y"))
-                await self._config.guild_from_id(guild_id).last_posted.set(now.isoformat())
-                embed = discord.Embed(
-                    title=embed_title,
-                    description=f"Today's date: **{new_date_str}**",
-                    color=discord.Color(embed_color)
-                )
-                if show_footer:
-                    embed.set_footer(
-                        text="RP Calendar by Taako",
-                        icon_url="https://cdn-icons-png.flaticon.com/512/869/869869.png"
-                    )
-                channel = self.bot.get_channel(channel_id)
-                if channel:
-                    try:
-                        await channel.send(embed=embed)
-                        
-                        # Post moon phase update if enabled
-                        if guild_settings.get("show_moon_phase", False):
-                            guild = self.bot.get_guild(guild_id)
-                            if guild:
-                                await self._post_moon_update(guild)
-                    except Exception as e:
-                        logging.error(f"Failed to send daily calendar update: {e}")
-
-    @_daily_update_loop.error
-    async def _daily_update_loop_error(self, error):
-        """Handle errors in the daily update loop and restart it if necessary."""
-        logging.error(f"Error in daily update loop: {error}")
-        if not self._daily_update_loop.is_running():
-            logging.debug("Restarting daily update loop after error.")
-            self._daily_update_loop.start()
+        else:
+            last_posted_dt = now - timedelta(days=1)
+        next_post_time = last_posted_dt.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        if now < next_post_time:
+            return None
+        try:
+            current_date_obj = datetime.strptime(current_date, "%m-%d-%Y")
+        except Exception:
+            current_date_obj = now
+        # Always increment the date by 1 day for the new post
+        new_date_obj = current_date_obj + timedelta(days=1)
+        return {"current_date": new_date_obj.strftime("%m-%d-%Y"), "last_posted": now.isoformat()}
+
+    async def _post_calendar_update(self, guild_id: int, guild_settings: dict) -> None:
+        """Post the daily calendar embed (and moon phase, if enabled) for a guild's current date."""
+        embed_color = guild_settings.get("embed_color") or 0x0000FF
+        embed_title = guild_settings.get("embed_title") or "📅 RP Calendar Update"
+        show_footer = guild_settings.get("show_footer", True)
+        new_date_str = datetime.strptime(guild_settings["current_date"], "%m-%d-%Y").strftime("%A %m-%d-%Y")
+        embed = discord.Embed(
+            title=embed_title,
+            description=f"Today's date: **{new_date_str}**",
+            color=discord.Color(embed_color)
+        )
+        if show_footer:
+            embed.set_footer(
+                text="RP Calendar by Taako",
+                icon_url="https://cdn-icons-png.flaticon.com/512/869/869869.png"
+            )
+        channel = self.bot.get_channel(guild_settings["channel_id"])
+        if channel:
+            try:
+                await channel.send(embed=embed)
+                
+                # Post moon phase update if enabled
+                if guild_settings.get("show_moon_phase", False):
+                    guild = self.bot.get_guild(guild_id)
+                    if guild:
+                        await self._post_moon_update(guild, guild_settings)
+            except Exception as e:
+                logging.error(f"Failed to send daily calendar update: {e}")
 
     @rpca_group_command.command(name="force")
     @commands.admin_or_permissions(administrator=True)
@@ -553,7 +638,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
         embed_color = guild_settings.get("embed_color") or 0x0000FF
         embed_title = guild_settings.get("embed_title") or "📅 RP Calendar Update"
         show_footer = guild_settings.get("show_footer", True)
-        tz = pytz.timezone(time_zone)
+        tz = get_timezone(time_zone)
         now = datetime.now(tz)
         try:
             current_date_obj = datetime.strptime(current_date, "%m-%d-%Y").replace(tzinfo=tz)
@@ -566,8 +651,10 @@ class RPCalander(commands.Cog, DashboardIntegration):
             else:
                 new_date_obj = current_date_obj
             new_date_str = new_date_obj.strftime("%A %m-%d-%Y")
-            await self._config.guild(guild).current_date.set(new_date_obj.strftime("%m-%d-%Y"))
-            await self._config.guild(guild).last_posted.set(now.isoformat())
+            await self._save_guild_fields(guild.id, {
+                "current_date": new_date_obj.strftime("%m-%d-%Y"),
+                "last_posted": now.isoformat()
+            })
             embed = discord.Embed(
                 title=embed_title,
                 description=f"Today's date: **{new_date_str}**",
@@ -593,7 +680,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
         """Wrapper for slash command force post, returns (success, message)."""
         return await self.force_post(guild)
 
-    async def _post_moon_update(self, guild) -> None:
+    async def _post_moon_update(self, guild, guild_settings: Optional[dict] = None) -> None:
         """
         Post a moon phase update to the configured channel.
         
@@ -601,9 +688,12 @@ class RPCalander(commands.Cog, DashboardIntegration):
         ----------
         guild : discord.Guild
             The guild to post the update for
+        guild_settings : Optional[dict]
+            The guild's settings, if already loaded
         """
         try:
-            guild_settings = await self._config.guild(guild).all()
+            if guild_settings is None:
+                guild_settings = await self._config.guild(guild).all()
             
             # Check if moon phase updates are enabled
             if not guild_settings.get("show_moon_phase", False):
@@ -634,7 +724,8 @@ class RPCalander(commands.Cog, DashboardIntegration):
             # Get moon data and create embed
             moon_data = get_moon_data(
                 current_date, 
-                guild_settings.get("blood_moon_enabled", False)
+                guild_settings.get("blood_moon_enabled", False),
+                guild.id
             )
             
             embed = create_moon_embed(moon_data, guild_settings)
@@ -659,6 +750,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
         async def dashboard_settings(self, request, guild):
             """Dashboard page for viewing and editing RP Calendar settings."""
             settings = await self._config.guild(guild).all()
+            error = None
             if request.method == "POST":
                 data = await request.post()
                 embed_title = data.get("embed_title", settings["embed_title"])
@@ -668,7 +760,11 @@ class RPCalander(commands.Cog, DashboardIntegration):
                 show_moon_phase = data.get("show_moon_phase", "off") == "on"
                 
                 await self._config.guild(guild).embed_title.set(embed_title)
-                await self._config.guild(guild).time_zone.set(time_zone)
+                if time_zone in VALID_TIMEZONES:
+                    await self._config.guild(guild).time_zone.set(time_zone)
+                    self.scheduler.add(guild.id, time_zone)
+                else:
+                    error = f"Invalid timezone: {time_zone}"
                 await self._config.guild(guild).embed_color.set(embed_color)
                 await self._config.guild(guild).show_footer.set(show_footer)
                 await self._config.guild(guild).show_moon_phase.set(show_moon_phase)
@@ -681,6 +777,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
                 "show_footer": settings["show_footer"],
                 "show_moon_phase": settings.get("show_moon_phase", False),
                 "blood_moon_enabled": settings.get("blood_moon_enabled", False),
+                "error": error,
             }
 
         def get_dashboard_views(self):
@@ -700,7 +797,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
         channel = f"<#{channel_id}>" if channel_id else "Not set"
         time_zone = guild_settings["time_zone"] or "America/Chicago"
         embed_title = guild_settings["embed_title"] or "📅 RP Calendar Update"
-        tz = pytz.timezone(time_zone)
+        tz = get_timezone(time_zone)
         now = datetime.now(tz)
         try:
             tomorrow_obj = now + timedelta(days=1)
@@ -730,6 +827,8 @@ class RPCalander(commands.Cog, DashboardIntegration):
         if not time_components:
             time_until_next_post_str = "Not scheduled"
         embed.add_field(name="Time Until Next Post", value=time_until_next_post_str, inline=False)
+        if ctx.guild.id in self.post_latency:
+            embed.add_field(name="Last Post Latency", value=f"{self.post_latency[ctx.guild.id]:.2f}s", inline=False)
         embed.add_field(name="Update Channel", value=channel, inline=False)
         embed.add_field(name="Time Zone", value=time_zone, inline=False)
         embed.add_field(name="Embed Color", value=str(embed_color), inline=False)
@@ -757,7 +856,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
             try:
                 from .moon_utils import get_moon_data
                 current_date_obj = datetime.strptime(current_date, "%m-%d-%Y")
-                moon_data = get_moon_data(current_date_obj, blood_moon_enabled)
+                moon_data = get_moon_data(current_date_obj, blood_moon_enabled, ctx.guild.id)
                 embed.add_field(
                     name="🌙 Current Moon Phase",
                     value=f"{moon_data['emoji']} {moon_data['name']}",
@@ -807,10 +906,11 @@ class RPCalander(commands.Cog, DashboardIntegration):
         if not timezone:
             await ctx.send("Timezone is required.")
             return
-        if timezone not in pytz.all_timezones:
+        if timezone not in VALID_TIMEZONES:
             await ctx.send("Invalid timezone. See: https://en.wikipedia.org/wiki/List_of_tz_database_time_zones")
             return
         await self._config.guild(ctx.guild).time_zone.set(timezone)
+        self.scheduler.add(ctx.guild.id, timezone)
         await ctx.send(f"Timezone set to: {timezone}")
 
     @rpca_group_command.command(name="setchannel")
@@ -822,6 +922,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
             await ctx.send("Channel is required.")
             return
         await self._config.guild(ctx.guild).channel_id.set(channel.id)
+        await self._track_guild(ctx.guild)
         await ctx.send(f"Calendar updates will now be sent to: {channel.mention}")
 
     @rpca_group_command.command(name="togglefooter")
@@ -857,7 +958,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
             
             # Get moon data and create embed
             from .moon_utils import get_moon_data, create_moon_embed
-            moon_data = get_moon_data(current_date, guild_settings.get("blood_moon_enabled", False))
+            moon_data = get_moon_data(current_date, guild_settings.get("blood_moon_enabled", False), ctx.guild.id)
             embed = create_moon_embed(moon_data, guild_settings)
             
             await ctx.send(embed=embed)
@@ -963,7 +1064,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
         if not date:
             # Use today's date if none provided
             time_zone = await self._config.guild(ctx.guild).time_zone()
-            tz = pytz.timezone(time_zone or "America/Chicago")
+            tz = get_timezone(time_zone or "America/Chicago")
             today = datetime.now(tz)
             date = today.strftime("%m-%d-%Y")
         else:
@@ -979,6 +1080,7 @@ class RPCalander(commands.Cog, DashboardIntegration):
             await self._config.guild(ctx.guild).start_date.set(date)
         
         await self._config.guild(ctx.guild).current_date.set(date)
+        await self._track_guild(ctx.guild)
         
         # Format for display
         display_date = datetime.strptime(date, "%m-%d-%Y").strftime("%A %m-%d-%Y")
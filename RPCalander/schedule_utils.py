@@ -0,0 +1,114 @@
+"""Midnight rollover scheduling for the RPCalander cog."""
+import asyncio
+import heapq
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from .timing_utils import get_next_midnight_timestamp
+
+
+class MidnightScheduler:
+    """
+    Guilds grouped by time zone, with one wakeup per distinct local midnight.
+
+    Each zone's next midnight is computed once and kept in a min-heap, so the
+    rollover loop sleeps until the earliest midnight and then gets every guild
+    in that zone back in one bucket. Moving a guild to another zone or
+    emptying a zone leaves a stale heap entry that is skipped when popped.
+    """
+
+    def __init__(self) -> None:
+        self._zones: Dict[str, Set[int]] = {}
+        self._guild_zones: Dict[int, str] = {}
+        self._midnights: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._guild_zones
+
+    def __len__(self) -> int:
+        return len(self._guild_zones)
+
+    def add(self, guild_id: int, time_zone: str) -> None:
+        """Track a guild in its time zone's bucket, moving it if the zone changed."""
+        current = self._guild_zones.get(guild_id)
+        if current == time_zone:
+            return
+        if current is not None:
+            self.remove(guild_id)
+        self._guild_zones[guild_id] = time_zone
+        bucket = self._zones.get(time_zone)
+        if bucket is None:
+            bucket = self._zones[time_zone] = set()
+            self._push_zone(time_zone, get_next_midnight_timestamp(time_zone))
+        bucket.add(guild_id)
+
+    def remove(self, guild_id: int) -> None:
+        """Stop tracking a guild."""
+        time_zone = self._guild_zones.pop(guild_id, None)
+        if time_zone is None:
+            return
+        bucket = self._zones.get(time_zone)
+        if bucket is not None:
+            bucket.discard(guild_id)
+            if not bucket:
+                del self._zones[time_zone]
+                self._midnights.pop(time_zone, None)
+
+    def clear(self) -> None:
+        """Stop tracking every guild."""
+        self._zones.clear()
+        self._guild_zones.clear()
+        self._midnights.clear()
+        self._heap.clear()
+        self._wakeup.set()
+
+    def get_zone(self, guild_id: int) -> Optional[str]:
+        """Return the time zone a guild is tracked under, if any."""
+        return self._guild_zones.get(guild_id)
+
+    def get_next_midnight(self, time_zone: str) -> Optional[float]:
+        """Return the next midnight timestamp for a tracked zone."""
+        return self._midnights.get(time_zone)
+
+    def _push_zone(self, time_zone: str, midnight: float) -> None:
+        self._midnights[time_zone] = midnight
+        heapq.heappush(self._heap, (midnight, time_zone))
+        self._wakeup.set()
+
+    def next_due(self) -> Optional[float]:
+        """Return the earliest upcoming midnight, or None if no guilds are tracked."""
+        heap = self._heap
+        while heap:
+            midnight, time_zone = heap[0]
+            if self._midnights.get(time_zone) == midnight:
+                return midnight
+            heapq.heappop(heap)
+        return None
+
+    def pop_due(self, now: float) -> List[Tuple[str, Set[int]]]:
+        """
+        Return every zone whose midnight has passed, with a copy of its guilds.
+
+        Each returned zone is rescheduled for its following midnight.
+        """
+        ready = []
+        while True:
+            midnight = self.next_due()
+            if midnight is None or midnight > now:
+                return ready
+            _, time_zone = heapq.heappop(self._heap)
+            ready.append((time_zone, set(self._zones[time_zone])))
+            # Step past the midnight that just fired even if the clock is slightly behind it
+            self._push_zone(time_zone, get_next_midnight_timestamp(time_zone, max(now, midnight) + 1))
+
+    async def wait(self) -> None:
+        """Sleep until the earliest midnight or until the tracked zones change."""
+        midnight = self.next_due()
+        timeout = None if midnight is None else max(0.0, midnight - time.time())
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
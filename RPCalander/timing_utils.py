@@ -1,9 +1,9 @@
 from datetime import datetime, timedelta
-import pytz
+from .tz_utils import get_timezone, localize
 
 def get_next_post_time(time_zone: str) -> datetime:
     """Calculate the next post time (00:00) in the given timezone."""
-    tz = pytz.timezone(time_zone)
+    tz = get_timezone(time_zone)
     now = datetime.now(tz)
     next_post_time = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
     return next_post_time
@@ -13,7 +13,7 @@ def has_already_posted_today(last_posted: datetime, time_zone: str) -> bool:
     if not last_posted:
         return False
 
-    tz = pytz.timezone(time_zone)
+    tz = get_timezone(time_zone)
     if isinstance(last_posted, str):
         last_posted = datetime.fromisoformat(last_posted)
     
@@ -23,7 +23,7 @@ def has_already_posted_today(last_posted: datetime, time_zone: str) -> bool:
 
 def calculate_next_refresh_time(last_posted: datetime, time_zone: str) -> datetime:
     """Calculate the next refresh time based on the last posted time."""
-    tz = pytz.timezone(time_zone)
+    tz = get_timezone(time_zone)
     now = datetime.now(tz)
     next_post_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
     
@@ -31,3 +31,11 @@ def calculate_next_refresh_time(last_posted: datetime, time_zone: str) -> dateti
         next_post_time += timedelta(days=1)
     
     return next_post_time
+
+def get_next_midnight_timestamp(time_zone: str, now: float = None) -> float:
+    """Get the UTC epoch timestamp of the next 00:00 in the given timezone."""
+    tz = get_timezone(time_zone)
+    local_now = datetime.fromtimestamp(now, tz) if now is not None else datetime.now(tz)
+    tomorrow = local_now.date() + timedelta(days=1)
+    # Localize the naive midnight so DST offsets are taken from that day, not today
+    return localize(datetime(tomorrow.year, tomorrow.month, tomorrow.day), tz).timestamp()
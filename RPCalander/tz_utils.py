@@ -0,0 +1,46 @@
+"""Cached time zone lookups for the RPCalander cog."""
+import datetime
+from functools import lru_cache
+
+import pytz
+
+try:
+    from zoneinfo import ZoneInfo, available_timezones
+    HAS_ZONEINFO = True
+except ImportError:
+    HAS_ZONEINFO = False
+
+# Every zone name either library knows, for O(1) validation
+if HAS_ZONEINFO:
+    VALID_TIMEZONES = frozenset(pytz.all_timezones) | frozenset(available_timezones())
+else:
+    VALID_TIMEZONES = frozenset(pytz.all_timezones)
+
+
+def is_valid_timezone(time_zone: str) -> bool:
+    """Check whether a zone name is known."""
+    return time_zone in VALID_TIMEZONES
+
+
+@lru_cache(maxsize=512)
+def get_timezone(time_zone: str) -> datetime.tzinfo:
+    """
+    Get a time zone object, building it once per zone name.
+
+    Uses stdlib zoneinfo when it has the zone (its objects give correct
+    offsets with plain datetime arithmetic) and falls back to pytz otherwise.
+    Raises the same errors as pytz for unknown zones.
+    """
+    if HAS_ZONEINFO:
+        try:
+            return ZoneInfo(time_zone)
+        except Exception:
+            pass  # No system tz database, or the name is pytz-only
+    return pytz.timezone(time_zone)
+
+
+def localize(naive: datetime.datetime, tz: datetime.tzinfo) -> datetime.datetime:
+    """Attach a time zone to a naive local datetime, for both pytz and zoneinfo zones."""
+    if hasattr(tz, "localize"):
+        return tz.normalize(tz.localize(naive))
+    return naive.replace(tzinfo=tz)
@@ -1,20 +1,159 @@
+import asyncio
+import contextlib
 import json
+import logging
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from redbot.core import Config
 
 POST_TRACKER_PATH = Path(__file__).parent / "post_tracker.json"  # Edited by Taako
 
-def read_last_posted():
-    """Read the last posted timestamp from the JSON file."""  # Edited by Taako
+# Seconds to gather posts before writing them out
+FLUSH_DELAY = 5.0
+
+def read_last_posted(guild_id: Optional[int] = None) -> Optional[str]:
+    """Read the last posted time from the JSON file, for one guild or the latest of any."""  # Edited by Taako
     if not POST_TRACKER_PATH.exists():
         return None  # Edited by Taako
 
     with open(POST_TRACKER_PATH, "r") as file:
         data = json.load(file)  # Edited by Taako
-        return data.get("last_posted")  # Edited by Taako
+    guilds = data.get("guilds", {})
+    if guild_id is not None:
+        return guilds.get(str(guild_id))
+    # ISO timestamps sort chronologically; older files only stored a single time
+    return max(guilds.values(), default=data.get("last_posted"))
+
+def _write_tracker(data: Dict[str, Any]) -> None:
+    """Replace the tracker file atomically so a crash never leaves it half written."""
+    fd, tmp_path = tempfile.mkstemp(dir=POST_TRACKER_PATH.parent, prefix=".post_tracker.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump(data, file)
+        os.replace(tmp_path, POST_TRACKER_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _merge_tracker(posted: Dict[int, float]) -> None:
+    """Merge newly posted guilds into the tracker file."""
+    data: Dict[str, Any] = {"guilds": {}}
+    if POST_TRACKER_PATH.exists():
+        try:
+            with open(POST_TRACKER_PATH, "r") as file:
+                data["guilds"] = json.load(file).get("guilds", {})
+        except (OSError, ValueError) as e:
+            logging.warning(f"Rewriting unreadable post tracker: {e}")
+    for guild_id, timestamp in posted.items():
+        data["guilds"][str(guild_id)] = datetime.fromtimestamp(timestamp).isoformat()
+    _write_tracker(data)
+
+class PostTracker:
+    """
+    Buffers post bookkeeping in memory and writes it out in batches.
+
+    Posting records the guild's refresh time here instead of writing Config
+    and the tracker file straight away. A background task waits ``delay``
+    seconds after the first unsaved post, so every post in that window is
+    saved together: one Config write per guild and one tracker file write,
+    done off the event loop.
+
+    Parameters
+    ----------
+    config : Config
+        The cog's Config, with a ``last_refresh`` guild value
+    delay : float
+        Seconds to wait for more posts before flushing
+    """
+
+    def __init__(self, config: Config, delay: float = FLUSH_DELAY) -> None:
+        self.config = config
+        self.delay = delay
+        self._pending: Dict[int, float] = {}
+        self._discarded: Set[int] = set()
+        self._lock = asyncio.Lock()
+        self._dirty = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Stop the background task and save anything still buffered."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    def record(self, guild_id: int, timestamp: float) -> None:
+        """Buffer a guild's post time to be saved with the next flush."""
+        self._pending[guild_id] = timestamp
+        self._discarded.discard(guild_id)
+        self._dirty.set()
+
+    def get(self, guild_id: int) -> Optional[float]:
+        """Return a guild's post time that has not been saved yet, if any."""
+        return self._pending.get(guild_id)
+
+    async def discard(self, guild_id: int) -> None:
+        """
+        Forget a guild's unsaved post time, e.g. when its refresh settings are reset.
+
+        Waits for any flush in progress, so a ``last_refresh`` written by the
+        caller afterwards is not overwritten by that flush.
+        """
+        self._pending.pop(guild_id, None)
+        self._discarded.add(guild_id)
+        async with self._lock:
+            pass
+
+    async def flush(self) -> None:
+        """
+        Save every buffered post time to Config and the tracker file.
+
+        Post times stay buffered, and visible to ``get``, until their Config
+        write succeeds, so a failed or cancelled flush is retried by the next one.
+        """
+        async with self._lock:
+            if not self._pending:
+                return
+            posted = dict(self._pending)
+            self._discarded.clear()
+            results = await asyncio.gather(
+                *(self.config.guild_from_id(guild_id).last_refresh.set(timestamp)
+                  for guild_id, timestamp in posted.items()),
+                return_exceptions=True
+            )
+            for guild_id, result in zip(posted, results):
+                if isinstance(result, Exception):
+                    logging.error(f"Error saving last refresh for guild {guild_id}: {result}")
+                elif self._pending.get(guild_id) == posted[guild_id]:
+                    # Saved, and no newer post replaced it meanwhile
+                    del self._pending[guild_id]
+            saved = {guild_id: timestamp for guild_id, timestamp in posted.items()
+                     if guild_id not in self._discarded}
+            try:
+                await asyncio.to_thread(_merge_tracker, saved)
+            except Exception as e:
+                logging.error(f"Error writing post tracker: {e}")
 
-def write_last_posted():
-    """Write the current timestamp as the last posted time to the JSON file."""  # Edited by Taako
-    now = datetime.now().isoformat()  # Edited by Taako
-    with open(POST_TRACKER_PATH, "w") as file:
-        json.dump({"last_posted": now}, file)  # Edited by Taako
+    async def _flush_loop(self) -> None:
+        """Flush shortly after posts come in, batching everything posted meanwhile."""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(self.delay)
+            self._dirty.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logging.error(f"Error flushing post tracker: {e}")
+            if self._pending:
+                self._dirty.set()
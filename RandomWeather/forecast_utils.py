@@ -0,0 +1,112 @@
+"""Multi-day forecast storage for the RandomWeather cog."""
+import datetime
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from redbot.core import Config
+
+from .weather_utils import WeatherRecord, generate_weather_batch, get_weather_rng
+
+# Days kept ahead of today for every guild, and the most a command may ask for
+FORECAST_DAYS = 7
+MAX_FORECAST_DAYS = 14
+
+Forecast = Dict[str, WeatherRecord]
+
+
+def generate_day(guild_id: int, day: datetime.date) -> WeatherRecord:
+    """Generate a guild's weather for a day from its deterministic daily stream."""
+    return generate_weather_batch(1, day.month, get_weather_rng(guild_id, day))[0]
+
+
+def parse_forecast_days(value: str) -> Optional[int]:
+    """Parse a forecast length like ``7`` or ``7d``, returning None if it is invalid."""
+    value = value.strip().lower()
+    if value.endswith("d"):
+        value = value[:-1]
+    if not value.isdigit():
+        return None
+    days = int(value)
+    return days if 1 <= days <= MAX_FORECAST_DAYS else None
+
+
+class ForecastCache:
+    """
+    Rolling per-guild forecasts, kept in an LRU in memory and persisted to Config.
+
+    Days are generated the first time they are asked for and then stored, so
+    the scheduled post, forced posts and the forecast command all read the
+    same values. Each stored day is a plain list of the record's fields keyed
+    by ISO date, and days before today are pruned whenever the window moves.
+
+    Parameters
+    ----------
+    config : Config
+        The cog's Config, with a ``forecast`` guild value
+    max_guilds : int
+        Number of guilds' forecasts to keep in memory
+    """
+
+    def __init__(self, config: Config, max_guilds: int = 256) -> None:
+        self.config = config
+        self.max_guilds = max_guilds
+        self._forecasts: "OrderedDict[int, Forecast]" = OrderedDict()
+
+    async def _load(self, guild_id: int) -> Forecast:
+        """Get a guild's stored forecast, reading it from Config on a cache miss."""
+        forecast = self._forecasts.get(guild_id)
+        if forecast is not None:
+            self._forecasts.move_to_end(guild_id)
+            return forecast
+        stored = await self.config.guild_from_id(guild_id).forecast()
+        forecast = {}
+        for day, values in stored.items():
+            try:
+                forecast[day] = WeatherRecord(*values)
+            except TypeError:
+                continue  # Written by an incompatible version; it will be regenerated
+        self._forecasts[guild_id] = forecast
+        if len(self._forecasts) > self.max_guilds:
+            self._forecasts.popitem(last=False)
+        return forecast
+
+    async def get_days(self, guild_id: int, start: datetime.date,
+                       days: int = 1) -> List[Tuple[datetime.date, WeatherRecord]]:
+        """
+        Get a guild's forecast for ``days`` days from ``start``.
+
+        Parameters
+        ----------
+        guild_id : int
+            The guild to get the forecast for
+        start : datetime.date
+            The first day, normally today in the guild's timezone
+        days : int
+            Number of days to return
+
+        Returns
+        -------
+        List[Tuple[datetime.date, WeatherRecord]]
+            Each day with its forecast, in order
+        """
+        forecast = await self._load(guild_id)
+        window = [start + datetime.timedelta(days=i) for i in range(max(days, FORECAST_DAYS))]
+        keys = [day.isoformat() for day in window]
+
+        changed = False
+        for key in [key for key in forecast if key < keys[0]]:
+            del forecast[key]
+            changed = True
+        for day, key in zip(window, keys):
+            if key not in forecast:
+                forecast[key] = generate_day(guild_id, day)
+                changed = True
+        if changed:
+            await self.config.guild_from_id(guild_id).forecast.set(
+                {key: list(record) for key, record in forecast.items()}
+            )
+        return [(day, forecast[key]) for day, key in zip(window[:days], keys[:days])]
+
+    def forget(self, guild_id: int) -> None:
+        """Drop a guild's forecast from memory."""
+        self._forecasts.pop(guild_id, None)
@@ -2,16 +2,25 @@
 import asyncio
 from typing import Dict, Any, Optional, cast
 import discord
-from discord.ext import tasks
 import logging
+import time
 from datetime import datetime
-import pytz
 from redbot.core import Config, commands
 from redbot.core import app_commands
 from redbot.core.bot import Red
-from .weather_utils import generate_weather, generate_extreme_weather, create_weather_embed
-from .time_utils import calculate_next_refresh_time, should_post_now, validate_timezone
-from .file_utils import write_last_posted
+from .weather_utils import (
+    generate_weather, generate_extreme_weather, create_weather_embed, create_forecast_embed,
+    format_weather, get_local_time
+)
+from .forecast_utils import ForecastCache, generate_day, FORECAST_DAYS, MAX_FORECAST_DAYS, parse_forecast_days
+from .time_utils import (
+    DEFAULT_BACKFILL_CAP, DEFAULT_MISSED_RUN_POLICY, MAX_BACKFILL_CAP, MISSED_RUN_POLICIES,
+    calculate_next_refresh_time, describe_missed_run_policy, get_missed_runs, get_next_due_timestamp,
+    get_refresh_slot, should_post_now, validate_timezone
+)
+from .file_utils import PostTracker
+from .schedule_utils import RefreshScheduler
+from .tz_utils import VALID_TIMEZONES, get_timezone
 
 class WeatherGroup(app_commands.Group):
     """Slash command group for RandomWeather admin commands."""
@@ -31,10 +40,11 @@ class WeatherGroup(app_commands.Group):
             await interaction.response.send_message("You need administrator permissions to use this command.", ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
-        if not timezone or timezone not in pytz.all_timezones:
+        if not timezone or timezone not in VALID_TIMEZONES:
             await interaction.followup.send("Invalid timezone. See: https://en.wikipedia.org/wiki/List_of_tz_database_time_zones", ephemeral=True)
             return
         await self.cog.config.guild(interaction.guild).time_zone.set(timezone)
+        await self.cog._reschedule_guild(interaction.guild)
         await interaction.followup.send(f"Timezone set to: {timezone}", ephemeral=True)
 
     @app_commands.command(name="setrefresh", description="Set how often the weather should refresh (interval or time).")
@@ -56,14 +66,16 @@ class WeatherGroup(app_commands.Group):
                     return
                 await self.cog.config.guild(interaction.guild).refresh_time.set(value)
                 await self.cog.config.guild(interaction.guild).refresh_interval.set(None)
+                await self.cog.post_tracker.discard(interaction.guild.id)
                 await self.cog.config.guild(interaction.guild).last_refresh.set(0)
                 guild_settings = await self.cog.config.guild(interaction.guild).all()
                 time_zone = guild_settings.get("time_zone") or "UTC"
-                now = datetime.now(pytz.timezone(time_zone))
+                now = datetime.now(get_timezone(time_zone))
                 if should_post_now(now, hour, minute):
                     await self.cog._post_weather_update(interaction.guild.id, guild_settings, is_forced=True)
                     await interaction.followup.send(f"Weather will refresh daily at {value}. Posted initial update since it's that time now.", ephemeral=True)
                 else:
+                    self.cog._schedule_guild(interaction.guild.id, guild_settings)
                     next_time = calculate_next_refresh_time(0, None, value, time_zone)
                     await interaction.followup.send(f"Weather will refresh daily at {value} ({discord.utils.format_dt(next_time)})", ephemeral=True)
                 return
@@ -79,8 +91,10 @@ class WeatherGroup(app_commands.Group):
             refresh_interval = interval * time_units[unit]
             await self.cog.config.guild(interaction.guild).refresh_interval.set(refresh_interval)
             await self.cog.config.guild(interaction.guild).refresh_time.set(None)
+            await self.cog.post_tracker.discard(interaction.guild.id)
             await self.cog.config.guild(interaction.guild).last_refresh.set(0)
             guild_settings = await self.cog.config.guild(interaction.guild).all()
+            self.cog._schedule_guild(interaction.guild.id, guild_settings)
             time_zone = guild_settings.get("time_zone") or "UTC"
             next_time = calculate_next_refresh_time(0, refresh_interval, None, time_zone)
             await interaction.followup.send(f"Weather will refresh every {value} (next: {discord.utils.format_dt(next_time)})", ephemeral=True)
@@ -97,6 +111,7 @@ class WeatherGroup(app_commands.Group):
             await interaction.followup.send("Channel is required.", ephemeral=True)
             return
         await self.cog.config.guild(interaction.guild).channel_id.set(channel.id)
+        await self.cog._reschedule_guild(interaction.guild)
         await interaction.followup.send(f"Weather updates will now be sent to {channel.mention}", ephemeral=True)
 
     @app_commands.command(name="role", description="Set the role to tag for weather updates.")
@@ -159,7 +174,7 @@ class WeatherGroup(app_commands.Group):
             await interaction.response.send_message("You need administrator permissions to use this command.", ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True)
-        guild_settings = await self.cog.config.guild(interaction.guild).all()
+        guild_settings = await self.cog._get_guild_settings(interaction.guild.id)
         embed_color = discord.Color(guild_settings.get("embed_color", 0xFF0000))
         embed = discord.Embed(title="RandomWeather Settings", color=embed_color)
         channel = self.cog.bot.get_channel(guild_settings.get("channel_id")) if guild_settings.get("channel_id") else None
@@ -168,7 +183,7 @@ class WeatherGroup(app_commands.Group):
         embed.add_field(name="🔖 Tag Role:", value=role.name if role else "❌ Not set", inline=True)
         embed.add_field(name="🌍 Timezone:", value=guild_settings.get("time_zone") or "UTC", inline=True)
         time_zone = guild_settings.get("time_zone") or "UTC"
-        tz = pytz.timezone(time_zone)
+        tz = get_timezone(time_zone)
         current_time = datetime.now(tz)
         embed.add_field(name="🕒 Current Time:", value=discord.utils.format_dt(current_time, "T"), inline=True)
         refresh_time = guild_settings.get("refresh_time")
@@ -194,10 +209,28 @@ class WeatherGroup(app_commands.Group):
         )
         if next_post_time:
             embed.add_field(name="📅 Next Update:", value=discord.utils.format_dt(next_post_time), inline=True)
+        missed_runs = describe_missed_run_policy(
+            guild_settings.get("missed_runs", DEFAULT_MISSED_RUN_POLICY),
+            guild_settings.get("backfill_cap", DEFAULT_BACKFILL_CAP)
+        )
+        embed.add_field(name="⏭️ Missed Runs:", value=missed_runs, inline=True)
         embed.add_field(name="🏷️ Role Tagging:", value="✅ Enabled" if guild_settings.get("tag_role") else "❌ Disabled", inline=True)
         embed.add_field(name="📜 Footer:", value="✅ Enabled" if guild_settings.get("show_footer") else "❌ Disabled", inline=True)
         await interaction.followup.send(embed=embed, ephemeral=True)
 
+    @app_commands.command(name="missedruns", description="Choose what happens to updates missed while the bot was offline.")
+    @app_commands.describe(
+        policy="skip, once (post one catch-up update) or backfill (post each missed update)",
+        cap="Most missed updates to backfill"
+    )
+    async def missedruns(self, interaction: discord.Interaction, policy: str, cap: Optional[int] = None) -> None:
+        if not await self._is_admin(interaction):
+            await interaction.response.send_message("You need administrator permissions to use this command.", ephemeral=True)
+            return
+        await interaction.response.defer(ephemeral=True)
+        message = await self.cog._set_missed_runs(interaction.guild, policy, cap)
+        await interaction.followup.send(message, ephemeral=True)
+
     @app_commands.command(name="force", description="Force a weather update to post now.")
     async def force(self, interaction: discord.Interaction) -> None:
         if not await self._is_admin(interaction):
@@ -216,6 +249,21 @@ class WeatherGroup(app_commands.Group):
             logging.error(f"Error in slash force weather update: {e}")
             await interaction.followup.send(f"Failed to post weather update: {e}", ephemeral=True)
             
+    @app_commands.command(name="forecast", description="Show the weather forecast for the next few days.")
+    @app_commands.guild_only()
+    async def forecast(self, interaction: discord.Interaction, days: str = f"{FORECAST_DAYS}d") -> None:
+        if not interaction.guild:
+            await interaction.response.send_message("This command can only be used in a server.", ephemeral=True)
+            return
+        num_days = parse_forecast_days(days)
+        if num_days is None:
+            await interaction.response.send_message(
+                f"Please give a number of days between 1 and {MAX_FORECAST_DAYS}, e.g. `7d`.", ephemeral=True)
+            return
+        await interaction.response.defer(ephemeral=True)
+        embed = await self.cog._build_forecast_embed(interaction.guild, num_days)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
     @app_commands.command(name="extreme", description="Force an extreme weather event to be posted.")
     async def extreme(self, interaction: discord.Interaction) -> None:
         """Force an extreme weather alert to be posted."""
@@ -257,65 +305,127 @@ class WeatherCog(commands.Cog):
             "show_footer": True,
             "embed_color": 0xFF0000,
             "last_refresh": 0,
-            "time_zone": "America/Chicago"
+            "time_zone": "America/Chicago",
+            "forecast": {},
+            "missed_runs": DEFAULT_MISSED_RUN_POLICY,
+            "backfill_cap": DEFAULT_BACKFILL_CAP
         }
         self.config.register_guild(**default_guild)
-        self._task = self.weather_update_loop.start()
+        self.forecasts = ForecastCache(self.config)
+        self.scheduler = RefreshScheduler()
+        self.post_tracker = PostTracker(self.config)
+        self._task: Optional[asyncio.Task] = None
         self.weather_group = WeatherGroup(self)
 
+    async def cog_load(self) -> None:
+        """Start the weather scheduler when the cog is loaded."""
+        self.post_tracker.start()
+        self._task = asyncio.create_task(self.weather_update_loop())
+
     async def cog_unload(self) -> None:
         """Cleanup tasks when the cog is unloaded."""
         if self._task:
             self._task.cancel()
+        await self.post_tracker.close()
         self.bot.tree.remove_command(self.weather_group.name)
 
-    @tasks.loop(minutes=1)
+    async def _get_guild_settings(self, guild_id: int) -> Dict[str, Any]:
+        """Load a guild's settings, including a post time that hasn't been flushed yet."""
+        guild_settings = await self.config.guild_from_id(guild_id).all()
+        last_refresh = self.post_tracker.get(guild_id)
+        if last_refresh is not None:
+            guild_settings["last_refresh"] = last_refresh
+        return guild_settings
+
+    @staticmethod
+    def _get_next_due(guild_settings: Dict[str, Any]) -> Optional[float]:
+        """Return the timestamp a guild is next due, or None if it never posts."""
+        if not guild_settings.get("channel_id"):
+            return None
+        return get_next_due_timestamp(
+            cast(float, guild_settings.get("last_refresh", 0)),
+            cast(Optional[int], guild_settings.get("refresh_interval")),
+            cast(Optional[str], guild_settings.get("refresh_time")),
+            cast(str, guild_settings.get("time_zone") or "UTC"),
+            missed_policy=cast(str, guild_settings.get("missed_runs", DEFAULT_MISSED_RUN_POLICY))
+        )
+
+    def _schedule_guild(self, guild_id: int, guild_settings: Dict[str, Any]) -> None:
+        """Put a guild on the refresh schedule, or drop it if it can't post."""
+        due = self._get_next_due(guild_settings)
+        if due is None:
+            self.scheduler.unschedule(guild_id)
+        else:
+            self.scheduler.schedule(guild_id, due)
+
+    async def _reschedule_guild(self, guild: discord.Guild) -> None:
+        """Reload a guild's settings and recompute its next refresh."""
+        self._schedule_guild(guild.id, await self._get_guild_settings(guild.id))
+
+    async def _set_missed_runs(self, guild: discord.Guild, policy: str, cap: Optional[int]) -> str:
+        """Save a guild's missed-run policy and return the reply for the command."""
+        policy = policy.strip().lower()
+        if policy not in MISSED_RUN_POLICIES:
+            return f"Invalid policy. Use one of: {', '.join(MISSED_RUN_POLICIES)}"
+        if cap is not None and not 1 <= cap <= MAX_BACKFILL_CAP:
+            return f"The backfill cap must be between 1 and {MAX_BACKFILL_CAP}"
+        await self.config.guild(guild).missed_runs.set(policy)
+        if cap is not None:
+            await self.config.guild(guild).backfill_cap.set(cap)
+        description = describe_missed_run_policy(policy, await self.config.guild(guild).backfill_cap())
+        await self._reschedule_guild(guild)
+        return f"Missed updates: {description}"
+
+    async def _post_due_weather(self, guild_id: int, guild_settings: Dict[str, Any], due: float) -> None:
+        """Post a guild's due update, first backfilling missed runs if its policy asks for it."""
+        if guild_settings.get("missed_runs") == "backfill":
+            missed = get_missed_runs(
+                cast(float, guild_settings.get("last_refresh", 0)),
+                cast(Optional[int], guild_settings.get("refresh_interval")),
+                cast(Optional[str], guild_settings.get("refresh_time")),
+                cast(str, guild_settings.get("time_zone") or "UTC"),
+                time.time(),
+                limit=min(cast(int, guild_settings.get("backfill_cap", DEFAULT_BACKFILL_CAP)), MAX_BACKFILL_CAP)
+            )
+            # The newest missed run is covered by the live post below
+            for scheduled_time in missed[:-1]:
+                await self._post_weather_update(guild_id, guild_settings, scheduled_time=scheduled_time)
+        await self._post_weather_update(guild_id, guild_settings)
+
     async def weather_update_loop(self) -> None:
-        """Check and post weather updates."""
+        """Sleep until the earliest guild is due, then post for the guilds that are."""
         await self.bot.wait_until_ready()
-        
+
         try:
             all_guilds = await self.config.all_guilds()
             for guild_id, guild_settings in all_guilds.items():
                 try:
-                    channel_id = guild_settings.get("channel_id")
-                    if not channel_id:
+                    self._schedule_guild(guild_id, guild_settings)
+                except Exception as e:
+                    logging.error(f"Error scheduling guild {guild_id}: {e}")
+        except Exception as e:
+            logging.error(f"Error loading weather schedule: {e}")
+
+        while True:
+            await self.scheduler.wait(time.time())
+            for guild_id in self.scheduler.pop_due(time.time()):
+                try:
+                    guild_settings = await self._get_guild_settings(guild_id)
+                    due = self._get_next_due(guild_settings)
+                    if due is None:
                         continue
-                        
-                    time_zone = cast(str, guild_settings.get("time_zone", "UTC"))
-                    tz = pytz.timezone(time_zone)
-                    now = datetime.now().astimezone(tz)
-                    
-                    refresh_time = guild_settings.get("refresh_time")
-                    if refresh_time and isinstance(refresh_time, str):
-                        target_hour = int(refresh_time[:2])
-                        target_minute = int(refresh_time[2:])
-                        if should_post_now(now, target_hour, target_minute):
-                            await self._post_weather_update(guild_id, guild_settings, is_forced=True)
-                            continue
-                    
-                    # Calculate next refresh based on interval or scheduled time
-                    last_refresh = cast(int, guild_settings.get("last_refresh", 0))
-                    refresh_interval = cast(Optional[int], guild_settings.get("refresh_interval"))
-                    
-                    next_post_time = calculate_next_refresh_time(
-                        last_refresh,
-                        refresh_interval,
-                        refresh_time,
-                        time_zone
-                    )
-                    
-                    if next_post_time and now >= next_post_time:
-                        await self._post_weather_update(
-                            guild_id,
-                            guild_settings,
-                            scheduled_time=next_post_time.timestamp()
-                        )
+                    if due > time.time():
+                        # Settings changed since this entry was queued
+                        self.scheduler.schedule(guild_id, due)
+                        continue
+                    await self._post_due_weather(guild_id, guild_settings, due)
+                    if guild_id not in self.scheduler:
+                        # The post failed before rescheduling; move on to the next slot
+                        self._schedule_guild(guild_id, {**guild_settings, "last_refresh": time.time()})
                 except Exception as e:
                     logging.error(f"Error processing guild {guild_id}: {e}")
-                    
-        except Exception as e:
-            logging.error(f"Error in weather update loop: {e}")
+                    # Retry shortly rather than dropping the guild from the schedule
+                    self.scheduler.schedule(guild_id, time.time() + 60)
 
     async def _post_weather_update(
         self,
@@ -324,10 +434,9 @@ class WeatherCog(commands.Cog):
         scheduled_time: Optional[float] = None,
         is_forced: bool = False
     ) -> None:
-        """Post a weather update."""
+        """Post a weather update, or a backfilled one for ``scheduled_time`` if given."""
         try:
-            time_zone = cast(str, guild_settings.get("time_zone", "UTC"))
-            weather_data = generate_weather(time_zone)
+            weather_data = await self._get_current_weather(guild_id, guild_settings, scheduled_time)
             embed = create_weather_embed(weather_data, guild_settings)
             
             channel = self.bot.get_channel(guild_settings["channel_id"])
@@ -335,21 +444,53 @@ class WeatherCog(commands.Cog):
                 return
                 
             content = None
-            if guild_settings.get("tag_role"):
+            # Backfilled posts don't ping; the live post that follows them does
+            if guild_settings.get("tag_role") and scheduled_time is None:
                 role_id = guild_settings.get("role_id")
                 if role_id:
                     content = f"<@&{role_id}>"
                     
             await channel.send(content=content, embed=embed)
-            current_time = datetime.now(pytz.timezone(time_zone))
-            guild = self.bot.get_guild(guild_id)
-            if guild:
-                await self.config.guild(guild).last_refresh.set(current_time.timestamp())
-            write_last_posted()
+            posted_at = time.time()
+            self.post_tracker.record(guild_id, posted_at)
+            self._schedule_guild(guild_id, {**guild_settings, "last_refresh": posted_at})
             
         except Exception as e:
             logging.error(f"Error posting weather update for guild {guild_id}: {e}")
 
+    async def _get_current_weather(
+        self,
+        guild_id: int,
+        guild_settings: Dict[str, Any],
+        at: Optional[float] = None
+    ) -> Dict[str, str]:
+        """Get the guild's weather for right now (or ``at``), from its stored forecast when it refreshes daily."""
+        time_zone = cast(str, guild_settings.get("time_zone", "UTC"))
+        refresh_interval = guild_settings.get("refresh_interval")
+        current_time = get_local_time(time_zone)
+        if at is not None:
+            current_time = datetime.fromtimestamp(at, get_timezone(time_zone))
+            if current_time.date() < get_local_time(time_zone).date():
+                # Days before today have dropped out of the stored forecast
+                slot = get_refresh_slot(current_time, refresh_interval)
+                if slot == 0:
+                    return format_weather(generate_day(guild_id, current_time.date()), current_time)
+                return generate_weather(time_zone, guild_id=guild_id, refresh_interval=refresh_interval,
+                                        current_time=current_time)
+        if get_refresh_slot(current_time, refresh_interval) == 0:
+            [(_, record)] = await self.forecasts.get_days(guild_id, current_time.date())
+            return format_weather(record, current_time)
+        # Later interval refreshes in the day each get their own stream
+        return generate_weather(time_zone, guild_id=guild_id, refresh_interval=refresh_interval,
+                                current_time=current_time)
+
+    async def _build_forecast_embed(self, guild: discord.Guild, days: int) -> discord.Embed:
+        """Build the forecast embed for a guild."""
+        guild_settings = await self.config.guild(guild).all()
+        current_time = get_local_time(cast(str, guild_settings.get("time_zone", "UTC")))
+        forecast = await self.forecasts.get_days(guild.id, current_time.date(), days)
+        return create_forecast_embed(forecast, guild_settings)
+
     async def _post_extreme_weather_update(
         self,
         guild_id: int,
@@ -372,11 +513,9 @@ class WeatherCog(commands.Cog):
                     content = f"<@&{role_id}>"
                     
             await channel.send(content=content, embed=embed)
-            current_time = datetime.now(pytz.timezone(time_zone))
-            guild = self.bot.get_guild(guild_id)
-            if guild:
-                await self.config.guild(guild).last_refresh.set(current_time.timestamp())
-            write_last_posted()
+            posted_at = time.time()
+            self.post_tracker.record(guild_id, posted_at)
+            self._schedule_guild(guild_id, {**guild_settings, "last_refresh": posted_at})
             
         except Exception as e:
             logging.error(f"Error posting extreme weather update for guild {guild_id}: {e}")
@@ -394,10 +533,11 @@ class WeatherCog(commands.Cog):
     @commands.admin_or_permissions(administrator=True)
     async def set_timezone(self, ctx: commands.Context, timezone: str) -> None:
         """Set the timezone for weather updates."""
-        if not timezone or timezone not in pytz.all_timezones:
+        if not timezone or timezone not in VALID_TIMEZONES:
             await ctx.send("Invalid timezone. See: https://en.wikipedia.org/wiki/List_of_tz_database_time_zones")
             return
         await self.config.guild(ctx.guild).time_zone.set(timezone)
+        await self._reschedule_guild(ctx.guild)
         await ctx.send(f"Timezone set to: {timezone}")
 
     @rweather.command(name="setrefresh")
@@ -418,14 +558,16 @@ class WeatherCog(commands.Cog):
                     return
                 await self.config.guild(ctx.guild).refresh_time.set(value)
                 await self.config.guild(ctx.guild).refresh_interval.set(None)
+                await self.post_tracker.discard(ctx.guild.id)
                 await self.config.guild(ctx.guild).last_refresh.set(0)
                 guild_settings = await self.config.guild(ctx.guild).all()
                 time_zone = guild_settings.get("time_zone") or "UTC"
-                now = datetime.now(pytz.timezone(time_zone))
+                now = datetime.now(get_timezone(time_zone))
                 if should_post_now(now, hour, minute):
                     await self._post_weather_update(ctx.guild.id, guild_settings, is_forced=True)
                     await ctx.send(f"Weather will refresh daily at {value}. Posted initial update since it's that time now.")
                 else:
+                    self._schedule_guild(ctx.guild.id, guild_settings)
                     next_time = calculate_next_refresh_time(0, None, value, time_zone)
                     await ctx.send(f"Weather will refresh daily at {value} ({discord.utils.format_dt(next_time)})")
                 return
@@ -441,8 +583,10 @@ class WeatherCog(commands.Cog):
             refresh_interval = interval * time_units[unit]
             await self.config.guild(ctx.guild).refresh_interval.set(refresh_interval)
             await self.config.guild(ctx.guild).refresh_time.set(None)
+            await self.post_tracker.discard(ctx.guild.id)
             await self.config.guild(ctx.guild).last_refresh.set(0)
             guild_settings = await self.config.guild(ctx.guild).all()
+            self._schedule_guild(ctx.guild.id, guild_settings)
             time_zone = guild_settings.get("time_zone") or "UTC"
             next_time = calculate_next_refresh_time(0, refresh_interval, None, time_zone)
             await ctx.send(f"Weather will refresh every {value} (next: {discord.utils.format_dt(next_time)})")
@@ -458,6 +602,7 @@ class WeatherCog(commands.Cog):
             await ctx.send("Invalid channel.")
             return
         await self.config.guild(ctx.guild).channel_id.set(channel.id)
+        await self._reschedule_guild(ctx.guild)
         await ctx.send(f"Weather updates will now be sent to {channel.mention}")
 
     @rweather.command(name="role")
@@ -506,7 +651,7 @@ class WeatherCog(commands.Cog):
     @commands.guild_only()
     async def info(self, ctx: commands.Context) -> None:
         """View the current settings for weather updates."""
-        guild_settings = await self.config.guild(ctx.guild).all()
+        guild_settings = await self._get_guild_settings(ctx.guild.id)
         embed_color = discord.Color(guild_settings.get("embed_color", 0xFF0000))
         embed = discord.Embed(title="RandomWeather Settings", color=embed_color)
         channel = self.bot.get_channel(guild_settings.get("channel_id")) if guild_settings.get("channel_id") else None
@@ -515,7 +660,7 @@ class WeatherCog(commands.Cog):
         embed.add_field(name="🔖 Tag Role:", value=role.name if role else "❌ Not set", inline=True)
         embed.add_field(name="🌍 Timezone:", value=guild_settings.get("time_zone") or "UTC", inline=True)
         time_zone = guild_settings.get("time_zone") or "UTC"
-        tz = pytz.timezone(time_zone)
+        tz = get_timezone(time_zone)
         current_time = datetime.now(tz)
         embed.add_field(name="🕒 Current Time:", value=discord.utils.format_dt(current_time, "T"), inline=True)
         refresh_time = guild_settings.get("refresh_time")
@@ -541,10 +686,26 @@ class WeatherCog(commands.Cog):
         )
         if next_post_time:
             embed.add_field(name="📅 Next Update:", value=discord.utils.format_dt(next_post_time), inline=True)
+        missed_runs = describe_missed_run_policy(
+            guild_settings.get("missed_runs", DEFAULT_MISSED_RUN_POLICY),
+            guild_settings.get("backfill_cap", DEFAULT_BACKFILL_CAP)
+        )
+        embed.add_field(name="⏭️ Missed Runs:", value=missed_runs, inline=True)
         embed.add_field(name="🏷️ Role Tagging:", value="✅ Enabled" if guild_settings.get("tag_role") else "❌ Disabled", inline=True)
         embed.add_field(name="📜 Footer:", value="✅ Enabled" if guild_settings.get("show_footer") else "❌ Disabled", inline=True)
         await ctx.send(embed=embed)
 
+    @rweather.command(name="missedruns")
+    @commands.guild_only()
+    @commands.admin_or_permissions(administrator=True)
+    async def missed_runs(self, ctx: commands.Context, policy: str, cap: Optional[int] = None) -> None:
+        """Choose what happens to updates missed while the bot was offline.
+
+        `skip` drops them, `once` posts one catch-up update and `backfill`
+        posts each missed update, up to `cap` of them (default 3, max 10).
+        """
+        await ctx.send(await self._set_missed_runs(ctx.guild, policy, cap))
+
     @rweather.command(name="force")
     @commands.guild_only()
     @commands.admin_or_permissions(administrator=True)
@@ -562,6 +723,16 @@ class WeatherCog(commands.Cog):
             logging.error(f"Error in classic force weather update: {e}")
             await ctx.send(f"Failed to post weather update: {e}")
 
+    @commands.command(name="forecast")
+    @commands.guild_only()
+    async def forecast(self, ctx: commands.Context, days: str = f"{FORECAST_DAYS}d") -> None:
+        """Show the weather forecast for the next few days (e.g. `7d`). Anyone can use this."""
+        num_days = parse_forecast_days(days)
+        if num_days is None:
+            await ctx.send(f"Please give a number of days between 1 and {MAX_FORECAST_DAYS}, e.g. `7d`.")
+            return
+        await ctx.send(embed=await self._build_forecast_embed(ctx.guild, num_days))
+
     @rweather.command(name="extreme")
     @commands.guild_only()
     @commands.admin_or_permissions(administrator=True)
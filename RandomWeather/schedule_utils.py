@@ -0,0 +1,79 @@
+"""Refresh scheduling utilities for the RandomWeather cog."""
+import asyncio
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+
+class RefreshScheduler:
+    """
+    Min-heap of guild refresh deadlines keyed by epoch timestamp.
+
+    Rescheduling a guild pushes a new heap entry and leaves the old one behind;
+    stale entries are discarded lazily when they reach the top of the heap.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int]] = []
+        self._due: Dict[int, float] = {}
+        self._wakeup = asyncio.Event()
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._due
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def schedule(self, guild_id: int, due: float) -> None:
+        """Set (or replace) the next due timestamp for a guild and wake the loop."""
+        self._due[guild_id] = due
+        heapq.heappush(self._heap, (due, guild_id))
+        # Keep stale entries from piling up when guilds reschedule frequently
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(ts, gid) for gid, ts in self._due.items()]
+            heapq.heapify(self._heap)
+        self._wakeup.set()
+
+    def unschedule(self, guild_id: int) -> None:
+        """Remove a guild from the schedule."""
+        self._due.pop(guild_id, None)
+
+    def clear(self) -> None:
+        """Remove every guild from the schedule."""
+        self._heap.clear()
+        self._due.clear()
+        self._wakeup.set()
+
+    def get_due(self, guild_id: int) -> Optional[float]:
+        """Return the scheduled timestamp for a guild, if any."""
+        return self._due.get(guild_id)
+
+    def next_due(self) -> Optional[float]:
+        """Return the earliest scheduled timestamp, or None if nothing is scheduled."""
+        heap = self._heap
+        while heap:
+            due, guild_id = heap[0]
+            if self._due.get(guild_id) == due:
+                return due
+            heapq.heappop(heap)
+        return None
+
+    def pop_due(self, now: float) -> List[int]:
+        """Remove and return every guild whose deadline is at or before ``now``."""
+        ready = []
+        while True:
+            due = self.next_due()
+            if due is None or due > now:
+                return ready
+            _, guild_id = heapq.heappop(self._heap)
+            del self._due[guild_id]
+            ready.append(guild_id)
+
+    async def wait(self, now: float) -> None:
+        """Sleep until the earliest deadline or until the schedule changes."""
+        due = self.next_due()
+        timeout = None if due is None else max(0.0, due - now)
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
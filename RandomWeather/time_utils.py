@@ -1,10 +1,18 @@
-import pytz
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import List, Optional, Union
+from .tz_utils import get_timezone, is_valid_timezone, localize
+
+# What to do about refreshes that were due while the bot was offline
+MISSED_RUN_POLICIES = ("skip", "once", "backfill")
+DEFAULT_MISSED_RUN_POLICY = "once"
+DEFAULT_BACKFILL_CAP = 3
+MAX_BACKFILL_CAP = 10
+# A refresh this recent counts as on time rather than missed
+MISSED_RUN_GRACE = 60
 
 def validate_timezone(configured_timezone: str) -> str:
-    """Validate the configured timezone against pytz timezones."""
-    if configured_timezone in pytz.all_timezones:
+    """Validate the configured timezone against the known zone names."""
+    if is_valid_timezone(configured_timezone):
         return configured_timezone
     return "America/Chicago"  # Default to US Central Time
 
@@ -27,6 +35,77 @@ def should_post_now(current_time: datetime, target_hour: int, target_minute: int
             current_time.minute == target_minute and 
             current_time.second < 60)
 
+def get_refresh_slot(current_time: datetime, refresh_interval: Optional[int]) -> int:
+    """Get which interval refresh of the local day ``current_time`` falls in (0 for daily refreshes)."""
+    if not refresh_interval:
+        return 0
+    seconds = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+    return seconds // refresh_interval
+
+def describe_missed_run_policy(policy: str, cap: int) -> str:
+    """Describe a guild's missed-run policy for the info embeds."""
+    if policy == "skip":
+        return "Skip"
+    if policy == "backfill":
+        return f"Backfill (up to {cap})"
+    return "Post once"
+
+def get_next_interval_time(last_refresh: float, refresh_interval: int, now: float) -> float:
+    """Get the first interval refresh after ``now``, keeping to ``last_refresh``'s cadence."""
+    if now < last_refresh:
+        return last_refresh + refresh_interval
+    return last_refresh + (int((now - last_refresh) // refresh_interval) + 1) * refresh_interval
+
+def get_missed_runs(
+    last_refresh: Union[int, float],
+    refresh_interval: Optional[int],
+    refresh_time: Optional[str],
+    time_zone: str,
+    now: float,
+    limit: int = MAX_BACKFILL_CAP
+) -> List[float]:
+    """
+    Get the refreshes that came due after ``last_refresh`` and up to ``now``.
+
+    Intervals are counted with integer division, and daily times step back at
+    most ``limit`` days, so the cost doesn't grow with the length of the outage.
+
+    Args:
+        last_refresh: Timestamp of last refresh (0 if it has never posted)
+        refresh_interval: Interval in seconds between refreshes
+        refresh_time: Daily refresh time in HHMM format
+        time_zone: Timezone string (e.g., 'UTC', 'America/New_York')
+        now: Current epoch timestamp
+        limit: Most runs to return
+
+    Returns:
+        List[float]: The ``limit`` most recent missed run timestamps, oldest first
+    """
+    if not last_refresh or limit < 1 or now <= last_refresh:
+        return []
+
+    if refresh_interval:
+        missed = int((now - last_refresh) // refresh_interval)
+        first = max(1, missed - limit + 1)
+        return [last_refresh + n * refresh_interval for n in range(first, missed + 1)]
+
+    if refresh_time:
+        tz = get_timezone(time_zone)
+        hour, minute = int(refresh_time[:2]), int(refresh_time[2:])
+        day = datetime.fromtimestamp(now, tz).date()
+        runs: List[float] = []
+        while len(runs) < limit:
+            target = localize(datetime(day.year, day.month, day.day, hour, minute), tz).timestamp()
+            if target <= last_refresh:
+                break
+            if target <= now:
+                runs.append(target)
+            day -= timedelta(days=1)
+        runs.reverse()
+        return runs
+
+    return []
+
 def calculate_next_refresh_time(
     last_refresh: Union[int, float],
     refresh_interval: Optional[int], 
@@ -45,21 +124,16 @@ def calculate_next_refresh_time(
     Returns:
         datetime: The next scheduled refresh time
     """
-    tz = pytz.timezone(time_zone)
+    tz = get_timezone(time_zone)
     now = datetime.now().astimezone(tz)
     
     if refresh_interval:
         # For intervals, use now as the base if no last refresh
-        if last_refresh:
-            base_time = datetime.fromtimestamp(last_refresh).astimezone(tz)
-        else:
-            base_time = now
-            
-        next_post_time = base_time + timedelta(seconds=refresh_interval)
-        # If next post would be in the past, add intervals until it's in the future
-        while next_post_time <= now:
-            next_post_time += timedelta(seconds=refresh_interval)
-            
+        now_ts = now.timestamp()
+        next_post_time = datetime.fromtimestamp(
+            get_next_interval_time(last_refresh or now_ts, refresh_interval, now_ts), tz
+        )
+
     elif refresh_time:
         # Parse the refresh time (military time HHMM)
         target_hour = int(refresh_time[:2])
@@ -91,3 +165,70 @@ def calculate_next_refresh_time(
         ) + timedelta(days=1)
     
     return next_post_time
+
+def get_next_due_timestamp(
+    last_refresh: Union[int, float],
+    refresh_interval: Optional[int],
+    refresh_time: Optional[str],
+    time_zone: str,
+    now: Optional[float] = None,
+    missed_policy: str = DEFAULT_MISSED_RUN_POLICY
+) -> Optional[float]:
+    """
+    Calculate the epoch timestamp at which a guild is next due for a post.
+
+    Unlike calculate_next_refresh_time, a refresh that is overdue is returned
+    as-is so the scheduler fires it immediately. With the ``skip`` policy only
+    refreshes missed by less than MISSED_RUN_GRACE (or half the interval, if
+    that is shorter) count as overdue; the others are dropped and the next one
+    on the schedule is returned instead.
+
+    Args:
+        last_refresh: Timestamp of last refresh
+        refresh_interval: Interval in seconds between refreshes
+        refresh_time: Daily refresh time in HHMM format
+        time_zone: Timezone string (e.g., 'UTC', 'America/New_York')
+        now: Current epoch timestamp (defaults to the current time)
+        missed_policy: One of MISSED_RUN_POLICIES
+
+    Returns:
+        Optional[float]: The due timestamp, or None if no refresh is configured
+    """
+    if now is None:
+        now = datetime.now().timestamp()
+
+    if refresh_interval:
+        if not last_refresh:
+            return now + refresh_interval
+        due = last_refresh + refresh_interval
+        if due > now or missed_policy != "skip":
+            return due
+        [latest] = get_missed_runs(last_refresh, refresh_interval, None, time_zone, now, limit=1)
+        # The latest run is always less than one interval old, so short
+        # intervals only get half of one as grace or skip would never skip
+        if now - latest < min(MISSED_RUN_GRACE, refresh_interval / 2):
+            return latest
+        return get_next_interval_time(last_refresh, refresh_interval, now)
+
+    if refresh_time:
+        tz = get_timezone(time_zone)
+        current_time = datetime.fromtimestamp(now, tz)
+        target = current_time.replace(
+            hour=int(refresh_time[:2]),
+            minute=int(refresh_time[2:]),
+            second=0,
+            microsecond=0
+        )
+        target_ts = target.timestamp()
+        # Still inside the target minute and not posted yet, so it's due now
+        if target_ts <= now and now - target_ts < MISSED_RUN_GRACE and (last_refresh or 0) < target_ts:
+            return target_ts
+        if missed_policy != "skip":
+            missed = get_missed_runs(last_refresh, None, refresh_time, time_zone, now, limit=1)
+            if missed:
+                return missed[-1]
+        if target_ts > now:
+            return target_ts
+        return (target + timedelta(days=1)).timestamp()
+
+    return None
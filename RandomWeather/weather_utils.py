@@ -1,100 +1,190 @@
 """Weather generation utilities for the RandomWeather cog."""
-from typing import Dict, List, Tuple
+from bisect import bisect
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 import random
 import discord
 import datetime
 import math
+from .time_utils import get_refresh_slot
+from .tz_utils import get_timezone
 
-# Try to import pytz once globally to avoid repeated imports
-try:
-    import pytz
-    HAS_PYTZ = True
-except ImportError:
-    HAS_PYTZ = False
 
-def get_seasonal_ranges(month: int) -> Tuple[int, int, List[Tuple[str, float]]]:
+# Base extreme weather conditions that can happen in any season (but still rare)
+BASE_EXTREME = (
+    ("Acid Rain ☢️", 0.006),
+    ("Heavy Smog 🟣", 0.005),
+    ("Blood Fog 🔴", 0.003),
+    ("Noxious Gas ☁️", 0.004)
+)
+
+# Weighted conditions per season, season-specific extreme weather last
+SPRING_CONDITIONS = (
+    ("Sunny ☀️", 0.245),
+    ("Partly Cloudy 🌤️", 0.295),
+    ("Cloudy ☁️", 0.195),
+    ("Rainy 🌧️", 0.145),
+    ("Thunderstorm ⛈️", 0.045),
+    ("Windy 🌬️", 0.025),
+    ("Foggy 🌫️", 0.018)
+) + BASE_EXTREME + (
+    ("Tornado 🌪️", 0.006),       # Tornadoes more common in spring
+    ("Flash Flooding 🌊", 0.005),
+    ("Lightning Storm ⚡", 0.005)
+)
+
+SUMMER_CONDITIONS = (
+    ("Sunny ☀️", 0.395),
+    ("Partly Cloudy 🌤️", 0.295),
+    ("Cloudy ☁️", 0.095),
+    ("Thunderstorm ⛈️", 0.145),
+    ("Windy 🌬️", 0.025),
+    ("Foggy 🌫️", 0.018)
+) + BASE_EXTREME + (
+    ("Hurricane 🌀", 0.008),      # Hurricanes peak in summer/early fall
+    ("Typhoon 🌀", 0.007),        # Typhoons more common in summer
+    ("Lightning Storm ⚡", 0.008), # More thunderstorm activity in summer
+    ("Flash Flooding 🌊", 0.004)
+)
+
+FALL_CONDITIONS = (
+    ("Sunny ☀️", 0.195),
+    ("Partly Cloudy 🌤️", 0.295),
+    ("Cloudy ☁️", 0.245),
+    ("Rainy 🌧️", 0.145),
+    ("Windy 🌬️", 0.045),
+    ("Foggy 🌫️", 0.048)
+) + BASE_EXTREME + (
+    ("Hurricane 🌀", 0.005),      # Hurricane season extends into fall
+    ("Flash Flooding 🌊", 0.004),
+    ("Lightning Storm ⚡", 0.003)
+)
+
+WINTER_CONDITIONS = (
+    ("Sunny ☀️", 0.100),
+    ("Partly Cloudy 🌤️", 0.150),
+    ("Cloudy ☁️", 0.220),
+    ("Light Snow ❄️", 0.160),    # Light snow
+    ("Snowy 🌨️", 0.200),         # Increased snow probability
+    ("Windy 🌬️", 0.095),
+    ("Foggy 🌫️", 0.048)
+) + BASE_EXTREME + (
+    ("Ice Storm 🧊", 0.010),      # Ice storms primarily in winter
+    ("Flash Freeze 🥶", 0.008),   # Flash freeze primarily in winter
+    ("Flash Flooding 🌊", 0.003)
+)
+
+# Base humidity (%) and visibility (miles) per condition
+CONDITION_VALUES = {
+    # Normal conditions
+    "Sunny ☀️": (30, 10.0),           # Low humidity, high visibility
+    "Partly Cloudy 🌤️": (45, 8.0),    # Moderate humidity, good visibility
+    "Cloudy ☁️": (60, 6.0),           # Higher humidity, reduced visibility
+    "Rainy 🌧️": (85, 3.0),            # High humidity, low visibility
+    "Thunderstorm ⛈️": (90, 1.0),      # Very high humidity, very low visibility
+    "Light Snow ❄️": (70, 2.0),        # Moderate humidity, moderate visibility
+    "Snowy 🌨️": (75, 0.5),            # High humidity, very low visibility
+    "Windy 🌬️": (40, 7.0),            # Lower humidity, good visibility
+    "Foggy 🌫️": (95, 0.25),           # Very high humidity, extremely low visibility
+    
+    # Extreme conditions
+    "Typhoon 🌀": (95, 0.1),          # Extremely high humidity, near-zero visibility
+    "Flash Flooding 🌊": (100, 0.2),   # Maximum humidity, very low visibility
+    "Acid Rain ☢️": (85, 0.5),         # High humidity, low visibility
+    "Hurricane 🌀": (98, 0.1),         # Extremely high humidity, near-zero visibility
+    "Tornado 🌪️": (70, 0.05),          # Variable humidity, extremely low visibility
+    "Ice Storm 🧊": (75, 0.3),         # High humidity, very low visibility
+    "Flash Freeze 🥶": (40, 0.4),      # Low humidity, moderate visibility
+    "Heavy Smog 🟣": (90, 0.2),        # Very high humidity, extremely low visibility
+    "Blood Fog 🔴": (95, 0.1),         # Extremely high humidity, near-zero visibility
+    "Lightning Storm ⚡": (80, 0.4),    # High humidity, very low visibility
+    "Noxious Gas ☁️": (30, 0.2)        # Low humidity, extremely low visibility
+}
+DEFAULT_CONDITION_VALUES = (50, 5.0)
+
+# Every known condition; a condition's index in this tuple is its ID
+CONDITIONS: Tuple[str, ...] = tuple(CONDITION_VALUES)
+CONDITION_IDS: Dict[str, int] = {name: i for i, name in enumerate(CONDITIONS)}
+
+# Wind speed ranges (mph) per condition; anything not listed uses DEFAULT_WIND_RANGE
+WIND_RANGES = {
+    "Windy 🌬️": (15, 30),
+    "Snowy 🌨️": (10, 25),           # Moderate wind with heavy snow
+    "Light Snow ❄️": (5, 15),        # Light wind with light snow
+    "Thunderstorm ⛈️": (10, 25),
+    # Extreme wind conditions
+    "Typhoon 🌀": (75, 120),
+    "Hurricane 🌀": (75, 120),
+    "Tornado 🌪️": (65, 150),
+    "Flash Flooding 🌊": (20, 40),
+    "Acid Rain ☢️": (20, 40),
+    "Ice Storm 🧊": (20, 40),
+    "Lightning Storm ⚡": (20, 40),
+    "Flash Freeze 🥶": (15, 35),     # Cold, biting wind with flash freeze
+}
+DEFAULT_WIND_RANGE = (0, 15)
+
+HUMIDITY_JITTER = range(-10, 11)
+
+# Forced extreme weather is meant to be unpredictable, but should not share
+# (or be reseeded through) the global random module
+_extreme_rng = random.Random()
+
+# Per-condition values indexed by condition ID
+_VALUES_BY_ID = tuple(CONDITION_VALUES[name] for name in CONDITIONS)
+_WIND_BY_ID = tuple(WIND_RANGES.get(name, DEFAULT_WIND_RANGE) for name in CONDITIONS)
+
+class SeasonTable(NamedTuple):
+    """Precomputed temperature range and condition weights for one season."""
+    season: str
+    min_temp: int
+    max_temp: int
+    temps: range
+    conditions: Tuple[Tuple[str, float], ...]
+    condition_ids: Tuple[int, ...]
+    cum_weights: Tuple[float, ...]
+    total_weight: float
+
+def _build_season_table(season: str, min_temp: int, max_temp: int,
+                        conditions: Tuple[Tuple[str, float], ...]) -> SeasonTable:
+    """Build a season's lookup table once at import time."""
+    cum_weights = tuple(accumulate(weight for _, weight in conditions))
+    return SeasonTable(
+        season=season,
+        min_temp=min_temp,
+        max_temp=max_temp,
+        temps=range(min_temp, max_temp + 1),
+        conditions=conditions,
+        condition_ids=tuple(CONDITION_IDS[name] for name, _ in conditions),
+        cum_weights=cum_weights,
+        total_weight=cum_weights[-1]
+    )
+
+SPRING = _build_season_table("Spring 🌸", 45, 75, SPRING_CONDITIONS)
+SUMMER = _build_season_table("Summer ☀️", 65, 95, SUMMER_CONDITIONS)
+FALL = _build_season_table("Fall 🍂", 40, 70, FALL_CONDITIONS)
+WINTER = _build_season_table("Winter ❄️", 20, 45, WINTER_CONDITIONS)
+
+# Season table for each month, indexed by month - 1
+MONTH_TABLES: Tuple[SeasonTable, ...] = (
+    WINTER, WINTER, SPRING, SPRING, SPRING, SUMMER,
+    SUMMER, SUMMER, FALL, FALL, FALL, WINTER
+)
+
+def get_month_table(month: int) -> SeasonTable:
+    """Get the precomputed season table for a month (1-12)."""
+    return MONTH_TABLES[(month - 1) % 12]
+
+def get_seasonal_ranges(month: int) -> Tuple[int, int, Tuple[Tuple[str, float], ...]]:
     """Get temperature ranges and weighted conditions for the season."""
-    # Base extreme weather conditions that can happen in any season (but still rare)
-    base_extreme = [
-        ("Acid Rain ☢️", 0.006),
-        ("Heavy Smog 🟣", 0.005),
-        ("Blood Fog 🔴", 0.003),
-        ("Noxious Gas ☁️", 0.004)
-    ]
-    
-    # Season-specific extreme weather
-    spring_extreme = base_extreme + [
-        ("Tornado 🌪️", 0.006),       # Tornadoes more common in spring
-        ("Flash Flooding 🌊", 0.005), 
-        ("Lightning Storm ⚡", 0.005)
-    ]
-    
-    summer_extreme = base_extreme + [
-        ("Hurricane 🌀", 0.008),      # Hurricanes peak in summer/early fall
-        ("Typhoon 🌀", 0.007),        # Typhoons more common in summer
-        ("Lightning Storm ⚡", 0.008), # More thunderstorm activity in summer
-        ("Flash Flooding 🌊", 0.004)
-    ]
-    
-    fall_extreme = base_extreme + [
-        ("Hurricane 🌀", 0.005),      # Hurricane season extends into fall
-        ("Flash Flooding 🌊", 0.004),
-        ("Lightning Storm ⚡", 0.003)
-    ]
-    
-    winter_extreme = base_extreme + [
-        ("Ice Storm 🧊", 0.010),      # Ice storms primarily in winter
-        ("Flash Freeze 🥶", 0.008),   # Flash freeze primarily in winter
-        ("Flash Flooding 🌊", 0.003)
-    ]
-    
-    # Spring (March-May)
-    if month in (3, 4, 5):
-        temp_range = (45, 75)
-        conditions = [
-            ("Sunny ☀️", 0.245),
-            ("Partly Cloudy 🌤️", 0.295),
-            ("Cloudy ☁️", 0.195),
-            ("Rainy 🌧️", 0.145),
-            ("Thunderstorm ⛈️", 0.045),
-            ("Windy 🌬️", 0.025),
-            ("Foggy 🌫️", 0.018)
-        ] + spring_extreme
-    # Summer (June-August)
-    elif month in (6, 7, 8):
-        temp_range = (65, 95)
-        conditions = [
-            ("Sunny ☀️", 0.395),
-            ("Partly Cloudy 🌤️", 0.295),
-            ("Cloudy ☁️", 0.095),
-            ("Thunderstorm ⛈️", 0.145),
-            ("Windy 🌬️", 0.025),
-            ("Foggy 🌫️", 0.018)
-        ] + summer_extreme
-    # Fall (September-November)
-    elif month in (9, 10, 11):
-        temp_range = (40, 70)
-        conditions = [
-            ("Sunny ☀️", 0.195),
-            ("Partly Cloudy 🌤️", 0.295),
-            ("Cloudy ☁️", 0.245),
-            ("Rainy 🌧️", 0.145),
-            ("Windy 🌬️", 0.045),
-            ("Foggy 🌫️", 0.048)
-        ] + fall_extreme
-    # Winter (December-February)
-    else:
-        temp_range = (20, 45)
-        conditions = [
-            ("Sunny ☀️", 0.100),
-            ("Partly Cloudy 🌤️", 0.150),
-            ("Cloudy ☁️", 0.220),
-            ("Light Snow ❄️", 0.160),    # Light snow
-            ("Snowy 🌨️", 0.200),         # Increased snow probability
-            ("Windy 🌬️", 0.095),
-            ("Foggy 🌫️", 0.048)
-        ] + winter_extreme
-    return temp_range[0], temp_range[1], conditions
+    table = get_month_table(month)
+    return table.min_temp, table.max_temp, table.conditions
+
+def get_season_name(month: int) -> str:
+    """Get the display name of the season for a month."""
+    return get_month_table(month).season
 
 def calculate_feels_like(temp_f: int, humidity: int, wind_speed: int) -> int:
     """Calculate 'feels like' temperature using heat index and wind chill."""
@@ -116,115 +206,261 @@ def calculate_feels_like(temp_f: int, humidity: int, wind_speed: int) -> int:
     
     return round(feels_like)
 
-def get_condition_based_values(condition: str) -> Tuple[int, float]:
+def get_condition_based_values(condition: str, rng: Optional[random.Random] = None) -> Tuple[int, float]:
     """Get appropriate humidity and visibility ranges based on condition."""
-    condition_values = {
-        # Normal conditions
-        "Sunny ☀️": (30, 10.0),           # Low humidity, high visibility
-        "Partly Cloudy 🌤️": (45, 8.0),    # Moderate humidity, good visibility
-        "Cloudy ☁️": (60, 6.0),           # Higher humidity, reduced visibility
-        "Rainy 🌧️": (85, 3.0),            # High humidity, low visibility
-        "Thunderstorm ⛈️": (90, 1.0),      # Very high humidity, very low visibility
-        "Light Snow ❄️": (70, 2.0),        # Moderate humidity, moderate visibility
-        "Snowy 🌨️": (75, 0.5),            # High humidity, very low visibility
-        "Windy 🌬️": (40, 7.0),            # Lower humidity, good visibility
-        "Foggy 🌫️": (95, 0.25),           # Very high humidity, extremely low visibility
-        
-        # Extreme conditions
-        "Typhoon 🌀": (95, 0.1),          # Extremely high humidity, near-zero visibility
-        "Flash Flooding 🌊": (100, 0.2),   # Maximum humidity, very low visibility
-        "Acid Rain ☢️": (85, 0.5),         # High humidity, low visibility
-        "Hurricane 🌀": (98, 0.1),         # Extremely high humidity, near-zero visibility
-        "Tornado 🌪️": (70, 0.05),          # Variable humidity, extremely low visibility
-        "Ice Storm 🧊": (75, 0.3),         # High humidity, very low visibility
-        "Flash Freeze 🥶": (40, 0.4),      # Low humidity, moderate visibility
-        "Heavy Smog 🟣": (90, 0.2),        # Very high humidity, extremely low visibility
-        "Blood Fog 🔴": (95, 0.1),         # Extremely high humidity, near-zero visibility
-        "Lightning Storm ⚡": (80, 0.4),    # High humidity, very low visibility
-        "Noxious Gas ☁️": (30, 0.2)        # Low humidity, extremely low visibility
-    }
-    base_humidity, base_visibility = condition_values.get(condition, (50, 5.0))
+    if rng is None:
+        rng = random
+    base_humidity, base_visibility = CONDITION_VALUES.get(condition, DEFAULT_CONDITION_VALUES)
     
     # Add some randomness
-    humidity = base_humidity + random.randint(-10, 10)
+    humidity = base_humidity + rng.randint(-10, 10)
     # Ensure humidity stays between 0 and 100
     humidity = max(0, min(100, humidity))
-    visibility = max(0.1, round(base_visibility + random.uniform(-0.5, 0.5), 1))
+    visibility = max(0.1, round(base_visibility + rng.uniform(-0.5, 0.5), 1))
     
     return humidity, visibility
 
-def generate_weather(time_zone: str) -> Dict[str, str]:
-    """Generate random weather data."""
-    current_time = datetime.datetime.now()
-    if HAS_PYTZ and time_zone:
-        try:
-            tz = pytz.timezone(time_zone)
-            current_time = datetime.datetime.now(tz)
-        except Exception:
-            pass  # Fall back to default time
+class WeatherRecord(NamedTuple):
+    """A single generated forecast, kept as raw values until it is displayed."""
+    temp_f: int
+    condition_id: int
+    humidity: int
+    wind_speed: int
+    visibility: float
+    feels_like: int
 
-    # Get seasonal temperature ranges and weighted conditions
-    min_temp, max_temp, weighted_conditions = get_seasonal_ranges(current_time.month)
-    
-    # Generate base temperature within seasonal range
-    temp_f = random.randint(min_temp, max_temp)
-    temp_c = round((temp_f - 32) * 5/9, 1)
-    
-    # Select weather condition based on weights
-    condition = random.choices(
-        [c[0] for c in weighted_conditions],
-        weights=[c[1] for c in weighted_conditions]
-    )[0]
-    
-    # Get condition-appropriate humidity and visibility
-    humidity, visibility = get_condition_based_values(condition)
-    
-    # Generate wind speed based on condition
-    if condition == "Windy 🌬️":
-        wind_speed = random.randint(15, 30)
-    elif condition == "Snowy 🌨️":
-        wind_speed = random.randint(10, 25)  # Moderate wind with heavy snow
-    elif condition == "Light Snow ❄️":
-        wind_speed = random.randint(5, 15)   # Light wind with light snow
-    elif condition == "Thunderstorm ⛈️":
-        wind_speed = random.randint(10, 25)
-    # Extreme wind conditions
-    elif condition in ["Typhoon 🌀", "Hurricane 🌀"]:
-        wind_speed = random.randint(75, 120)
-    elif condition == "Tornado 🌪️":
-        wind_speed = random.randint(65, 150)
-    elif condition in ["Flash Flooding 🌊", "Acid Rain ☢️", "Ice Storm 🧊", "Lightning Storm ⚡"]:
-        wind_speed = random.randint(20, 40)
-    elif condition == "Flash Freeze 🥶":
-        wind_speed = random.randint(15, 35)  # Cold, biting wind with flash freeze
-    else:
-        wind_speed = random.randint(0, 15)
-    
-    # Calculate feels like temperature
-    feels_like = calculate_feels_like(temp_f, humidity, wind_speed)
-    
-    # Determine season based on month
-    if current_time.month in (3, 4, 5):
-        season = "Spring 🌸"
-    elif current_time.month in (6, 7, 8):
-        season = "Summer ☀️"
-    elif current_time.month in (9, 10, 11):
-        season = "Fall 🍂"
-    else:
-        season = "Winter ❄️"
-    
+    @property
+    def condition(self) -> str:
+        """The display name of the forecast's condition."""
+        return CONDITIONS[self.condition_id]
+
+def generate_weather_batch(n: int, month: int, rng: Optional[random.Random] = None) -> List[WeatherRecord]:
+    """
+    Generate several forecasts for the same month at once.
+
+    Conditions are picked by bisecting the month's precomputed cumulative
+    weights, and temperatures and humidity offsets are drawn in a single call
+    each, so no per-forecast lists or dicts are built.
+
+    Parameters
+    ----------
+    n : int
+        Number of forecasts to generate
+    month : int
+        Month (1-12) that decides the season's temperatures and conditions
+    rng : Optional[random.Random]
+        Random source to draw from; defaults to the global ``random`` module
+
+    Returns
+    -------
+    List[WeatherRecord]
+        The generated forecasts
+    """
+    if n <= 0:
+        return []
+    if rng is None:
+        rng = random
+    table = get_month_table(month)
+    condition_ids = table.condition_ids
+    cum_weights = table.cum_weights
+    total = table.total_weight
+    last = len(cum_weights) - 1
+
+    temps = rng.choices(table.temps, k=n)
+    humidity_jitter = rng.choices(HUMIDITY_JITTER, k=n)
+    rand = rng.random
+
+    records = []
+    for temp_f, jitter in zip(temps, humidity_jitter):
+        condition_id = condition_ids[bisect(cum_weights, rand() * total, 0, last)]
+        base_humidity, base_visibility = _VALUES_BY_ID[condition_id]
+        humidity = max(0, min(100, base_humidity + jitter))
+        visibility = max(0.1, round(base_visibility + rand() - 0.5, 1))
+        low, high = _WIND_BY_ID[condition_id]
+        wind_speed = low + int(rand() * (high - low + 1))
+        feels_like = calculate_feels_like(temp_f, humidity, wind_speed)
+        records.append(WeatherRecord(temp_f, condition_id, humidity, wind_speed, visibility, feels_like))
+    return records
+
+def format_weather(record: WeatherRecord, current_time: datetime.datetime) -> Dict[str, str]:
+    """Turn a generated forecast into the display strings used by the embeds."""
+    temp_c = round((record.temp_f - 32) * 5/9, 1)
     return {
-        "temperature_f": f"{temp_f}°F",
+        "temperature_f": f"{record.temp_f}°F",
         "temperature_c": f"{temp_c}°C",
-        "feels_like": f"{feels_like}°F",
-        "humidity": f"{humidity}%",
-        "wind_speed": f"{wind_speed} mph",
-        "visibility": f"{visibility} miles",
-        "condition": condition,
-        "season": season,
+        "feels_like": f"{record.feels_like}°F",
+        "humidity": f"{record.humidity}%",
+        "wind_speed": f"{record.wind_speed} mph",
+        "visibility": f"{record.visibility} miles",
+        "condition": record.condition,
+        "season": get_season_name(current_time.month),
         "time": current_time.strftime("%I:%M %p")
     }
 
+def get_weather_rng(guild_id: int, date: datetime.date, slot: int = 0) -> random.Random:
+    """
+    Get the random stream for a guild's weather on a given day.
+
+    The seed is a string, which ``random.Random`` hashes with SHA-512, so the
+    same guild, date and slot always give the same stream across restarts and
+    nothing else reseeding the global ``random`` module can affect it.
+
+    Parameters
+    ----------
+    guild_id : int
+        The guild the weather is for
+    date : datetime.date
+        The local date in the guild's timezone
+    slot : int
+        Which refresh of the day this is, for guilds that refresh more than daily
+
+    Returns
+    -------
+    random.Random
+        A freshly seeded generator
+    """
+    return random.Random(f"rweather:{guild_id}:{date.isoformat()}:{slot}")
+
+def get_local_time(time_zone: str) -> datetime.datetime:
+    """Get the current time in a timezone, falling back to local time if it is invalid."""
+    if time_zone:
+        try:
+            return datetime.datetime.now(get_timezone(time_zone))
+        except Exception:
+            pass  # Fall back to default time
+    return datetime.datetime.now()
+
+def generate_weather(time_zone: str, rng: Optional[random.Random] = None,
+                     guild_id: Optional[int] = None, refresh_interval: Optional[int] = None,
+                     current_time: Optional[datetime.datetime] = None) -> Dict[str, str]:
+    """
+    Generate random weather data.
+
+    When ``guild_id`` is given (and no ``rng``), the forecast comes from that
+    guild's stream for the current local date (and refresh slot, for interval
+    refreshes), so it is the same every time it is generated in that period.
+    ``current_time`` generates the weather for another local time instead.
+    """
+    if current_time is None:
+        current_time = get_local_time(time_zone)
+    if rng is None and guild_id is not None:
+        slot = get_refresh_slot(current_time, refresh_interval)
+        rng = get_weather_rng(guild_id, current_time.date(), slot)
+
+    record = generate_weather_batch(1, current_time.month, rng)[0]
+    return format_weather(record, current_time)
+
+# Thumbnail icon per condition, shared by the normal and alert embeds
+CONDITION_ICONS = MappingProxyType({
+    # Normal weather conditions
+    "Sunny ☀️": "https://cdn-icons-png.flaticon.com/512/869/869869.png",             # Sun icon
+    "Partly Cloudy 🌤️": "https://cdn-icons-png.flaticon.com/512/1163/1163661.png",  # Sun with cloud icon
+    "Cloudy ☁️": "https://cdn-icons-png.flaticon.com/512/414/414825.png",            # Cloud icon
+    "Rainy 🌧️": "https://cdn-icons-png.flaticon.com/512/3351/3351979.png",           # Rain icon
+    "Thunderstorm ⛈️": "https://cdn-icons-png.flaticon.com/512/1146/1146860.png",    # Thunder icon
+    "Light Snow ❄️": "https://cdn-icons-png.flaticon.com/512/2204/2204350.png",      # Light snow icon
+    "Snowy 🌨️": "https://cdn-icons-png.flaticon.com/512/2315/2315309.png",          # Heavy snow icon
+    "Windy 🌬️": "https://cdn-icons-png.flaticon.com/512/17640214/17640214.png",     # Wind icon
+    "Foggy 🌫️": "https://cdn-icons-png.flaticon.com/512/4005/4005901.png",           # Fog icon
+    
+    # Extreme weather conditions
+    "Typhoon 🌀": "https://cdn-icons-png.flaticon.com/512/7469/7469118.png",          # Typhoon/cyclone icon
+    "Hurricane 🌀": "https://cdn-icons-png.flaticon.com/512/18370/18370248.png",        # Hurricane icon
+    "Flash Flooding 🌊": "https://cdn-icons-png.flaticon.com/512/15788/15788723.png",   # Flood icon
+    "Acid Rain ☢️": "https://cdn-icons-png.flaticon.com/512/13748/13748298.png",        # Acid rain icon
+    "Tornado 🌪️": "https://cdn-icons-png.flaticon.com/512/4165/4165988.png",         # Tornado icon
+    "Ice Storm 🧊": "https://cdn-icons-png.flaticon.com/512/13753/13753017.png",        # Ice storm icon
+    "Flash Freeze 🥶": "https://cdn-icons-png.flaticon.com/512/13748/13748308.png",     # Freeze icon
+    "Heavy Smog 🟣": "https://cdn-icons-png.flaticon.com/512/5782/5782192.png",       # Smog/pollution icon
+    "Blood Fog 🔴": "https://cdn-icons-png.flaticon.com/512/13748/13748627.png",        # Red fog icon
+    "Lightning Storm ⚡": "https://cdn-icons-png.flaticon.com/512/3032/3032738.png",  # Lightning icon
+    "Noxious Gas ☁️": "https://cdn-icons-png.flaticon.com/512/13748/13748288.png"       # Toxic gas icon
+})
+
+# Extreme conditions, in the order forced extreme weather picks from
+EXTREME_CONDITIONS = (
+    "Typhoon 🌀", 
+    "Flash Flooding 🌊", 
+    "Acid Rain ☢️", 
+    "Hurricane 🌀", 
+    "Tornado 🌪️", 
+    "Ice Storm 🧊", 
+    "Flash Freeze 🥶", 
+    "Heavy Smog 🟣", 
+    "Blood Fog 🔴", 
+    "Lightning Storm ⚡", 
+    "Noxious Gas ☁️"
+)
+_EXTREME_CONDITION_SET = frozenset(EXTREME_CONDITIONS)
+
+# Danger level shown on extreme weather alerts
+DANGER_LEVELS = MappingProxyType({
+    "Typhoon 🌀": "SEVERE",
+    "Hurricane 🌀": "SEVERE",
+    "Tornado 🌪️": "EXTREME",
+    "Flash Flooding 🌊": "HIGH",
+    "Ice Storm 🧊": "HIGH",
+    "Flash Freeze 🥶": "HIGH",
+    "Acid Rain ☢️": "MODERATE",
+    "Heavy Smog 🟣": "MODERATE",
+    "Blood Fog 🔴": "UNKNOWN",
+    "Lightning Storm ⚡": "HIGH",
+    "Noxious Gas ☁️": "HIGH"
+})
+
+# Safety recommendations shown on extreme weather alerts
+RECOMMENDATIONS = MappingProxyType({
+    "Typhoon 🌀": "Seek sturdy shelter immediately. Stay away from windows.",
+    "Hurricane 🌀": "Evacuate low-lying areas. Secure property and seek stable shelter.",
+    "Tornado 🌪️": "Go to basement or interior room. Stay away from windows.",
+    "Flash Flooding 🌊": "Move to higher ground. Do not walk or drive through floodwaters.",
+    "Ice Storm 🧊": "Stay indoors. Roads are extremely hazardous.",
+    "Flash Freeze 🥶": "Seek warm shelter. Protect exposed skin from frostbite.",
+    "Acid Rain ☢️": "Stay indoors. Cover vehicles and sensitive equipment.",
+    "Heavy Smog 🟣": "Wear respiratory protection. Limit outdoor activities.",
+    "Blood Fog 🔴": "Unknown phenomenon. Stay indoors until cleared.",
+    "Lightning Storm ⚡": "Stay indoors. Avoid open areas and tall structures.",
+    "Noxious Gas ☁️": "Evacuate area immediately. Use breathing protection."
+})
+
+ALERT_IMAGE_URL = "https://file.taako.org/api/file/share.php?token=2bc05c04ade85792546ff265bd6c345d"
+
+@lru_cache(maxsize=512)
+def _get_weather_template(condition: str, embed_color: int, show_footer: bool) -> Dict[str, Any]:
+    """
+    Build the static parts of a weather embed for a condition and guild style.
+
+    The result is cached and shared, so callers must copy it rather than
+    modify it.
+    """
+    template: Dict[str, Any] = {"type": "rich", "title": "☀️ Today's Weather", "color": embed_color}
+    if condition in CONDITION_ICONS:
+        template["thumbnail"] = {"url": CONDITION_ICONS[condition]}
+    if show_footer:
+        template["footer"] = {"text": "🎲 Weather conditions are randomly generated"}
+    return template
+
+@lru_cache(maxsize=256)
+def _get_alert_template(condition: str, embed_color: int) -> Dict[str, Any]:
+    """Build the static parts of an extreme weather alert embed; shared, so do not modify it."""
+    template: Dict[str, Any] = {
+        "type": "rich",
+        "title": "⚠️ EXTREME WEATHER ALERT ⚠️",
+        "description": f"**{condition.upper()}** has been detected in your area!\nTake necessary precautions!",
+        "color": embed_color,
+        "image": {"url": ALERT_IMAGE_URL},
+        "footer": {"text": "⚠️ This is a extreme weather alert! ⚠️"}
+    }
+    if condition in CONDITION_ICONS:
+        template["thumbnail"] = {"url": CONDITION_ICONS[condition]}
+    return template
+
+def _embed_from_template(template: Dict[str, Any], fields: List[Dict[str, Any]]) -> discord.Embed:
+    """Create an embed from a cached template plus this post's fields."""
+    data = {key: dict(value) if isinstance(value, dict) else value for key, value in template.items()}
+    data["fields"] = fields
+    return discord.Embed.from_dict(data)
+
 def create_weather_embed(weather_data: Dict[str, str], guild_settings: Dict[str, any]) -> discord.Embed:
     """Create a Discord embed for weather data. Uses special alert embed for extreme weather."""
     
@@ -232,78 +468,47 @@ def create_weather_embed(weather_data: Dict[str, str], guild_settings: Dict[str,
     if is_extreme_weather(weather_data["condition"]):
         return create_extreme_weather_alert(weather_data, guild_settings)
     
-    # Define weather condition icons
-    condition_icons = {
-        # Normal weather conditions
-        "Sunny ☀️": "https://cdn-icons-png.flaticon.com/512/869/869869.png",             # Sun icon
-        "Partly Cloudy 🌤️": "https://cdn-icons-png.flaticon.com/512/1163/1163661.png",  # Sun with cloud icon
-        "Cloudy ☁️": "https://cdn-icons-png.flaticon.com/512/414/414825.png",            # Cloud icon
-        "Rainy 🌧️": "https://cdn-icons-png.flaticon.com/512/3351/3351979.png",           # Rain icon
-        "Thunderstorm ⛈️": "https://cdn-icons-png.flaticon.com/512/1146/1146860.png",    # Thunder icon
-        "Light Snow ❄️": "https://cdn-icons-png.flaticon.com/512/2204/2204350.png",      # Light snow icon
-        "Snowy 🌨️": "https://cdn-icons-png.flaticon.com/512/2315/2315309.png",          # Heavy snow icon
-        "Windy 🌬️": "https://cdn-icons-png.flaticon.com/512/17640214/17640214.png",     # Wind icon
-        "Foggy 🌫️": "https://cdn-icons-png.flaticon.com/512/4005/4005901.png",           # Fog icon
-        
-        # Extreme weather conditions - same icons as in create_extreme_weather_alert
-        "Typhoon 🌀": "https://cdn-icons-png.flaticon.com/512/7469/7469118.png",          # Typhoon/cyclone icon
-        "Hurricane 🌀": "https://cdn-icons-png.flaticon.com/512/18370/18370248.png",        # Hurricane icon
-        "Flash Flooding 🌊": "https://cdn-icons-png.flaticon.com/512/15788/15788723.png",   # Flood icon
-        "Acid Rain ☢️": "https://cdn-icons-png.flaticon.com/512/13748/13748298.png",        # Acid rain icon
-        "Tornado 🌪️": "https://cdn-icons-png.flaticon.com/512/4165/4165988.png",         # Tornado icon
-        "Ice Storm 🧊": "https://cdn-icons-png.flaticon.com/512/13753/13753017.png",        # Ice storm icon
-        "Flash Freeze 🥶": "https://cdn-icons-png.flaticon.com/512/13748/13748308.png",     # Freeze icon
-        "Heavy Smog 🟣": "https://cdn-icons-png.flaticon.com/512/5782/5782192.png",       # Smog/pollution icon
-        "Blood Fog 🔴": "https://cdn-icons-png.flaticon.com/512/13748/13748627.png",        # Red fog icon
-        "Lightning Storm ⚡": "https://cdn-icons-png.flaticon.com/512/3032/3032738.png",  # Lightning icon
-        "Noxious Gas ☁️": "https://cdn-icons-png.flaticon.com/512/13748/13748288.png"       # Toxic gas icon
-    }
-
-    embed = discord.Embed(
-        title="☀️ Today's Weather",
-        color=discord.Color(guild_settings.get("embed_color", 0xFF0000))
+    template = _get_weather_template(
+        weather_data["condition"],
+        int(guild_settings.get("embed_color", 0xFF0000)),
+        bool(guild_settings.get("show_footer", True))
     )
     
-    # Set thumbnail based on weather condition
-    if weather_data["condition"] in condition_icons:
-        embed.set_thumbnail(url=condition_icons[weather_data["condition"]])
-
     # Temperature and Feels Like (show both only if different)
     temp = weather_data["temperature_f"]
     feels_like = weather_data["feels_like"]
     if temp != feels_like:
-        embed.add_field(
-            name="🌡️ Temperature | 🌡️ Feels Like",
-            value=f"{temp} | {feels_like}",
-            inline=False
-        )
+        temperature = {"name": "🌡️ Temperature | 🌡️ Feels Like", "value": f"{temp} | {feels_like}", "inline": False}
     else:
-        embed.add_field(
-            name="🌡️ Temperature",
-            value=f"{temp}",
-            inline=False
-        )
-    
-    # Conditions
-    embed.add_field(
-        name="☁️ Conditions",
-        value=weather_data["condition"],
-        inline=False
-    )
-    
-    # Wind, Humidity, and Visibility
-    embed.add_field(
-        name="🌬️ Wind | 💧 Humidity | 👀 Visibility",
-        value=f"{weather_data['wind_speed']} | {weather_data['humidity']} | {weather_data['visibility']}",
-        inline=False
-    )
-    
-    # Current Season
-    embed.add_field(
-        name="🍂 Current Season",
-        value=weather_data["season"],
-        inline=False
+        temperature = {"name": "🌡️ Temperature", "value": f"{temp}", "inline": False}
+    
+    return _embed_from_template(template, [
+        temperature,
+        {"name": "☁️ Conditions", "value": weather_data["condition"], "inline": False},
+        {
+            "name": "🌬️ Wind | 💧 Humidity | 👀 Visibility",
+            "value": f"{weather_data['wind_speed']} | {weather_data['humidity']} | {weather_data['visibility']}",
+            "inline": False
+        },
+        {"name": "🍂 Current Season", "value": weather_data["season"], "inline": False}
+    ])
+
+def create_forecast_embed(days: List[Tuple[datetime.date, WeatherRecord]], guild_settings: Dict[str, any]) -> discord.Embed:
+    """Create a Discord embed listing a multi-day forecast, one field per day."""
+    embed = discord.Embed(
+        title=f"📅 {len(days)}-Day Forecast",
+        color=discord.Color(guild_settings.get("embed_color", 0xFF0000))
     )
+    for day, record in days:
+        condition = record.condition
+        name = day.strftime("%A %m/%d")
+        if is_extreme_weather(condition):
+            name = f"⚠️ {name}"
+        value = f"{condition} | 🌡️ {record.temp_f}°F"
+        if record.feels_like != record.temp_f:
+            value += f" (feels {record.feels_like}°F)"
+        value += f"\n🌬️ {record.wind_speed} mph | 💧 {record.humidity}% | 👀 {record.visibility} miles"
+        embed.add_field(name=name, value=value, inline=False)
     
     if guild_settings.get("show_footer", True):
         embed.set_footer(text="🎲 Weather conditions are randomly generated")
@@ -312,137 +517,44 @@ def create_weather_embed(weather_data: Dict[str, str], guild_settings: Dict[str,
 
 def create_extreme_weather_alert(weather_data: Dict[str, str], guild_settings: Dict[str, any]) -> discord.Embed:
     """Create a dramatic and eye-catching alert embed for extreme weather conditions."""
-    # Define weather condition icons
-    condition_icons = {
-        # Extreme weather conditions with icons matching their names/effects
-        "Typhoon 🌀": "https://cdn-icons-png.flaticon.com/512/7469/7469118.png",          # Typhoon/cyclone icon
-        "Hurricane 🌀": "https://cdn-icons-png.flaticon.com/512/18370/18370248.png",        # Hurricane icon
-        "Flash Flooding 🌊": "https://cdn-icons-png.flaticon.com/512/15788/15788723.png",   # Flood icon
-        "Acid Rain ☢️": "https://cdn-icons-png.flaticon.com/512/13748/13748298.png",        # Acid rain icon
-        "Tornado 🌪️": "https://cdn-icons-png.flaticon.com/512/4165/4165988.png",         # Tornado icon
-        "Ice Storm 🧊": "https://cdn-icons-png.flaticon.com/512/13753/13753017.png",        # Ice storm icon
-        "Flash Freeze 🥶": "https://cdn-icons-png.flaticon.com/512/13748/13748308.png",     # Freeze icon
-        "Heavy Smog 🟣": "https://cdn-icons-png.flaticon.com/512/5782/5782192.png",       # Smog/pollution icon
-        "Blood Fog 🔴": "https://cdn-icons-png.flaticon.com/512/13748/13748627.png",        # Red fog icon
-        "Lightning Storm ⚡": "https://cdn-icons-png.flaticon.com/512/3032/3032738.png",  # Lightning icon
-        "Noxious Gas ☁️": "https://cdn-icons-png.flaticon.com/512/13748/13748288.png"       # Toxic gas icon
-    }
-    
     # Use the guild's configured embed color instead of condition-specific colors
     condition = weather_data["condition"]
-    
-    embed = discord.Embed(
-        title=f"⚠️ EXTREME WEATHER ALERT ⚠️",
-        description=f"**{condition.upper()}** has been detected in your area!\nTake necessary precautions!",
-        color=discord.Color(guild_settings.get("embed_color", 0xFF0000))
-    )
-    
-    # Add a timestamp for urgency
-    embed.timestamp = datetime.datetime.utcnow()
-    
-    # Set thumbnail based on condition
-    if condition in condition_icons:
-        embed.set_thumbnail(url=condition_icons[condition])
-    
-    # Add an image for visual impact - dramatic severe weather warning banner
-    embed.set_image(url="https://file.taako.org/api/file/share.php?token=2bc05c04ade85792546ff265bd6c345d")
+    template = _get_alert_template(condition, int(guild_settings.get("embed_color", 0xFF0000)))
     
     # Temperature with alert formatting
     temp = weather_data["temperature_f"]
     feels_like = weather_data["feels_like"]
     if temp != feels_like:
-        embed.add_field(
-            name="🌡️ Current Temperature | 🌡️ Feels Like",
-            value=f"**{temp}** | **{feels_like}**",
-            inline=False
-        )
+        temperature = {
+            "name": "🌡️ Current Temperature | 🌡️ Feels Like",
+            "value": f"**{temp}** | **{feels_like}**",
+            "inline": False
+        }
     else:
-        embed.add_field(
-            name="🌡️ Current Temperature",
-            value=f"**{temp}**",
-            inline=False
-        )
-    
-    # Add danger level based on condition
-    danger_levels = {
-        "Typhoon 🌀": "SEVERE",
-        "Hurricane 🌀": "SEVERE",
-        "Tornado 🌪️": "EXTREME",
-        "Flash Flooding 🌊": "HIGH",
-        "Ice Storm 🧊": "HIGH",
-        "Flash Freeze 🥶": "HIGH",
-        "Acid Rain ☢️": "MODERATE",
-        "Heavy Smog 🟣": "MODERATE",
-        "Blood Fog 🔴": "UNKNOWN",
-        "Lightning Storm ⚡": "HIGH",
-        "Noxious Gas ☁️": "HIGH"
-    }
-    
-    danger = danger_levels.get(condition, "HIGH")
-    embed.add_field(
-        name="⚠️ DANGER LEVEL",
-        value=f"**{danger}**",
-        inline=True
-    )
-    
-    # Wind, Humidity, and Visibility with alert formatting
-    embed.add_field(
-        name="🌬️ Wind Speed",
-        value=f"**{weather_data['wind_speed']}**",
-        inline=True
-    )
-    
-    embed.add_field(
-        name="👀 Visibility",
-        value=f"**{weather_data['visibility']}**",
-        inline=True
-    )
-    
-    # Add special recommendations based on condition
-    recommendations = {
-        "Typhoon 🌀": "Seek sturdy shelter immediately. Stay away from windows.",
-        "Hurricane 🌀": "Evacuate low-lying areas. Secure property and seek stable shelter.",
-        "Tornado 🌪️": "Go to basement or interior room. Stay away from windows.",
-        "Flash Flooding 🌊": "Move to higher ground. Do not walk or drive through floodwaters.",
-        "Ice Storm 🧊": "Stay indoors. Roads are extremely hazardous.",
-        "Flash Freeze 🥶": "Seek warm shelter. Protect exposed skin from frostbite.",
-        "Acid Rain ☢️": "Stay indoors. Cover vehicles and sensitive equipment.",
-        "Heavy Smog 🟣": "Wear respiratory protection. Limit outdoor activities.",
-        "Blood Fog 🔴": "Unknown phenomenon. Stay indoors until cleared.",
-        "Lightning Storm ⚡": "Stay indoors. Avoid open areas and tall structures.",
-        "Noxious Gas ☁️": "Evacuate area immediately. Use breathing protection."
-    }
-    
-    embed.add_field(
-        name="🚨 SAFETY RECOMMENDATIONS",
-        value=recommendations.get(condition, "Seek shelter and await further instructions."),
-        inline=False
-    )
+        temperature = {"name": "🌡️ Current Temperature", "value": f"**{temp}**", "inline": False}
+    
+    embed = _embed_from_template(template, [
+        temperature,
+        {"name": "⚠️ DANGER LEVEL", "value": f"**{DANGER_LEVELS.get(condition, 'HIGH')}**", "inline": True},
+        {"name": "🌬️ Wind Speed", "value": f"**{weather_data['wind_speed']}**", "inline": True},
+        {"name": "👀 Visibility", "value": f"**{weather_data['visibility']}**", "inline": True},
+        {
+            "name": "🚨 SAFETY RECOMMENDATIONS",
+            "value": RECOMMENDATIONS.get(condition, "Seek shelter and await further instructions."),
+            "inline": False
+        }
+    ])
     
-    # Footer with warning
-    embed.set_footer(text="⚠️ This is a extreme weather alert! ⚠️")
+    # Add a timestamp for urgency
+    embed.timestamp = datetime.datetime.utcnow()
     
     return embed
 
 def is_extreme_weather(condition: str) -> bool:
     """Check if the weather condition is considered extreme/severe weather."""
-    # These match exactly with the keys in condition_icons dictionary in create_extreme_weather_alert
-    extreme_conditions = [
-        "Typhoon 🌀", 
-        "Flash Flooding 🌊", 
-        "Acid Rain ☢️", 
-        "Hurricane 🌀", 
-        "Tornado 🌪️", 
-        "Ice Storm 🧊", 
-        "Flash Freeze 🥶", 
-        "Heavy Smog 🟣", 
-        "Blood Fog 🔴", 
-        "Lightning Storm ⚡", 
-        "Noxious Gas ☁️"
-    ]
-    return condition in extreme_conditions
-
-def generate_extreme_weather(time_zone: str) -> Dict[str, str]:
+    return condition in _EXTREME_CONDITION_SET
+
+def generate_extreme_weather(time_zone: str, rng: Optional[random.Random] = None) -> Dict[str, str]:
     """
     Generate random extreme weather data.
     
@@ -453,87 +565,48 @@ def generate_extreme_weather(time_zone: str) -> Dict[str, str]:
     ----------
     time_zone : str
         The timezone to use for time calculations
+    rng : Optional[random.Random]
+        Random source to draw from; defaults to the module's private generator
     
     Returns
     -------
     Dict[str, str]
         Weather data with a randomly selected extreme condition
     """
-    current_time = datetime.datetime.now()
-    if HAS_PYTZ and time_zone:
-        try:
-            tz = pytz.timezone(time_zone)
-            current_time = datetime.datetime.now(tz)
-        except Exception:
-            pass  # Fall back to default time
-    
-    # List of all extreme weather conditions
-    # These match exactly with the keys in condition_icons dictionary in create_extreme_weather_alert
-    extreme_conditions = [
-        "Typhoon 🌀", 
-        "Flash Flooding 🌊", 
-        "Acid Rain ☢️", 
-        "Hurricane 🌀", 
-        "Tornado 🌪️", 
-        "Ice Storm 🧊", 
-        "Flash Freeze 🥶", 
-        "Heavy Smog 🟣", 
-        "Blood Fog 🔴", 
-        "Lightning Storm ⚡", 
-        "Noxious Gas ☁️"
-    ]
+    if rng is None:
+        rng = _extreme_rng
+    current_time = get_local_time(time_zone)
     
     # Get seasonal temperature ranges (we'll still respect the temperature range for the season)
     min_temp, max_temp, _ = get_seasonal_ranges(current_time.month)
     
     # Generate base temperature with more extreme variance
     # For extreme conditions, we'll push toward the edges of the range
-    if random.choice([True, False]):  # 50% chance for extremely hot
-        temp_f = random.randint(max(max_temp - 10, min_temp), max_temp + 15)
+    if rng.choice([True, False]):  # 50% chance for extremely hot
+        temp_f = rng.randint(max(max_temp - 10, min_temp), max_temp + 15)
     else:  # 50% chance for extremely cold
-        temp_f = random.randint(min_temp - 15, min(min_temp + 10, max_temp))
-    
-    temp_c = round((temp_f - 32) * 5/9, 1)
+        temp_f = rng.randint(min_temp - 15, min(min_temp + 10, max_temp))
     
     # Randomly select an extreme condition
-    condition = random.choice(extreme_conditions)
+    condition = rng.choice(EXTREME_CONDITIONS)
     
     # Get condition-appropriate humidity and visibility
-    humidity, visibility = get_condition_based_values(condition)
+    humidity, visibility = get_condition_based_values(condition, rng)
     
     # Generate wind speed based on condition - more extreme than normal
     if condition in ["Typhoon 🌀", "Hurricane 🌀"]:
-        wind_speed = random.randint(95, 140)  # More extreme winds
+        wind_speed = rng.randint(95, 140)  # More extreme winds
     elif condition == "Tornado 🌪️":
-        wind_speed = random.randint(85, 175)  # More extreme tornado winds
+        wind_speed = rng.randint(85, 175)  # More extreme tornado winds
     elif condition in ["Flash Flooding 🌊", "Acid Rain ☢️", "Ice Storm 🧊", "Lightning Storm ⚡"]:
-        wind_speed = random.randint(30, 60)  # More extreme storm winds
+        wind_speed = rng.randint(30, 60)  # More extreme storm winds
     elif condition == "Flash Freeze 🥶":
-        wind_speed = random.randint(25, 45)  # More extreme cold winds
+        wind_speed = rng.randint(25, 45)  # More extreme cold winds
     else:
-        wind_speed = random.randint(15, 35)  # Generally more extreme winds
+        wind_speed = rng.randint(15, 35)  # Generally more extreme winds
     
     # Calculate feels like temperature
     feels_like = calculate_feels_like(temp_f, humidity, wind_speed)
     
-    # Determine season based on month
-    if current_time.month in (3, 4, 5):
-        season = "Spring 🌸"
-    elif current_time.month in (6, 7, 8):
-        season = "Summer ☀️"
-    elif current_time.month in (9, 10, 11):
-        season = "Fall 🍂"
-    else:
-        season = "Winter ❄️"
-    
-    return {
-        "temperature_f": f"{temp_f}°F",
-        "temperature_c": f"{temp_c}°C",
-        "feels_like": f"{feels_like}°F",
-        "humidity": f"{humidity}%",
-        "wind_speed": f"{wind_speed} mph",
-        "visibility": f"{visibility} miles",
-        "condition": condition,
-        "season": season,
-        "time": current_time.strftime("%I:%M %p")
-    }
+    record = WeatherRecord(temp_f, CONDITION_IDS[condition], humidity, wind_speed, visibility, feels_like)
+    return format_weather(record, current_time)
@@ -0,0 +1,137 @@
+"""Shared audit log lookups for YALC moderation attribution."""
+import asyncio
+import datetime
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+import discord
+
+AuditKey = Tuple[discord.AuditLogAction, int]
+
+# How much earlier than the gateway event its audit log entry may be stamped
+EVENT_SLACK = 2.0
+
+
+class _GuildAuditSnapshot:
+    """Recent audit log entries for one guild, indexed by (action, target ID)."""
+
+    __slots__ = ("fetched_at", "started_at", "entries")
+
+    def __init__(self, fetched_at: float, started_at: datetime.datetime,
+                 entries: Dict[AuditKey, discord.AuditLogEntry]) -> None:
+        self.fetched_at = fetched_at
+        self.started_at = started_at
+        self.entries = entries
+
+
+class AuditLogReader:
+    """
+    Per-guild audit log reader shared by every listener that needs "who did it".
+
+    Each guild's audit log is fetched at most once per ``window`` seconds, and
+    handlers that ask while a fetch is running wait on that same request. A
+    lookup whose event happened after the snapshot was requested refetches
+    instead of trusting a snapshot that can't contain its entry.
+
+    Parameters
+    ----------
+    window: float
+        How long a fetched snapshot is reused before the next lookup refetches
+    limit: int
+        Number of recent entries to read per fetch
+    """
+
+    def __init__(self, window: float = 3.0, limit: int = 25) -> None:
+        self.window = window
+        self.limit = limit
+        self._snapshots: Dict[int, _GuildAuditSnapshot] = {}
+        self._inflight: Dict[int, Tuple[datetime.datetime, "asyncio.Task[_GuildAuditSnapshot]"]] = {}
+        self.log = logging.getLogger("red.taako.yalc.audit")
+
+    async def _fetch(self, guild: discord.Guild, started_at: datetime.datetime) -> _GuildAuditSnapshot:
+        """Read the guild's most recent audit log entries and index them."""
+        entries: Dict[AuditKey, discord.AuditLogEntry] = {}
+        try:
+            async for entry in guild.audit_logs(limit=self.limit):
+                target_id = getattr(entry.target, "id", None)
+                if target_id is None:
+                    continue
+                # Entries arrive newest first; keep the most recent per key
+                entries.setdefault((entry.action, target_id), entry)
+        except Exception as e:
+            self.log.debug(f"Could not fetch audit logs for guild {guild.id}: {e}")
+        snapshot = _GuildAuditSnapshot(time.monotonic(), started_at, entries)
+        current = self._snapshots.get(guild.id)
+        if current is None or current.started_at <= started_at:
+            self._snapshots[guild.id] = snapshot
+        return snapshot
+
+    async def _get_snapshot(self, guild: discord.Guild,
+                            since: Optional[datetime.datetime] = None) -> _GuildAuditSnapshot:
+        """
+        Return a fresh snapshot, joining an in-flight fetch if there is one.
+
+        With ``since``, only a snapshot requested at or after that time is used.
+        """
+        snapshot = self._snapshots.get(guild.id)
+        if (snapshot and time.monotonic() - snapshot.fetched_at < self.window
+                and (since is None or snapshot.started_at >= since)):
+            return snapshot
+        inflight = self._inflight.get(guild.id)
+        if inflight is None or (since is not None and inflight[0] < since):
+            started_at = datetime.datetime.now(datetime.UTC)
+            task = asyncio.create_task(self._fetch(guild, started_at))
+            inflight = self._inflight[guild.id] = (started_at, task)
+
+            def _done(_, guild_id=guild.id, inflight=inflight) -> None:
+                if self._inflight.get(guild_id) is inflight:
+                    del self._inflight[guild_id]
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(inflight[1])
+
+    async def find(self, guild: discord.Guild, action: discord.AuditLogAction, target_id: int,
+                   max_age: float = 60.0,
+                   event_time: Optional[datetime.datetime] = None) -> Optional[discord.AuditLogEntry]:
+        """
+        Find the audit log entry for an action on a target, if there is a recent one.
+
+        Parameters
+        ----------
+        guild: discord.Guild
+            The guild the action happened in
+        action: discord.AuditLogAction
+            The audit log action to look for
+        target_id: int
+            The ID of the user, channel or role the action targeted
+        max_age: float
+            Ignore entries older than this many seconds
+        event_time: Optional[datetime.datetime]
+            When the action was seen, defaulting to now. If the cached snapshot
+            predates it and has no entry at least this recent, the audit log is
+            read again so an older entry for the same target isn't reported
+
+        Returns
+        -------
+        Optional[discord.AuditLogEntry]
+            The matching entry, or None if not found or the audit log can't be read
+        """
+        if not guild.me or not guild.me.guild_permissions.view_audit_log:
+            return None
+        now = datetime.datetime.now(datetime.UTC)
+        event_time = event_time or now
+        earliest = event_time - datetime.timedelta(seconds=EVENT_SLACK)
+        snapshot = await self._get_snapshot(guild)
+        entry = snapshot.entries.get((action, target_id))
+        if (entry is None or entry.created_at < earliest) and snapshot.started_at < event_time:
+            snapshot = await self._get_snapshot(guild, since=event_time)
+            entry = snapshot.entries.get((action, target_id))
+        if entry is None or entry.created_at < earliest:
+            return None
+        age = datetime.datetime.now(datetime.UTC) - entry.created_at
+        return entry if age.total_seconds() <= max_age else None
+
+    def forget(self, guild_id: int) -> None:
+        """Drop a guild's cached snapshot."""
+        self._snapshots.pop(guild_id, None)
@@ -109,7 +109,7 @@ class DashboardIntegration:
         html.append('</div>')
         html.append('<div class="form-group">')
         html.append('<label>Tupperbox Bot IDs (comma-separated)</label>')
-        html.append(f'<input type="text" class="form-control" name="tupperbox_ids" value="{",".join(settings["tupperbox_ids"])}">')
+        html.append(f'<input type="text" class="form-control" name="tupperbox_ids" value="{",".join(str(i) for i in settings["tupperbox_ids"])}">')
         html.append('</div></div></div></div></div>')
         html.append('<div class="form-group mt-3">')
         html.append('<button type="submit" class="btn btn-primary">Save Settings</button>')
@@ -118,20 +118,23 @@ class DashboardIntegration:
 
     async def _handle_settings_post(self, guild: discord.Guild, data: dict) -> None:
         """Handle POST data from the dashboard settings form."""
-        events_config = await self.cog.config.guild(guild).events()
-        for event in self.cog.event_descriptions:
-            events_config[event] = data.get(f"event_{event}") == "true"
-        await self.cog.config.guild(guild).events.set(events_config)
-        channel_config = {}
-        for event in self.cog.event_descriptions:
-            channel_id = data.get(f"channel_{event}")
-            if channel_id and channel_id.isdigit():
-                channel_config[event] = int(channel_id)
-        await self.cog.config.guild(guild).event_channels.set(channel_config)
-        ignore_tupperbox = data.get("ignore_tupperbox") == "true"
-        await self.cog.config.guild(guild).ignore_tupperbox.set(ignore_tupperbox)
-        tupperbox_ids = [id.strip() for id in data.get("tupperbox_ids", "").split(",") if id.strip().isdigit()]
-        await self.cog.config.guild(guild).tupperbox_ids.set(tupperbox_ids)
+        try:
+            events_config = await self.cog.config.guild(guild).events()
+            for event in self.cog.event_descriptions:
+                events_config[event] = data.get(f"event_{event}") == "true"
+            await self.cog.config.guild(guild).events.set(events_config)
+            channel_config = {}
+            for event in self.cog.event_descriptions:
+                channel_id = data.get(f"channel_{event}")
+                if channel_id and channel_id.isdigit():
+                    channel_config[event] = int(channel_id)
+            await self.cog.config.guild(guild).event_channels.set(channel_config)
+            ignore_tupperbox = data.get("ignore_tupperbox") == "true"
+            await self.cog.config.guild(guild).ignore_tupperbox.set(ignore_tupperbox)
+            tupperbox_ids = [int(id.strip()) for id in data.get("tupperbox_ids", "").split(",") if id.strip().isdigit()]
+            await self.cog.config.guild(guild).tupperbox_ids.set(tupperbox_ids)
+        finally:
+            self.cog.invalidate_guild_settings(guild)
 
     @dashboard_page("test", "YALC Test Page", methods=("GET", "POST"))
     async def dashboard_test(self, request, guild):
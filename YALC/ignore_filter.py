@@ -0,0 +1,138 @@
+"""Precompiled per-guild ignore filter for YALC."""
+from typing import FrozenSet, Iterable, Optional, Union
+
+import discord
+
+# Fallback proxy bot ID when a guild has none configured (Tupperbox)
+DEFAULT_TUPPERBOX_IDS = (239232811662311425,)
+
+# Common proxy bot command prefixes (Tupperbox often deletes these right after proxying)
+PROXY_COMMAND_PREFIXES = (";", "!", "//", "pk;", "tb:", "$", "t!")
+
+
+def normalize_ids(ids: Iterable[Union[int, str]]) -> FrozenSet[int]:
+    """Convert stored IDs (older configs saved them as strings) to a frozenset of ints."""
+    normalized = set()
+    for value in ids:
+        if isinstance(value, int):
+            normalized.add(value)
+        elif isinstance(value, str) and value.strip().isdigit():
+            normalized.add(int(value.strip()))
+    return frozenset(normalized)
+
+
+class GuildFilter:
+    """
+    Immutable snapshot of a guild's ignore settings, compiled for fast checks.
+
+    Built once from the guild's settings and rebuilt only when they change, so
+    listeners can filter events synchronously with set lookups instead of
+    scanning the stored lists.
+    """
+
+    __slots__ = (
+        "enabled_events",
+        "ignored_channels",
+        "ignored_categories",
+        "ignored_users",
+        "ignored_roles",
+        "tupperbox_ids",
+        "message_prefixes",
+        "webhook_name_filters",
+        "ignore_tupperbox",
+        "detect_proxy_deletes",
+        "ignore_webhooks",
+        "ignore_apps",
+        "ignore_bots",
+    )
+
+    def __init__(self, settings: dict) -> None:
+        self.enabled_events = frozenset(event for event, enabled in settings["events"].items() if enabled)
+        self.ignored_channels = frozenset(settings.get("ignored_channels", []))
+        self.ignored_categories = frozenset(settings.get("ignored_categories", []))
+        self.ignored_users = frozenset(settings.get("ignored_users", []))
+        self.ignored_roles = frozenset(settings.get("ignored_roles", []))
+        self.tupperbox_ids = normalize_ids(settings.get("tupperbox_ids", DEFAULT_TUPPERBOX_IDS))
+        self.message_prefixes = tuple(settings.get("message_prefix_filter", []))
+        self.webhook_name_filters = tuple(f.lower() for f in settings.get("webhook_name_filter", []))
+        self.ignore_tupperbox = settings.get("ignore_tupperbox", True)
+        self.detect_proxy_deletes = settings.get("detect_proxy_deletes", True)
+        self.ignore_webhooks = settings.get("ignore_webhooks", False)
+        self.ignore_apps = settings.get("ignore_apps", True)
+        self.ignore_bots = settings.get("ignore_bots", False)
+
+    def is_enabled(self, event_type: str) -> bool:
+        """Return True if logging is enabled for this event type."""
+        return event_type in self.enabled_events
+
+    def is_ignored_channel(self, channel: discord.abc.GuildChannel) -> bool:
+        """Return True if the channel, its category or its parent channel is ignored."""
+        if channel.id in self.ignored_channels:
+            return True
+        if isinstance(channel, discord.TextChannel) and channel.category:
+            if channel.category.id in self.ignored_categories:
+                return True
+        if isinstance(channel, discord.Thread) and channel.parent:
+            if channel.parent.id in self.ignored_channels:
+                return True
+        return False
+
+    def is_ignored_user(self, user: Union[discord.Member, discord.User]) -> bool:
+        """Return True if the user is ignored directly, by role, or as a bot."""
+        if user.id in self.ignored_users:
+            return True
+        if self.ignored_roles and isinstance(user, discord.Member):
+            if any(role.id in self.ignored_roles for role in user.roles):
+                return True
+        return self.ignore_bots and getattr(user, "bot", False)
+
+    def is_ignored_message(self, message: discord.Message) -> bool:
+        """Return True if the message is from a known proxy bot, a webhook or an app."""
+        if self.ignore_tupperbox and message.author.id in self.tupperbox_ids:
+            return True
+        if self.ignore_webhooks and getattr(message, "webhook_id", None):
+            return True
+        return bool(self.ignore_apps and getattr(message, "application", None))
+
+    def matches(self, event_type: str,
+                channel: Optional[discord.abc.GuildChannel] = None,
+                user: Optional[Union[discord.Member, discord.User]] = None,
+                message: Optional[discord.Message] = None) -> bool:
+        """
+        Check whether an event passes this guild's filter and should be logged.
+
+        Only synchronous checks are done here; resolving replies to proxy
+        messages is left to the caller.
+
+        Parameters
+        ----------
+        event_type: str
+            The type of event being checked
+        channel: Optional[discord.abc.GuildChannel]
+            The channel where the event occurred, if applicable
+        user: Optional[Union[discord.Member, discord.User]]
+            The user who triggered the event, if applicable
+        message: Optional[discord.Message]
+            The message involved in the event, if applicable
+
+        Returns
+        -------
+        bool
+            True if the event should be logged, False if it should be ignored
+        """
+        if event_type not in self.enabled_events:
+            return False
+        if channel is not None and self.is_ignored_channel(channel):
+            return False
+        if user is not None and self.is_ignored_user(user):
+            return False
+        if message is not None and self.is_ignored_message(message):
+            return False
+        return True
+
+    def is_proxy_command(self, content: str) -> bool:
+        """Return True if message content looks like a proxy command or a filtered prefix."""
+        content = content.lower()
+        return content.startswith(PROXY_COMMAND_PREFIXES) or (
+            bool(self.message_prefixes) and content.startswith(self.message_prefixes)
+        )
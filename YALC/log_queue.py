@@ -0,0 +1,256 @@
+"""Batched per-channel log delivery for YALC."""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import discord
+
+# Discord limits for a single message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Seconds to wait before retrying a send that failed with a 429 or 5xx
+RETRY_DELAY = 2.0
+
+# What to do when a channel's queue is full
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+BLOCK = "block"
+QUEUE_POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+SendFunc = Callable[..., Awaitable[Optional[discord.Message]]]
+
+
+class _ChannelQueue:
+    """Pending embeds and delivery stats for one log channel."""
+
+    __slots__ = (
+        "channel", "pending", "batch_size", "worker", "arrived", "not_full",
+        "dropped", "messages_sent", "embeds_sent", "last_latency", "avg_latency",
+    )
+
+    def __init__(self, channel: discord.abc.Messageable, batch_size: int) -> None:
+        self.channel = channel
+        self.pending: Deque[Tuple[float, discord.Embed]] = deque()
+        self.batch_size = batch_size
+        self.worker: Optional[asyncio.Task] = None
+        self.arrived = asyncio.Event()
+        self.not_full = asyncio.Event()
+        self.not_full.set()
+        self.dropped = 0
+        self.messages_sent = 0
+        self.embeds_sent = 0
+        self.last_latency = 0.0
+        self.avg_latency = 0.0
+
+
+class LogDeliveryQueue:
+    """
+    Coalesce log embeds per channel and send them in as few messages as possible.
+
+    Each channel gets a worker task that waits up to ``flush_delay`` seconds for
+    more embeds (or until a full batch is ready), then sends up to
+    ``MAX_EMBEDS_PER_MESSAGE`` embeds in one message. Workers exit once their
+    channel is drained and are restarted by the next ``put``.
+
+    Parameters
+    ----------
+    send: SendFunc
+        Coroutine used to deliver a batch, called as ``send(channel, embeds=[...])``.
+        It should let ``discord.HTTPException`` propagate so failed batches can be
+        retried or split; returning None counts the batch as undeliverable
+    flush_delay: float
+        Maximum time an embed waits for others to join its batch
+    max_pending: int
+        Maximum number of queued embeds per channel before the policy applies
+    policy: str
+        One of ``drop_oldest``, ``drop_newest`` or ``block``
+    block_timeout: float
+        How long ``put`` waits for room under the ``block`` policy before dropping
+    """
+
+    def __init__(self, send: SendFunc, flush_delay: float = 1.0, max_pending: int = 500,
+                 policy: str = DROP_OLDEST, block_timeout: float = 5.0) -> None:
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+        self._send = send
+        self.flush_delay = flush_delay
+        self.max_pending = max_pending
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self._queues: Dict[int, _ChannelQueue] = {}
+        self._closed = False
+        self.log = logging.getLogger("red.taako.yalc.queue")
+
+    async def put(self, channel: discord.abc.Messageable, embed: discord.Embed,
+                  batch_size: int = MAX_EMBEDS_PER_MESSAGE) -> bool:
+        """
+        Queue an embed for delivery to a channel.
+
+        Parameters
+        ----------
+        channel: discord.abc.Messageable
+            The log channel to deliver to
+        embed: discord.Embed
+            The embed to send
+        batch_size: int
+            Maximum embeds per message for this channel (capped at Discord's limit of 10)
+
+        Returns
+        -------
+        bool
+            True if the embed was queued, False if it was dropped
+        """
+        if self._closed:
+            return False
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = self._queues[channel.id] = _ChannelQueue(channel, batch_size)
+        queue.channel = channel
+        queue.batch_size = max(1, min(batch_size, MAX_EMBEDS_PER_MESSAGE))
+
+        if len(queue.pending) >= self.max_pending:
+            if self.policy == BLOCK:
+                queue.not_full.clear()
+                try:
+                    await asyncio.wait_for(queue.not_full.wait(), timeout=self.block_timeout)
+                except asyncio.TimeoutError:
+                    pass
+            if len(queue.pending) >= self.max_pending:
+                queue.dropped += 1
+                if self.policy == DROP_NEWEST:
+                    self.log.debug(f"Log queue for channel {channel.id} is full; dropping new embed")
+                    return False
+                queue.pending.popleft()
+                self.log.debug(f"Log queue for channel {channel.id} is full; dropping oldest embed")
+
+        queue.pending.append((time.monotonic(), embed))
+        queue.arrived.set()
+        if queue.worker is None or queue.worker.done():
+            queue.worker = asyncio.create_task(self._run(queue))
+        return True
+
+    def _take_batch(self, queue: _ChannelQueue) -> Tuple[List[discord.Embed], float]:
+        """Pop the next batch that fits in one message, returning it with its oldest enqueue time."""
+        batch: List[discord.Embed] = []
+        oldest = queue.pending[0][0]
+        total_chars = 0
+        while queue.pending and len(batch) < queue.batch_size:
+            size = len(queue.pending[0][1])
+            if batch and total_chars + size > MAX_EMBED_CHARS_PER_MESSAGE:
+                break
+            total_chars += size
+            batch.append(queue.pending.popleft()[1])
+        if len(queue.pending) < self.max_pending:
+            queue.not_full.set()
+        return batch, oldest
+
+    async def _send_batch(self, channel: discord.abc.Messageable,
+                          batch: List[discord.Embed]) -> Optional[discord.Message]:
+        """Send one message, retrying once if Discord fails with a 429 or 5xx."""
+        try:
+            return await self._send(channel, embeds=batch)
+        except discord.HTTPException as e:
+            if e.status != 429 and e.status < 500:
+                raise
+            self.log.warning(f"Transient error ({e.status}) delivering log embeds to channel {channel.id}; retrying")
+            await asyncio.sleep(RETRY_DELAY)
+            return await self._send(channel, embeds=batch)
+
+    async def _deliver(self, channel: discord.abc.Messageable, batch: List[discord.Embed]) -> Tuple[int, int]:
+        """
+        Deliver a batch, falling back to one message per embed if Discord rejects it.
+
+        A 400 usually means a single embed is invalid, so the batch is resent one
+        embed at a time and only the rejected embeds are dropped.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The number of messages and embeds sent
+        """
+        try:
+            message = await self._send_batch(channel, batch)
+        except discord.HTTPException as e:
+            if e.status != 400 or len(batch) == 1:
+                self.log.error(f"Failed to deliver {len(batch)} log embeds to channel {channel.id}: {e}")
+                return 0, 0
+            self.log.warning(f"Channel {channel.id} rejected a batch of {len(batch)} log embeds; sending them singly")
+        except Exception as e:
+            self.log.error(f"Failed to deliver {len(batch)} log embeds to channel {channel.id}: {e}", exc_info=True)
+            return 0, 0
+        else:
+            return (1, len(batch)) if message is not None else (0, 0)
+
+        sent = 0
+        for embed in batch:
+            try:
+                if await self._send_batch(channel, [embed]) is not None:
+                    sent += 1
+            except Exception as e:
+                self.log.error(f"Dropped a log embed ({embed.title!r}) for channel {channel.id}: {e}")
+        return sent, sent
+
+    async def _run(self, queue: _ChannelQueue) -> None:
+        """Deliver a channel's queue in batches until it is empty."""
+        while queue.pending:
+            # Give a burst a moment to fill the batch unless it is already full
+            deadline = queue.pending[0][0] + self.flush_delay
+            while len(queue.pending) < queue.batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                queue.arrived.clear()
+                try:
+                    await asyncio.wait_for(queue.arrived.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            batch, oldest = self._take_batch(queue)
+            messages, embeds = await self._deliver(queue.channel, batch)
+            if not messages:
+                continue
+            latency = time.monotonic() - oldest
+            queue.messages_sent += messages
+            queue.embeds_sent += embeds
+            queue.last_latency = latency
+            queue.avg_latency = latency if queue.messages_sent == 1 else queue.avg_latency * 0.9 + latency * 0.1
+
+    def stats(self, channel_ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        """
+        Get queue depth and flush latency metrics.
+
+        Parameters
+        ----------
+        channel_ids: Optional[List[int]]
+            Restrict the result to these channels
+
+        Returns
+        -------
+        Dict[int, dict]
+            Metrics keyed by channel ID
+        """
+        ids = self._queues.keys() if channel_ids is None else [c for c in channel_ids if c in self._queues]
+        return {
+            channel_id: {
+                "depth": len(self._queues[channel_id].pending),
+                "dropped": self._queues[channel_id].dropped,
+                "messages_sent": self._queues[channel_id].messages_sent,
+                "embeds_sent": self._queues[channel_id].embeds_sent,
+                "last_latency": self._queues[channel_id].last_latency,
+                "avg_latency": self._queues[channel_id].avg_latency,
+            }
+            for channel_id in ids
+        }
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Stop accepting embeds, flush what is queued, and cancel anything still running."""
+        self._closed = True
+        for queue in self._queues.values():
+            queue.arrived.set()
+        workers = [q.worker for q in self._queues.values() if q.worker and not q.worker.done()]
+        if workers:
+            _, pending = await asyncio.wait(workers, timeout=timeout)
+            for task in pending:
+                task.cancel()
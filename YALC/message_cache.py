@@ -0,0 +1,57 @@
+"""Bounded message author cache for YALC."""
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import discord
+
+
+class MessageAuthorCache:
+    """
+    LRU map of recently seen message IDs to their author IDs.
+
+    Fed from gateway message events so reply checks can find who wrote the
+    referenced message without a REST round-trip.
+
+    Parameters
+    ----------
+    max_size: int
+        Maximum number of messages to remember
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        self._authors: "OrderedDict[int, int]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._authors)
+
+    def add(self, message_id: int, author_id: int) -> None:
+        """Remember the author of a message, evicting the least recently used entry if full."""
+        authors = self._authors
+        if message_id in authors:
+            authors.move_to_end(message_id)
+        authors[message_id] = author_id
+        if len(authors) > self.max_size:
+            authors.popitem(last=False)
+
+    def add_message(self, message: discord.Message) -> None:
+        """Remember a message's author, along with the author of the message it replies to if resolved."""
+        author = getattr(message, "author", None)
+        if author is not None:
+            self.add(message.id, author.id)
+        reference = getattr(message, "reference", None)
+        resolved = getattr(reference, "resolved", None) if reference else None
+        if isinstance(resolved, discord.Message):
+            self.add(resolved.id, resolved.author.id)
+
+    def add_messages(self, messages: Iterable[discord.Message]) -> None:
+        """Remember the authors of several messages."""
+        for message in messages:
+            self.add_message(message)
+
+    def get(self, message_id: int) -> Optional[int]:
+        """Return the cached author ID for a message, if known."""
+        author_id = self._authors.get(message_id)
+        if author_id is not None:
+            self._authors.move_to_end(message_id)
+        return author_id
@@ -5,12 +5,16 @@ A comprehensive logging solution with both classic and slash commands.
 import discord
 from redbot.core import Config, commands, app_commands
 from redbot.core.bot import Red
-from typing import Dict, List, Optional, Union, cast
+from typing import Dict, FrozenSet, List, Optional, Union, cast
 import datetime
 import asyncio
 import logging
 from redbot.core import modlog
 from .dashboard_integration import DashboardIntegration
+from .ignore_filter import GuildFilter, normalize_ids
+from .log_queue import LogDeliveryQueue, MAX_EMBEDS_PER_MESSAGE
+from .message_cache import MessageAuthorCache
+from .audit_log import AuditLogReader
 
 class YALC(commands.Cog):
     """Yet Another Logging Cog for Red-DiscordBot.
@@ -123,14 +127,14 @@ class YALC(commands.Cog):
             # Tupperbox and Discord app filtering settings
             "ignore_tupperbox": True,
             "tupperbox_ids": [
-                "239232811662311425",  # Default Tupperbox bot ID
-                "431544605209788416",  # Tupper.io
-                "508808937294331904",  # PluralKit
-                "466378653216014359",  # Tupperbox fork
-                "798482360910127104",  # PluralKit webhook service
-                "782749873194696734",  # Another proxy bot
-                "689490322539159592",  # Yet another proxy bot
-                "765338157961879563"   # TupperBox Beta
+                239232811662311425,  # Default Tupperbox bot ID
+                431544605209788416,  # Tupper.io
+                508808937294331904,  # PluralKit
+                466378653216014359,  # Tupperbox fork
+                798482360910127104,  # PluralKit webhook service
+                782749873194696734,  # Another proxy bot
+                689490322539159592,  # Yet another proxy bot
+                765338157961879563   # TupperBox Beta
             ],
             
             # Advanced filtering options
@@ -163,12 +167,79 @@ class YALC(commands.Cog):
         }
         self.config = Config.get_conf(self, identifier=2394567890, force_registration=True)
         self.config.register_guild(**default_guild)
+        # Bumped when stored guild data needs migrating (1: tupperbox_ids stored as ints)
+        self.config.register_global(schema_version=0)
+
+        # Per-guild settings snapshots, loaded on first use and dropped on every write
+        self._settings_cache: Dict[int, dict] = {}
+        # Compiled ignore filters, rebuilt from the settings snapshot after invalidation
+        self._filter_cache: Dict[int, GuildFilter] = {}
+        # Per-channel batching of log embeds to cut down on HTTP requests
+        self.delivery = LogDeliveryQueue(self.send_log_batch)
+        # Recently seen message authors, so proxy reply checks rarely need fetch_message
+        self.message_authors = MessageAuthorCache()
+        # Shared, rate-limited audit log reads for moderator attribution
+        self.audit_logs = AuditLogReader()
+
+    async def get_guild_settings(self, guild: discord.Guild) -> dict:
+        """
+        Get a guild's settings, reading Config only when no snapshot is cached.
+
+        The returned dict is shared between listeners and must not be mutated.
+        Anything that writes guild settings must call ``invalidate_guild_settings``.
+
+        Parameters
+        ----------
+        guild: discord.Guild
+            The guild to load settings for
+
+        Returns
+        -------
+        dict
+            The guild's settings snapshot
+        """
+        settings = self._settings_cache.get(guild.id)
+        if settings is None:
+            settings = await self.config.guild(guild).all()
+            self._settings_cache[guild.id] = settings
+        return settings
+
+    async def get_guild_filter(self, guild: discord.Guild, settings: Optional[dict] = None) -> GuildFilter:
+        """
+        Get the compiled ignore filter for a guild, building it on first use.
+
+        Parameters
+        ----------
+        guild: discord.Guild
+            The guild to get the filter for
+        settings: Optional[dict]
+            The guild's settings, if the caller already loaded them
+
+        Returns
+        -------
+        GuildFilter
+            The guild's precompiled filter
+        """
+        guild_filter = self._filter_cache.get(guild.id)
+        if guild_filter is None:
+            if settings is None:
+                settings = await self.get_guild_settings(guild)
+            guild_filter = GuildFilter(settings)
+            self._filter_cache[guild.id] = guild_filter
+        return guild_filter
+
+    def invalidate_guild_settings(self, guild: Union[discord.Guild, int]) -> None:
+        """Drop a guild's cached settings and filter so the next event reloads them from Config."""
+        guild_id = guild if isinstance(guild, int) else guild.id
+        self._settings_cache.pop(guild_id, None)
+        self._filter_cache.pop(guild_id, None)
 
 
     async def should_log_event(self, guild: discord.Guild, event_type: str, 
                          channel: Optional[discord.abc.GuildChannel] = None, 
                          user: Optional[Union[discord.Member, discord.User]] = None,
-                         message: Optional[discord.Message] = None) -> bool:
+                         message: Optional[discord.Message] = None,
+                         settings: Optional[dict] = None) -> bool:
         """
         Check if an event should be logged based on settings and ignore lists.
         
@@ -184,6 +255,8 @@ class YALC(commands.Cog):
             The user who triggered the event, if applicable
         message: Optional[discord.Message]
             The message involved in the event, if applicable
+        settings: Optional[dict]
+            The guild's settings, if the caller already loaded them
             
         Returns
         -------
@@ -195,70 +268,16 @@ class YALC(commands.Cog):
             if not guild:
                 return False
                 
-            # Get all settings at once to minimize database calls
-            settings = await self.config.guild(guild).all()
-            
-            # 1. Check if this event type is enabled at all
-            if not settings["events"].get(event_type, False):
-                self.log.debug(f"Event type {event_type} is disabled in settings")
+            # Synchronous checks against the precompiled filter (event enabled, ignore lists)
+            guild_filter = await self.get_guild_filter(guild, settings)
+            if not guild_filter.matches(event_type, channel=channel, user=user, message=message):
+                self.log.debug(f"Event {event_type} filtered out by guild {guild.id} settings")
                 return False
-                
-            # 2. Channel-based ignore checks
-            if channel:
-                # Direct channel ignore
-                if channel.id in settings["ignored_channels"]:
-                    self.log.debug(f"Channel {channel.id} is in the ignored channels list")
-                    return False
-                
-                # Category ignore
-                if isinstance(channel, discord.TextChannel) and channel.category:
-                    ignored_categories = settings.get("ignored_categories", [])
-                    if channel.category.id in ignored_categories:
-                        self.log.debug(f"Category {channel.category.id} is in the ignored categories list")
-                        return False
-                        
-                # Thread parent ignore (if this is a thread and parent is ignored)
-                if isinstance(channel, discord.Thread) and channel.parent:
-                    if channel.parent.id in settings["ignored_channels"]:
-                        self.log.debug(f"Thread parent {channel.parent.id} is in the ignored channels list")
-                        return False
-            
-            # 3. User-based ignore checks
-            if user:
-                # Direct user ignore
-                if user.id in settings["ignored_users"]:
-                    self.log.debug(f"User {user.id} is in the ignored users list")
-                    return False
-                
-                # Role-based ignore (only for Members)
-                if isinstance(user, discord.Member):
-                    ignored_roles = settings["ignored_roles"]
-                    if any(r.id in ignored_roles for r in user.roles):
-                        self.log.debug(f"User {user.id} has a role that is in the ignored roles list")
-                        return False
-                        
-                # Bot ignore (optionally ignore all bot users)
-                if getattr(user, "bot", False) and settings.get("ignore_bots", False):
-                    self.log.debug(f"User {user.id} is a bot and bot messages are ignored")
-                    return False
             
-            # 4. Message-specific ignore checks
-            if message:
-                # Tupperbox ignore
-                if settings.get("ignore_tupperbox", True):
-                    tupperbox_ids = settings.get("tupperbox_ids", ["239232811662311425"])
-                    if await self.is_tupperbox_message(message, tupperbox_ids):
-                        self.log.debug(f"Message {message.id} detected as Tupperbox message")
-                        return False
-                
-                # Webhook ignore
-                if settings.get("ignore_webhooks", False) and getattr(message, "webhook_id", None):
-                    self.log.debug(f"Message {message.id} is from webhook {message.webhook_id} and webhooks are ignored")
-                    return False
-                    
-                # App message ignore
-                if settings.get("ignore_apps", True) and getattr(message, "application", None):
-                    self.log.debug(f"Message {message.id} is from app {message.application.id} and apps are ignored")
+            # Proxy detection may need to resolve replies, so it runs last
+            if message and guild_filter.ignore_tupperbox:
+                if await self.is_tupperbox_message(message, guild_filter.tupperbox_ids):
+                    self.log.debug(f"Message {message.id} detected as Tupperbox message")
                     return False
             
             # If we've passed all ignore checks, we should log this event
@@ -269,10 +288,12 @@ class YALC(commands.Cog):
             # Default to True if an error occurred (better to log in case of doubt)
             return True
 
-    async def get_log_channel(self, guild: discord.Guild, event_type: str) -> Optional[discord.TextChannel]:
+    async def get_log_channel(self, guild: discord.Guild, event_type: str,
+                              settings: Optional[dict] = None) -> Optional[discord.TextChannel]:
         """Get the appropriate logging channel for an event. Only event_channels is used."""
-        settings = await self.config.guild(guild).all()
-        self.log.debug(f"[get_log_channel] Guild: {guild.id}, Event: {event_type}, Settings: {settings}")
+        if settings is None:
+            settings = await self.get_guild_settings(guild)
+        self.log.debug(f"[get_log_channel] Guild: {guild.id}, Event: {event_type}")
         channel_id = settings["event_channels"].get(event_type)
         self.log.debug(f"[get_log_channel] Selected channel_id: {channel_id}")
         if not channel_id:
@@ -281,6 +302,43 @@ class YALC(commands.Cog):
         self.log.debug(f"[get_log_channel] Resolved channel: {channel}")
         return channel if isinstance(channel, discord.TextChannel) else None
 
+    async def send_log(self, channel: discord.TextChannel, embed: discord.Embed) -> bool:
+        """
+        Queue a log embed for batched delivery to a log channel.
+
+        Embeds for the same channel are coalesced into messages of up to 10 embeds,
+        or fewer if the guild's ``max_embed_count`` is lower.
+
+        Parameters
+        ----------
+        channel: discord.TextChannel
+            The log channel to deliver to
+        embed: discord.Embed
+            The embed to send
+
+        Returns
+        -------
+        bool
+            True if the embed was queued, False if it was dropped
+        """
+        if not channel:
+            self.log.warning("Attempted to queue a log for a nonexistent channel")
+            return False
+        settings = await self.get_guild_settings(channel.guild)
+        batch_size = min(MAX_EMBEDS_PER_MESSAGE, settings.get("max_embed_count", MAX_EMBEDS_PER_MESSAGE))
+        return await self.delivery.put(channel, embed, batch_size=batch_size)
+
+    async def _get_responsible(self, guild: discord.Guild, action: discord.AuditLogAction,
+                               target_id: int, event_time: datetime.datetime) -> Optional[str]:
+        """Describe who performed a moderation action, using the shared audit log reader."""
+        entry = await self.audit_logs.find(guild, action, target_id, event_time=event_time)
+        if not entry or not entry.user:
+            return None
+        responsible = f"{entry.user.mention} ({entry.user})"
+        if entry.reason:
+            responsible += f" — {entry.reason}"
+        return responsible
+
     def create_embed(self, event_type: str, description: str, **kwargs) -> discord.Embed:
         """
         Create a standardized, visually appealing embed for logging.
@@ -483,11 +541,33 @@ class YALC(commands.Cog):
             except Exception as e:
                 self.log.error(f"Error removing dashboard integration: {e}", exc_info=True)
 
+        # Flush queued logs before the cog goes away
+        await self.delivery.close()
+
         # Clean up any other resources
         await super().cog_unload()
 
+    async def _migrate_config(self) -> None:
+        """Bring stored guild data up to the current schema version."""
+        schema_version = await self.config.schema_version()
+        if schema_version < 1:
+            # Proxy bot IDs used to be stored as strings, which never matched int author IDs
+            try:
+                all_guilds = await self.config.all_guilds()
+                for guild_id, data in all_guilds.items():
+                    stored_ids = data.get("tupperbox_ids")
+                    if stored_ids and any(not isinstance(i, int) for i in stored_ids):
+                        await self.config.guild_from_id(guild_id).tupperbox_ids.set(sorted(normalize_ids(stored_ids)))
+                await self.config.schema_version.set(1)
+                self.log.info("Migrated YALC tupperbox_ids to integer IDs.")
+            except Exception as e:
+                self.log.error(f"Failed to migrate YALC tupperbox_ids: {e}", exc_info=True)
+        self._settings_cache.clear()
+        self._filter_cache.clear()
+
     async def cog_load(self) -> None:
         """Register all YALC events as modlog case types and dashboard third party."""
+        await self._migrate_config()
         # Register modlog case types
         case_types = []
         for event, (emoji, description) in self.event_descriptions.items():
@@ -533,6 +613,12 @@ class YALC(commands.Cog):
 
     # --- Event Listeners ---
 
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        """Remember message authors so later proxy checks can skip fetch_message."""
+        if message.guild:
+            self.message_authors.add_message(message)
+
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message) -> None:
         """Log message deletion events, with enhanced Tupperbot filtering."""
@@ -545,26 +631,46 @@ class YALC(commands.Cog):
             
         # Check early if we should process this message
         try:
-            # Fetch settings first to avoid redundant DB calls
-            settings = await self.config.guild(message.guild).all()
+            # Fetch settings and the compiled filter first to avoid redundant DB calls
+            settings = await self.get_guild_settings(message.guild)
+            guild_filter = await self.get_guild_filter(message.guild, settings)
             
             # 1. Check if the event type is enabled at all
-            if not settings["events"].get("message_delete", False):
+            if not guild_filter.is_enabled("message_delete"):
                 self.log.debug("message_delete event is disabled in settings.")
                 return
             
-            # 2. Enhanced Tupperbox message detection
-            tupperbox_ids = settings.get("tupperbox_ids", ["239232811662311425"])
-            ignore_tupperbox = settings.get("ignore_tupperbox", True)
+            # 2. Check webhook ignore setting
+            if guild_filter.ignore_webhooks and getattr(message, "webhook_id", None):
+                # Additional filtering for specific webhook names
+                webhook = getattr(message, "webhook", None)
+                
+                if webhook and guild_filter.webhook_name_filters:
+                    webhook_name = getattr(webhook, "name", "").lower()
+                    if any(filter_term in webhook_name for filter_term in guild_filter.webhook_name_filters):
+                        self.log.debug(f"Skipping webhook message from filtered name: {webhook_name}")
+                        return
+                else:
+                    self.log.debug("Skipping webhook message (all webhooks ignored).")
+                    return
+                
+            # 3. Check channel, user, role, proxy bot ID and app ignores without touching Config
+            if not guild_filter.matches("message_delete",
+                                        channel=message.channel,
+                                        user=message.author,
+                                        message=message):
+                self.log.debug("Guild filter rejected message_delete - channel/user/role/source is ignored.")
+                return
             
-            if ignore_tupperbox:
+            # 4. Enhanced Tupperbox message detection
+            if guild_filter.ignore_tupperbox:
                 # Check if this specific message is a Tupperbox message
-                if await self.is_tupperbox_message(message, tupperbox_ids):
+                if await self.is_tupperbox_message(message, guild_filter.tupperbox_ids):
                     self.log.debug("Skipping Tupperbox message_delete event - direct detection.")
                     return
                 
                 # Check for proxy deletion patterns
-                if settings.get("detect_proxy_deletes", True):
+                if guild_filter.detect_proxy_deletes:
                     # Time-based proxy deletion detection
                     # (Tupperbox often deletes the original command message after proxying)
                     now = datetime.datetime.now(datetime.UTC)
@@ -572,51 +678,12 @@ class YALC(commands.Cog):
                     
                     # Check if message is very new (typical for proxy command deletion)
                     if msg_age.total_seconds() < 3.0:
-                        content = getattr(message, "content", "").lower()
-                        
-                        # Common proxy message command patterns
-                        proxy_commands = [";", "!", "//", "pk;", "tb:", "$", "t!"]
-                        
-                        if any(content.startswith(cmd) for cmd in proxy_commands):
+                        if guild_filter.is_proxy_command(getattr(message, "content", "")):
                             self.log.debug("Skipping likely proxy command deletion.")
                             return
-                        
-                        # Check for message prefix patterns from settings
-                        custom_prefixes = settings.get("message_prefix_filter", [])
-                        if any(content.startswith(prefix) for prefix in custom_prefixes):
-                            self.log.debug("Skipping deletion due to custom prefix match.")
-                            return
-                
-            # 3. Check webhook ignore setting
-            if settings.get("ignore_webhooks", False) and getattr(message, "webhook_id", None):
-                # Additional filtering for specific webhook names
-                webhook_name_filters = settings.get("webhook_name_filter", [])
-                webhook = getattr(message, "webhook", None)
-                
-                if webhook and webhook_name_filters:
-                    webhook_name = getattr(webhook, "name", "").lower()
-                    if any(filter_term.lower() in webhook_name for filter_term in webhook_name_filters):
-                        self.log.debug(f"Skipping webhook message from filtered name: {webhook_name}")
-                        return
-                else:
-                    self.log.debug("Skipping webhook message (all webhooks ignored).")
-                    return
                 
-            # 4. Check app message ignore setting
-            if settings.get("ignore_apps", True) and getattr(message, "application", None):
-                self.log.debug("Skipping application message deletion.")
-                return
-                
-            # 5. Check if we should ignore based on channel, user, or roles
-            if not await self.should_log_event(message.guild, "message_delete", 
-                                              channel=message.channel, 
-                                              user=message.author,
-                                              message=message):
-                self.log.debug("should_log_event returned False - channel/user/role is ignored.")
-                return
-                
-            # 6. Get the appropriate log channel
-            channel = await self.get_log_channel(message.guild, "message_delete")
+            # 5. Get the appropriate log channel
+            channel = await self.get_log_channel(message.guild, "message_delete", settings=settings)
             if not channel:
                 self.log.warning("No log channel set for message_delete.")
                 return
@@ -840,7 +907,7 @@ class YALC(commands.Cog):
                 embed.set_thumbnail(url=author.display_avatar.url)
             
             # Send the log message to the configured channel
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
             
         except Exception as e:
             self.log.error(f"Failed to log message_delete: {e}", exc_info=True)
@@ -855,40 +922,33 @@ class YALC(commands.Cog):
             self.log.debug("No guild on message.")
             return
             
+        self.message_authors.add_message(after)
+            
         # Early processing checks
         try:
-            # Get settings once to avoid redundant database calls
-            settings = await self.config.guild(before.guild).all()
+            # Get settings and the compiled filter once to avoid redundant database calls
+            settings = await self.get_guild_settings(before.guild)
+            guild_filter = await self.get_guild_filter(before.guild, settings)
             
-            # 1. Check if the message_edit event is enabled
-            if not settings["events"].get("message_edit", False):
-                self.log.debug("message_edit event is disabled in settings.")
+            # 1. Check the event is enabled and the channel/user/role isn't ignored
+            if not guild_filter.matches("message_edit", channel=before.channel, user=before.author):
+                self.log.debug("Guild filter rejected message_edit - disabled or channel/user/role is ignored.")
                 return
                 
             # 2. Enhanced Tupperbot filtering
-            tupperbox_ids = settings.get("tupperbox_ids", ["239232811662311425"])
-            ignore_tupperbox = settings.get("ignore_tupperbox", True)
-            
-            if ignore_tupperbox:
+            if guild_filter.ignore_tupperbox:
                 # Check both the before and after states of the message
-                is_before_tupperbox = await self.is_tupperbox_message(before, tupperbox_ids)
-                is_after_tupperbox = await self.is_tupperbox_message(after, tupperbox_ids)
+                is_before_tupperbox = await self.is_tupperbox_message(before, guild_filter.tupperbox_ids)
+                is_after_tupperbox = await self.is_tupperbox_message(after, guild_filter.tupperbox_ids)
                 
                 if is_before_tupperbox or is_after_tupperbox:
                     self.log.debug(
                         f"Skipping Tupperbox message_edit event - Before:{is_before_tupperbox}, After:{is_after_tupperbox}"
                     )
                     return
-                    
-            # 3. Check ignore lists (channel, user, role)
-            if not await self.should_log_event(before.guild, "message_edit", 
-                                              channel=before.channel, 
-                                              user=before.author):
-                self.log.debug("should_log_event returned False - channel/user/role is ignored.")
-                return
                 
-            # 4. Get the appropriate log channel
-            channel = await self.get_log_channel(before.guild, "message_edit")
+            # 3. Get the appropriate log channel
+            channel = await self.get_log_channel(before.guild, "message_edit", settings=settings)
             if not channel:
                 self.log.warning("No log channel set for message_edit.")
                 return
@@ -1093,7 +1153,7 @@ class YALC(commands.Cog):
             self.set_embed_footer(embed, event_time=edit_time, label="YALC Logger • Message Edit")
             
             # Send the log embed
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
             
         except Exception as e:
             self.log.error(f"Failed to log message_edit: {e}", exc_info=True)
@@ -1111,6 +1171,7 @@ class YALC(commands.Cog):
         messages: List[discord.Message]
             The list of deleted messages
         """
+        event_time = discord.utils.utcnow()
         # Skip if no messages were provided
         if not messages:
             self.log.debug("Empty message list for bulk_message_delete.")
@@ -1127,26 +1188,16 @@ class YALC(commands.Cog):
             
         # Check if we should log this event
         try:
-            settings = await self.config.guild(guild).all()
+            settings = await self.get_guild_settings(guild)
+            guild_filter = await self.get_guild_filter(guild, settings)
             
-            # Skip if event is disabled
-            if not settings["events"].get("message_bulk_delete", False):
-                self.log.debug("message_bulk_delete event is disabled.")
+            # Skip if event is disabled or the channel/category is ignored
+            if not guild_filter.matches("message_bulk_delete", channel=channel):
+                self.log.debug("Guild filter rejected message_bulk_delete - disabled or channel/category is ignored.")
                 return
                 
-            # Check if channel is in ignore list
-            if channel.id in settings.get("ignored_channels", []):
-                self.log.debug(f"Channel {channel.id} is in the ignored channels list.")
-                return
-                
-            # Check if channel category is ignored
-            if isinstance(channel, discord.TextChannel) and channel.category:
-                if channel.category.id in settings.get("ignored_categories", []):
-                    self.log.debug(f"Category {channel.category.id} is in the ignored categories list.")
-                    return
-                
             # Get the appropriate log channel
-            log_channel = await self.get_log_channel(guild, "message_bulk_delete")
+            log_channel = await self.get_log_channel(guild, "message_bulk_delete", settings=settings)
             if not log_channel:
                 self.log.debug("No log channel configured for message_bulk_delete.")
                 return
@@ -1156,22 +1207,24 @@ class YALC(commands.Cog):
             filtered_out_count = 0
             
             # Filter out Tupperbot messages if configured
-            if settings.get("ignore_tupperbox", True):
-                tupperbox_ids = settings.get("tupperbox_ids", ["239232811662311425"])
-                
+            if guild_filter.ignore_tupperbox:
                 original_count = len(filtered_messages)
                 
+                # Replies usually point at messages in the same purge, so cache those first
+                # and skip REST lookups for anything still unknown
+                self.message_authors.add_messages(messages)
+                
                 # We need to use a loop instead of a list comprehension for async calls
                 new_filtered_messages = []
                 for msg in filtered_messages:
-                    if not await self.is_tupperbox_message(msg, tupperbox_ids):
+                    if not await self.is_tupperbox_message(msg, guild_filter.tupperbox_ids, allow_fetch=False):
                         new_filtered_messages.append(msg)
                 
                 filtered_messages = new_filtered_messages
                 filtered_out_count += original_count - len(filtered_messages)
                 
             # Filter out webhook messages if configured
-            if settings.get("ignore_webhooks", False):
+            if guild_filter.ignore_webhooks:
                 original_count = len(filtered_messages)
                 filtered_messages = [
                     msg for msg in filtered_messages 
@@ -1180,7 +1233,7 @@ class YALC(commands.Cog):
                 filtered_out_count += original_count - len(filtered_messages)
                 
             # Filter out app messages if configured
-            if settings.get("ignore_apps", True):
+            if guild_filter.ignore_apps:
                 original_count = len(filtered_messages)
                 filtered_messages = [
                     msg for msg in filtered_messages 
@@ -1237,17 +1290,9 @@ class YALC(commands.Cog):
             embed.add_field(name="Message Count", value=message_count_text, inline=True)
             
             # Add moderation data if available
-            audit_entry = None
-            try:
-                if guild.me.guild_permissions.view_audit_log:
-                    async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.message_bulk_delete):
-                        # Match the entry with our channel
-                        target_channel = getattr(entry, "target", None)
-                        if target_channel and target_channel.id == channel.id:
-                            audit_entry = entry
-                            break
-            except Exception as e:
-                self.log.debug(f"Could not fetch audit logs: {e}")
+            audit_entry = await self.audit_logs.find(
+                guild, discord.AuditLogAction.message_bulk_delete, channel.id, event_time=event_time
+            )
                 
             if audit_entry:
                 embed.add_field(
@@ -1349,7 +1394,7 @@ class YALC(commands.Cog):
             self.set_embed_footer(embed, label="YALC Logger • Bulk Message Delete")
             
             # Send the log entry
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
             
         except Exception as e:
             self.log.error(f"Error logging bulk message delete: {e}", exc_info=True)
@@ -1384,7 +1429,7 @@ class YALC(commands.Cog):
                 f"👋 {member.mention} has joined the server.\n\u200b",
                 user=f"{member} ({member.id})"
             )
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log member_join: {e}")
 
@@ -1418,13 +1463,14 @@ class YALC(commands.Cog):
                 f"👋 {member.mention} has left the server.\n\u200b",
                 user=f"{member} ({member.id})"
             )
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log member_leave: {e}")
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: discord.User) -> None:
         """Log member ban events."""
+        event_time = discord.utils.utcnow()
         self.log.debug("Listener triggered: on_member_ban")
         if not guild or not await self.should_log_event(guild, "member_ban"):
             return
@@ -1436,13 +1482,15 @@ class YALC(commands.Cog):
             "member_ban",
             f"🔨 {user.mention if hasattr(user, 'mention') else user} has been banned.\n\u200b",
             user=f"{user} ({user.id})",
-            channel_name=guild.name if guild else "Unknown"
+            channel_name=guild.name if guild else "Unknown",
+            banned_by=await self._get_responsible(guild, discord.AuditLogAction.ban, user.id, event_time)
         )
-        await self.safe_send(channel, embed=embed)
+        await self.send_log(channel, embed)
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild: discord.Guild, user: discord.User) -> None:
         """Log member unban events."""
+        event_time = discord.utils.utcnow()
         self.log.debug("Listener triggered: on_member_unban")
         if not guild or not await self.should_log_event(guild, "member_unban"):
             return
@@ -1454,9 +1502,10 @@ class YALC(commands.Cog):
             "member_unban",
             f"🔓 {user.mention if hasattr(user, 'mention') else user} has been unbanned.\n\u200b",
             user=f"{user} ({user.id})",
-            channel_name=guild.name if guild else "Unknown"
+            channel_name=guild.name if guild else "Unknown",
+            unbanned_by=await self._get_responsible(guild, discord.AuditLogAction.unban, user.id, event_time)
         )
-        await self.safe_send(channel, embed=embed)
+        await self.send_log(channel, embed)
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
@@ -1505,7 +1554,7 @@ class YALC(commands.Cog):
                 embed.set_thumbnail(url=after.display_avatar.url)
             event_time = datetime.datetime.now(datetime.UTC)
             self.set_embed_footer(embed, event_time=event_time, label="YALC Logger • Role/Nick Update")
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log member_update: {e}")
 
@@ -1541,12 +1590,13 @@ class YALC(commands.Cog):
                 type=type(channel).__name__,
                 channel_name=channel.name
             )
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log channel_create: {e}")
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        event_time = discord.utils.utcnow()
         self.log.debug("Listener triggered: on_guild_channel_delete")
         if not channel.guild:
             self.log.debug("No guild on channel.")
@@ -1575,9 +1625,10 @@ class YALC(commands.Cog):
                 name=channel.name,
                 id=channel.id,
                 type=type(channel).__name__,
-                channel_name=channel.name
+                channel_name=channel.name,
+                deleted_by=await self._get_responsible(channel.guild, discord.AuditLogAction.channel_delete, channel.id, event_time)
             )
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log channel_delete: {e}")
 
@@ -1628,7 +1679,7 @@ class YALC(commands.Cog):
                 changes="\n".join(changes),
                 channel_name=after.name
             )
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log channel_update: {e}")
 
@@ -1665,7 +1716,7 @@ class YALC(commands.Cog):
                 type=str(thread.type),
                 slowmode=f"{thread.slowmode_delay}s" if thread.slowmode_delay else "None"
             )
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log thread_create: {e}")
 
@@ -1701,7 +1752,7 @@ class YALC(commands.Cog):
                 locked=thread.locked,
                 type=str(thread.type)
             )
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log thread_delete: {e}")
 
@@ -1748,7 +1799,7 @@ class YALC(commands.Cog):
                 thread=after.mention,
                 changes="\n".join(changes)
             )
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log thread_update: {e}")
 
@@ -1782,7 +1833,7 @@ class YALC(commands.Cog):
                 member=f"{member_display} ({member.id})",
                 thread=member.thread.name
             )
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log thread_member_join: {e}")
 
@@ -1815,7 +1866,7 @@ class YALC(commands.Cog):
                 member=f"{member_display} ({member.id})",
                 thread=member.thread.name
             )
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log thread_member_leave: {e}")
 
@@ -1849,12 +1900,13 @@ class YALC(commands.Cog):
                 name=role.name,
                 id=role.id
             )
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log role_create: {e}")
 
     @commands.Cog.listener()
     async def on_role_delete(self, role: discord.Role) -> None:
+        event_time = discord.utils.utcnow()
         self.log.debug("Listener triggered: on_role_delete")
         if not role.guild:
             self.log.debug("No guild on role.")
@@ -1881,9 +1933,10 @@ class YALC(commands.Cog):
                 "role_delete",
                 f"🗑️ Role deleted: {role.name}\n\u200b",
                 name=role.name,
-                id=role.id
+                id=role.id,
+                deleted_by=await self._get_responsible(role.guild, discord.AuditLogAction.role_delete, role.id, event_time)
             )
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log role_delete: {e}")
 
@@ -1925,7 +1978,7 @@ class YALC(commands.Cog):
                 f"🔄 Role updated: {after.mention}\n\u200b",
                 changes="\n".join(changes)
             )
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log role_update: {e}")
 
@@ -1976,7 +2029,7 @@ class YALC(commands.Cog):
                 f"⚙️ Server updated",
                 changes="\n".join(changes)
             )
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log guild_update: {e}")
 
@@ -2017,7 +2070,7 @@ class YALC(commands.Cog):
                 f"😀 Emoji updated",
                 changes="\n".join(changes)
             )
-            await self.safe_send(channel, embed=embed)
+            await self.send_log(channel, embed)
         except Exception as e:
             self.log.error(f"Failed to log emoji_update: {e}")
 
@@ -2039,7 +2092,7 @@ class YALC(commands.Cog):
             
         try:
             # Get settings
-            settings = await self.config.guild(ctx.guild).all()
+            settings = await self.get_guild_settings(ctx.guild)
             
             # Skip if event is disabled
             if not settings["events"].get("command_error", False):
@@ -2047,11 +2100,12 @@ class YALC(commands.Cog):
                 
             # Skip if in ignored channel or category
             if not await self.should_log_event(ctx.guild, "command_error", 
-                                             channel=ctx.channel, user=ctx.author):
+                                             channel=ctx.channel, user=ctx.author,
+                                             settings=settings):
                 return
                 
             # Get the log channel
-            log_channel = await self.get_log_channel(ctx.guild, "command_error")
+            log_channel = await self.get_log_channel(ctx.guild, "command_error", settings=settings)
             if not log_channel:
                 return
                 
@@ -2122,7 +2176,7 @@ class YALC(commands.Cog):
             self.set_embed_footer(embed, label="YALC Logger • Command Error")
             
             # Send the log
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
             
         except Exception as e:
             self.log.error(f"Error logging command_error: {e}", exc_info=True)
@@ -2146,18 +2200,18 @@ class YALC(commands.Cog):
             
         try:
             # Get settings
-            settings = await self.config.guild(guild).all()
+            settings = await self.get_guild_settings(guild)
             
             # Skip if event is disabled
             if not settings["events"].get("guild_scheduled_event_create", False):
                 return
                 
             # Skip if we should ignore based on channel, user, or roles
-            if not await self.should_log_event(guild, "guild_scheduled_event_create"):
+            if not await self.should_log_event(guild, "guild_scheduled_event_create", settings=settings):
                 return
                 
             # Get the log channel
-            log_channel = await self.get_log_channel(guild, "guild_scheduled_event_create")
+            log_channel = await self.get_log_channel(guild, "guild_scheduled_event_create", settings=settings)
             if not log_channel:
                 return
                 
@@ -2237,7 +2291,7 @@ class YALC(commands.Cog):
             self.set_embed_footer(embed, label="YALC Logger • Event Created")
             
             # Send the log
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
             
         except Exception as e:
             self.log.error(f"Error logging guild_scheduled_event_create: {e}", exc_info=True)
@@ -2263,18 +2317,18 @@ class YALC(commands.Cog):
             
         try:
             # Get settings
-            settings = await self.config.guild(guild).all()
+            settings = await self.get_guild_settings(guild)
             
             # Skip if event is disabled
             if not settings["events"].get("guild_scheduled_event_update", False):
                 return
                 
             # Skip if we should ignore based on channel, user, or roles
-            if not await self.should_log_event(guild, "guild_scheduled_event_update"):
+            if not await self.should_log_event(guild, "guild_scheduled_event_update", settings=settings):
                 return
                 
             # Get the log channel
-            log_channel = await self.get_log_channel(guild, "guild_scheduled_event_update")
+            log_channel = await self.get_log_channel(guild, "guild_scheduled_event_update", settings=settings)
             if not log_channel:
                 return
                 
@@ -2350,7 +2404,7 @@ class YALC(commands.Cog):
             self.set_embed_footer(embed, label="YALC Logger • Event Updated")
             
             # Send the log
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
             
         except Exception as e:
             self.log.error(f"Error logging guild_scheduled_event_update: {e}", exc_info=True)
@@ -2374,18 +2428,18 @@ class YALC(commands.Cog):
             
         try:
             # Get settings
-            settings = await self.config.guild(guild).all()
+            settings = await self.get_guild_settings(guild)
             
             # Skip if event is disabled
             if not settings["events"].get("guild_scheduled_event_delete", False):
                 return
                 
             # Skip if we should ignore based on channel, user, or roles
-            if not await self.should_log_event(guild, "guild_scheduled_event_delete"):
+            if not await self.should_log_event(guild, "guild_scheduled_event_delete", settings=settings):
                 return
                 
             # Get the log channel
-            log_channel = await self.get_log_channel(guild, "guild_scheduled_event_delete")
+            log_channel = await self.get_log_channel(guild, "guild_scheduled_event_delete", settings=settings)
             if not log_channel:
                 return
                 
@@ -2451,7 +2505,7 @@ class YALC(commands.Cog):
             self.set_embed_footer(embed, label="YALC Logger • Event Deleted")
             
             # Send the log
-            await self.safe_send(log_channel, embed=embed)
+            await self.send_log(log_channel, embed)
             
         except Exception as e:
             self.log.error(f"Error logging guild_scheduled_event_delete: {e}", exc_info=True)
@@ -2518,6 +2572,7 @@ class YALC(commands.Cog):
         # Enable the event
         async with self.config.guild(ctx.guild).events() as events:
             events[event_type] = True
+        self.invalidate_guild_settings(ctx.guild)
             
         # Get description for confirmation message
         emoji, description = self.event_descriptions[event_type]
@@ -2542,6 +2597,7 @@ class YALC(commands.Cog):
         # Disable the event
         async with self.config.guild(ctx.guild).events() as events:
             events[event_type] = False
+        self.invalidate_guild_settings(ctx.guild)
             
         # Get description for confirmation message
         emoji, description = self.event_descriptions[event_type]
@@ -2575,11 +2631,13 @@ class YALC(commands.Cog):
             async with self.config.guild(ctx.guild).event_channels() as event_channels:
                 for et in self.event_descriptions.keys():
                     event_channels[et] = channel.id
+            self.invalidate_guild_settings(ctx.guild)
             await ctx.send(f"✅ Set {channel.mention} as the logging channel for **all** event types.")
         else:
             # Set for a specific event type
             async with self.config.guild(ctx.guild).event_channels() as event_channels:
                 event_channels[event_type] = channel.id
+            self.invalidate_guild_settings(ctx.guild)
                 
             # Get description for confirmation message
             emoji, description = self.event_descriptions[event_type]
@@ -2589,7 +2647,7 @@ class YALC(commands.Cog):
     @commands.guild_only()
     async def yalc_settings(self, ctx: commands.Context):
         """View the current YALC settings for this server."""
-        settings = await self.config.guild(ctx.guild).all()
+        settings = await self.get_guild_settings(ctx.guild)
         
         embed = discord.Embed(
             title="YALC Logger Settings",
@@ -2676,6 +2734,36 @@ class YALC(commands.Cog):
         embed.set_footer(text=f"YALC • Server ID: {ctx.guild.id}")
         await ctx.send(embed=embed)
 
+    @yalc_group.command(name="queue")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def yalc_queue(self, ctx: commands.Context):
+        """View log delivery queue depth and flush latency for this server's log channels."""
+        settings = await self.get_guild_settings(ctx.guild)
+        channel_ids = sorted({cid for cid in settings["event_channels"].values() if cid})
+        stats = self.delivery.stats(channel_ids)
+        
+        embed = discord.Embed(
+            title="YALC Log Queue",
+            description="Delivery metrics for this server's log channels",
+            color=discord.Color.blue()
+        )
+        
+        if not stats:
+            embed.add_field(name="📭 Queues", value="No logs have been queued yet", inline=False)
+        for channel_id, data in stats.items():
+            embed.add_field(
+                name=f"#{getattr(ctx.guild.get_channel(channel_id), 'name', channel_id)}",
+                value=(
+                    f"Queued: **{data['depth']}** • Dropped: **{data['dropped']}**\n"
+                    f"Sent: **{data['embeds_sent']}** embeds in **{data['messages_sent']}** messages\n"
+                    f"Flush latency: **{data['last_latency']:.2f}s** last, **{data['avg_latency']:.2f}s** avg"
+                ),
+                inline=False
+            )
+        
+        embed.set_footer(text=f"YALC • Server ID: {ctx.guild.id}")
+        await ctx.send(embed=embed)
+
     @yalc_group.group(name="ignore", invoke_without_command=True)
     @commands.admin_or_permissions(manage_guild=True)
     async def yalc_ignore(self, ctx: commands.Context):
@@ -2702,6 +2790,7 @@ class YALC(commands.Cog):
                 return
                 
             ignored_users.append(user.id)
+        self.invalidate_guild_settings(ctx.guild)
             
         await ctx.send(f"✅ Now ignoring events from user {user.mention}.")
 
@@ -2721,6 +2810,7 @@ class YALC(commands.Cog):
                 return
                 
             ignored_channels.append(channel.id)
+        self.invalidate_guild_settings(ctx.guild)
             
         await ctx.send(f"✅ Now ignoring events from channel {channel.mention}.")
 
@@ -2740,6 +2830,7 @@ class YALC(commands.Cog):
                 return
                 
             ignored_roles.append(role.id)
+        self.invalidate_guild_settings(ctx.guild)
             
         await ctx.send(f"✅ Now ignoring events from users with the role {role.mention}.")
 
@@ -2759,6 +2850,7 @@ class YALC(commands.Cog):
                 return
                 
             ignored_categories.append(category.id)
+        self.invalidate_guild_settings(ctx.guild)
             
         await ctx.send(f"✅ Now ignoring events from all channels in the '{category.name}' category.")
 
@@ -2788,6 +2880,7 @@ class YALC(commands.Cog):
                 return
                 
             ignored_users.remove(user.id)
+        self.invalidate_guild_settings(ctx.guild)
             
         await ctx.send(f"✅ No longer ignoring events from user {user.mention}.")
 
@@ -2807,6 +2900,7 @@ class YALC(commands.Cog):
                 return
                 
             ignored_channels.remove(channel.id)
+        self.invalidate_guild_settings(ctx.guild)
             
         await ctx.send(f"✅ No longer ignoring events from channel {channel.mention}.")
 
@@ -2826,6 +2920,7 @@ class YALC(commands.Cog):
                 return
                 
             ignored_roles.remove(role.id)
+        self.invalidate_guild_settings(ctx.guild)
             
         await ctx.send(f"✅ No longer ignoring events from users with the role {role.mention}.")
 
@@ -2845,10 +2940,12 @@ class YALC(commands.Cog):
                 return
                 
             ignored_categories.remove(category.id)
+        self.invalidate_guild_settings(ctx.guild)
             
         await ctx.send(f"✅ No longer ignoring events from channels in the '{category.name}' category.")
     
-    async def is_tupperbox_message(self, message: discord.Message, tupperbox_ids: list) -> bool:
+    async def is_tupperbox_message(self, message: discord.Message, tupperbox_ids: FrozenSet[int],
+                                   allow_fetch: bool = True) -> bool:
         """Check if a message is from Tupperbox or a configured proxy bot.
         
         This method checks if a message is from the Tupperbox bot or any other bot
@@ -2858,8 +2955,10 @@ class YALC(commands.Cog):
         ----------
         message: discord.Message
             The message to check
-        tupperbox_ids: list
-            List of Tupperbox bot IDs configured for the guild
+        tupperbox_ids: FrozenSet[int]
+            Tupperbox bot IDs configured for the guild, as ints
+        allow_fetch: bool
+            Whether a reply whose target isn't cached may be fetched over REST
             
         Returns
         -------
@@ -2878,46 +2977,75 @@ class YALC(commands.Cog):
             
             # Check if the message is a reply to a Tupperbox message
             if message.reference and message.reference.message_id:
-                try:
-                    referenced_message = await message.channel.fetch_message(message.reference.message_id)
-                    if referenced_message and referenced_message.author.id in tupperbox_ids:
-                        return True
-                except discord.NotFound:
-                    pass  # Referenced message not found, ignore
-                except Exception as e:
-                    self.log.debug(f"Error checking referenced message: {e}")
+                author_id = await self.get_referenced_author_id(message, allow_fetch=allow_fetch)
+                if author_id is not None and author_id in tupperbox_ids:
+                    return True
                 
         return False
+
+    async def get_referenced_author_id(self, message: discord.Message, allow_fetch: bool = True) -> Optional[int]:
+        """Find the author of the message a reply points to.
+        
+        Uses the reference resolved by the gateway, then the message author cache,
+        and only falls back to fetching the message if allowed.
         
-    async def safe_send(self, channel: discord.TextChannel, **kwargs) -> Optional[discord.Message]:
+        Parameters
+        ----------
+        message: discord.Message
+            The replying message
+        allow_fetch: bool
+            Whether to fetch the referenced message over REST when it isn't cached
+            
+        Returns
+        -------
+        Optional[int]
+            The referenced message's author ID, or None if it couldn't be determined
         """
-        Send a message to a channel safely, handling common exceptions.
+        reference = message.reference
+        resolved = getattr(reference, "resolved", None)
+        if isinstance(resolved, discord.Message):
+            self.message_authors.add(resolved.id, resolved.author.id)
+            return resolved.author.id
+        
+        author_id = self.message_authors.get(reference.message_id)
+        if author_id is not None or not allow_fetch:
+            return author_id
         
-        This method attempts to send a message to a channel and handles common exceptions
-        such as missing permissions, invalid channel state, etc.
+        try:
+            referenced_message = await message.channel.fetch_message(reference.message_id)
+            self.message_authors.add_message(referenced_message)
+            return referenced_message.author.id
+        except discord.NotFound:
+            pass  # Referenced message not found, ignore
+        except Exception as e:
+            self.log.debug(f"Error checking referenced message: {e}")
+        return None
         
+    async def send_log_batch(self, channel: discord.TextChannel, **kwargs) -> Optional[discord.Message]:
+        """
+        Send a batch of queued log embeds for the delivery queue.
+
+        HTTP errors other than missing permissions are raised so the queue
+        can retry transient failures and split rejected batches.
+
         Parameters
         ----------
         channel : discord.TextChannel
-            The channel to send the message to
+            The log channel to send to
         **kwargs
             Additional arguments to pass to channel.send()
-            
+
         Returns
         -------
         Optional[discord.Message]
-            The sent message if successful, None otherwise
+            The sent message, or None if the channel is missing or unwritable
         """
         if not channel:
             self.log.warning("Attempted to send a message to a nonexistent channel")
             return None
-            
+
         try:
             return await channel.send(**kwargs)
         except discord.Forbidden:
             self.log.warning(f"Missing permissions to send message to channel {channel.id} in guild {channel.guild.id}")
-        except discord.HTTPException as e:
-            self.log.error(f"Failed to send message to channel {channel.id}: {e}")
-        except Exception as e:
-            self.log.error(f"Unexpected error when sending to channel {channel.id}: {e}", exc_info=True)
-        return None
\ No newline at end of file
+        return None